@@ -9,6 +9,9 @@ from django.conf import settings
 import whisperx
 import torch
 
+from voice_app import model_registry
+from voice_app.alignment_service import decode_audio
+
 logger = logging.getLogger(__name__)
 
 class WhisperXService:
@@ -22,9 +25,7 @@ class WhisperXService:
         self.device = self._get_best_device()
         self.compute_type = self.config.get('COMPUTE_TYPE', 'int8')
         
-        # 모델 인스턴스들
-        self._asr_model = None
-        self._alignment_models = {}
+        # 모델 인스턴스는 voice_app.model_registry가 보관 (whisper_utils와 같은 가중치 공유)
         
         logger.info(f"WhisperX Service initialized with device: {self.device}")
     
@@ -47,45 +48,23 @@ class WhisperXService:
         else:
             return config_device
     
-    def _get_asr_model(self):
-        """ASR 모델 로드 (싱글톤 패턴)"""
-        if self._asr_model is None:
-            try:
-                self._asr_model = whisperx.load_model(
-                    self.model_size, 
-                    device=self.device,
-                    compute_type=self.compute_type
-                )
-                logger.info(f"ASR model loaded: {self.model_size}")
-            except Exception as e:
-                logger.error(f"Failed to load ASR model: {e}")
-                # CPU fallback
-                if self.device == 'cuda':
-                    logger.info("Falling back to CPU")
-                    self.device = 'cpu'
-                    self._asr_model = whisperx.load_model(
-                        self.model_size, 
-                        device='cpu',
-                        compute_type='int8'
-                    )
-                else:
-                    raise e
-        return self._asr_model
-    
-    def _get_alignment_model(self, language_code: str):
-        """언어별 정렬 모델 로드 (캐싱)"""
-        if language_code not in self._alignment_models:
-            try:
-                alignment_model, metadata = whisperx.load_align_model(
-                    language_code=language_code, 
-                    device=self.device
-                )
-                self._alignment_models[language_code] = (alignment_model, metadata)
-                logger.info(f"Alignment model loaded for language: {language_code}")
-            except Exception as e:
-                logger.error(f"Failed to load alignment model for {language_code}: {e}")
+    def _use_asr_model(self):
+        """ASR 모델 (모델 관리자에서 빌림 - with 블록 동안 내보내지 않음)"""
+        try:
+            model_registry.load_model('whisperx-asr', self.model_size, self.device, self.compute_type)
+        except Exception as e:
+            logger.error(f"Failed to load ASR model: {e}")
+            # CPU fallback
+            if self.device != 'cuda':
                 raise e
-        return self._alignment_models[language_code]
+            logger.info("Falling back to CPU")
+            self.device = 'cpu'
+            self.compute_type = 'int8'
+        return model_registry.use_model('whisperx-asr', self.model_size, self.device, self.compute_type)
+    
+    def _use_alignment_model(self, language_code: str):
+        """언어별 정렬 모델 (모델 관리자에서 빌림) → (model, metadata)"""
+        return model_registry.use_model('whisperx-align', language_code, self.device)
     
     def transcribe_audio(self, audio_path: str, **kwargs) -> Dict[str, Any]:
         """
@@ -103,9 +82,6 @@ class WhisperXService:
             Dict with transcription results
         """
         try:
-            # ASR 모델로 음성인식 수행
-            model = self._get_asr_model()
-            
             # 설정값들
             batch_size = kwargs.get('batch_size', self.config.get('BATCH_SIZE', 16))
             temperature = kwargs.get('temperature', self.config.get('TEMPERATURE', 0.0))
@@ -121,8 +97,11 @@ class WhisperXService:
                 asr_options['initial_prompt'] = initial_prompt
             if language:
                 asr_options['language'] = language
-                
-            result = model.transcribe(audio_path, **asr_options)
+            
+            # 파일은 한 번만 디코딩하고 ASR/정렬에 같은 버퍼 사용
+            audio = decode_audio(audio_path)
+            with self._use_asr_model() as model:
+                result = model.transcribe(audio, **asr_options)
             
             # 언어 감지 결과
             detected_language = result.get("language", "en")
@@ -131,15 +110,15 @@ class WhisperXService:
             # 정렬 수행 (단어 단위 타이밍)
             if self.config.get('WORD_TIMESTAMPS', True):
                 try:
-                    alignment_model, metadata = self._get_alignment_model(detected_language)
-                    result = whisperx.align(
-                        result["segments"], 
-                        alignment_model, 
-                        metadata, 
-                        audio_path, 
-                        device=self.device,
-                        return_char_alignments=False
-                    )
+                    with self._use_alignment_model(detected_language) as (alignment_model, metadata):
+                        result = whisperx.align(
+                            result["segments"], 
+                            alignment_model, 
+                            metadata, 
+                            audio, 
+                            device=self.device,
+                            return_char_alignments=False
+                        )
                     logger.info("Word-level alignment completed")
                 except Exception as e:
                     logger.warning(f"Alignment failed, using ASR-only results: {e}")
@@ -180,19 +159,9 @@ class WhisperXService:
         ]
     
     def cleanup_models(self):
-        """메모리 정리"""
-        if self._asr_model is not None:
-            del self._asr_model
-            self._asr_model = None
-        
-        for lang, (model, metadata) in self._alignment_models.items():
-            del model
-            del metadata
-        self._alignment_models.clear()
-        
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        
+        """메모리 정리 (사용 중이 아닌 WhisperX 모델만 내보냄)"""
+        model_registry.unload('whisperx-asr')
+        model_registry.unload('whisperx-align')
         logger.info("WhisperX models cleaned up")
 
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import AudioRecord
+from .models import AudioRecord, ParticipantProfile, SpeakerSummary, TranscriptionCache, TranscriptionJob, UploadSession, WordAlignment
 
 # Register your models here.
 @admin.register(AudioRecord)
@@ -8,3 +8,49 @@ class AudioRecordAdmin(admin.ModelAdmin):
     list_filter = ('category', 'status', 'gender', 'created_at')
     search_fields = ('identifier', 'audio_file', 'transcript', 'manual_transcript', 'category')
     readonly_fields = ('created_at',)
+
+
+@admin.register(TranscriptionJob)
+class TranscriptionJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'audio', 'kind', 'status', 'stage', 'progress', 'attempts', 'worker', 'lease_expires_at', 'created_at', 'finished_at')
+    list_filter = ('kind', 'status', 'stage')
+    readonly_fields = ('created_at', 'started_at', 'finished_at', 'lease_expires_at')
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = ('upload_id', 'filename', 'category', 'status', 'received_size', 'total_size', 'audio', 'created_at')
+    list_filter = ('status', 'category')
+    search_fields = ('upload_id', 'filename')
+    readonly_fields = ('upload_id', 'created_at', 'updated_at', 'completed_at')
+
+
+@admin.register(TranscriptionCache)
+class TranscriptionCacheAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'audio_sha256', 'model_name', 'language', 'size_bytes', 'hit_count', 'last_used_at')
+    list_filter = ('kind', 'model_name', 'language')
+    search_fields = ('audio_sha256', 'key')
+    readonly_fields = ('key', 'created_at', 'last_used_at')
+
+
+@admin.register(SpeakerSummary)
+class SpeakerSummaryAdmin(admin.ModelAdmin):
+    list_display = ('identifier', 'category', 'gender', 'region', 'recordings_count', 'last_recorded_at', 'updated_at')
+    list_filter = ('category', 'gender')
+    search_fields = ('identifier',)
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(ParticipantProfile)
+class ParticipantProfileAdmin(admin.ModelAdmin):
+    list_display = ('identifier', 'category', 'etag', 'updated_at')
+    list_filter = ('category',)
+    search_fields = ('identifier',)
+    readonly_fields = ('etag', 'updated_at')
+
+
+@admin.register(WordAlignment)
+class WordAlignmentAdmin(admin.ModelAdmin):
+    list_display = ('audio', 'word_count', 'updated_at')
+    readonly_fields = ('updated_at',)
+    exclude = ('packed',)
@@ -0,0 +1,103 @@
+# voice_app/alignment_service.py
+"""
+WhisperX 전사 + forced alignment 서비스
+
+- 파일은 decode_audio()로 한 번만 디코딩해 16kHz 모노 float32 버퍼로 만들고
+  ASR(model.transcribe)과 정렬(whisperx.align)에 같은 버퍼를 넘긴다
+  (경로를 넘기면 단계마다 ffmpeg로 파일을 다시 디코딩함)
+- 이미 Whisper 입력 형식(16kHz 모노 PCM)인 WAV는 ffmpeg 없이 memmap으로 읽음
+- 결과 형식: {'transcription', 'segments', 'word_segments'} (alignment_data / 캐시 저장 형식)
+
+사용처: whisper_utils.transcribe_and_align_whisperx, utils/django_whisperx_service.WhisperXService
+"""
+
+import time
+
+SAMPLE_RATE = 16000
+
+
+def decode_audio(audio_path):
+    """오디오 파일 → 16kHz 모노 float32 버퍼 (파일당 한 번만 호출)"""
+    import numpy as np
+    from .audio_analysis import is_whisper_ready, load_pcm16, read_wav_header
+
+    header = read_wav_header(audio_path)
+    if is_whisper_ready(header):
+        samples = load_pcm16(audio_path, header)
+        if samples is not None:
+            return np.asarray(samples, dtype=np.float32) / 32768.0
+
+    import whisperx
+    return whisperx.load_audio(audio_path)
+
+
+def format_alignment(segments_result, transcription):
+    """whisperx.align 결과 → {'transcription', 'segments', 'word_segments'}"""
+    segments = []
+    word_segments = []
+
+    for segment in segments_result.get('segments', []):
+        segments.append({
+            'start': segment.get('start', 0),
+            'end': segment.get('end', 0),
+            'text': segment.get('text', ''),
+            'id': segment.get('id', 0)
+        })
+
+        # 단어 레벨 alignment
+        for word in segment.get('words', []):
+            word_segments.append({
+                'start': word.get('start', 0),
+                'end': word.get('end', 0),
+                'word': word.get('word', ''),
+                'score': word.get('score', 0.0),
+                'segment_id': segment.get('id', 0)
+            })
+
+    return {
+        'transcription': transcription.strip(),
+        'segments': segments,
+        'word_segments': word_segments,
+    }
+
+
+def transcribe_and_align(audio, asr_model, align_model, align_metadata, device,
+                         language='ko', batch_size=4, asr_options=None, progress=None):
+    """
+    디코딩된 버퍼 하나로 ASR → forced alignment 수행
+
+    Args:
+        audio: decode_audio() 결과 (float32 배열) - 모든 단계에서 같은 버퍼 사용
+        asr_options (dict): model.transcribe 추가 옵션 (temperature 등)
+        progress (callable): progress(stage, percent) 진행률 콜백 (선택)
+
+    Returns:
+        dict: {'transcription', 'segments', 'word_segments', 'language'}
+    """
+    import whisperx
+
+    if progress:
+        progress('asr', 15)
+    asr_start = time.time()
+    options = dict(asr_options or {})
+    if language:
+        options['language'] = language
+    result = asr_model.transcribe(audio, batch_size=batch_size, **options)
+    asr_seconds = time.time() - asr_start
+
+    segments = result.get('segments', [])
+    transcription = " ".join(seg['text'] for seg in segments)
+
+    if progress:
+        progress('align', 60)
+    align_start = time.time()
+    aligned = whisperx.align(segments, align_model, align_metadata, audio, device, return_char_alignments=False)
+
+    print(
+        f"[Alignment] {len(audio) / SAMPLE_RATE:.1f}s audio - "
+        f"asr {asr_seconds:.2f}s, align {time.time() - align_start:.2f}s (decoded once)"
+    )
+    return {
+        **format_alignment(aligned, transcription),
+        'language': result.get('language', language),
+    }
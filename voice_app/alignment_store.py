@@ -0,0 +1,234 @@
+# voice_app/alignment_store.py
+"""
+단어 단위 alignment 압축 저장 (WordAlignment.packed)
+
+alignment_data['word_segments']의 단어별 dict 대신 열(column) 단위 배열로 저장:
+
+    header  : '<4sBxxxII' = magic b'ALN1', flags, 단어 수(n), 문자열 수(m)
+    start   : float32[n]
+    end     : float32[n]
+    score   : float32[n]
+    segment : int32[n]
+    word    : int32[n]   - 문자열 테이블 인덱스 (같은 단어는 한 번만 저장)
+    lengths : int32[m]   - 문자열 UTF-8 바이트 길이
+    strings : UTF-8 바이트 (이어 붙임)
+
+- PackedWords는 bytes를 복사하지 않고 memoryview로 읽으며, 요청한 시간 범위의 단어만 꺼냄
+  (start가 정렬돼 있으면 bisect로 범위 탐색)
+- alignment_data(JSON)에는 segments / transcription / word_count만 남김
+- 아직 변환되지 않은 레코드는 LegacyWords가 같은 인터페이스로 JSON word_segments를 읽음
+
+사용처: tasks.align_audio_task(save_alignment), views.get_alignment_data / alignment_data_api,
+whisper_utils.format_alignment_for_frontend
+"""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+MAGIC = b'ALN1'
+HEADER = struct.Struct('<4sBxxxII')
+FLAG_SORTED = 1
+WORD_FIELDS = ('start', 'end', 'word', 'score', 'segment_id')
+
+
+def _little_endian(values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def pack_words(word_segments):
+    """word_segments(list of dict) → bytes"""
+    starts, ends, scores = array('f'), array('f'), array('f')
+    segment_ids, word_ids, lengths = array('i'), array('i'), array('i')
+    strings = {}
+    blob = bytearray()
+
+    for word in word_segments or []:
+        starts.append(float(word.get('start') or 0))
+        ends.append(float(word.get('end') or 0))
+        scores.append(float(word.get('score') or 0))
+        segment_ids.append(int(word.get('segment_id') or 0))
+
+        text = str(word.get('word') or '')
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+            encoded = text.encode('utf-8')
+            lengths.append(len(encoded))
+            blob += encoded
+        word_ids.append(index)
+
+    flags = FLAG_SORTED if all(a <= b for a, b in zip(starts, starts[1:])) else 0
+    parts = [HEADER.pack(MAGIC, flags, len(starts), len(strings))]
+    for column in (starts, ends, scores, segment_ids, word_ids, lengths):
+        parts.append(_little_endian(column).tobytes())
+    parts.append(bytes(blob))
+    return b''.join(parts)
+
+
+class PackedWords:
+    """pack_words() 결과를 필요한 부분만 읽는 접근자"""
+
+    def __init__(self, data):
+        view = memoryview(bytes(data) if not isinstance(data, (bytes, bytearray)) else data)
+        magic, self.flags, n, m = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError('Unknown alignment format')
+
+        offset = HEADER.size
+        columns = []
+        for count in (n, n, n, n, n, m):
+            columns.append(self._column(view, offset, count, 'f' if len(columns) < 3 else 'i'))
+            offset += count * 4
+        self.starts, self.ends, self.scores, self.segment_ids, self.word_ids, lengths = columns
+
+        self._blob = view[offset:]
+        self._lengths = lengths
+        self._string_offsets = None
+        self._strings = {}
+
+    @staticmethod
+    def _column(view, offset, count, typecode):
+        chunk = view[offset:offset + count * 4]
+        if sys.byteorder == 'little':
+            return chunk.cast(typecode)
+        values = array(typecode, chunk.tobytes())
+        values.byteswap()
+        return values
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def duration(self):
+        return max(self.ends) if len(self) else 0.0
+
+    def _string(self, index):
+        text = self._strings.get(index)
+        if text is None:
+            if self._string_offsets is None:
+                offsets = [0]
+                for length in self._lengths:
+                    offsets.append(offsets[-1] + length)
+                self._string_offsets = offsets
+            begin, finish = self._string_offsets[index], self._string_offsets[index + 1]
+            text = self._strings[index] = bytes(self._blob[begin:finish]).decode('utf-8')
+        return text
+
+    def indices(self, start=None, end=None):
+        """[start, end) 구간과 겹치는 단어 인덱스"""
+        if start is None and end is None:
+            return range(len(self))
+        start = float('-inf') if start is None else start
+        end = float('inf') if end is None else end
+
+        if self.flags & FLAG_SORTED:
+            # start가 정렬돼 있으므로 end 이전에 시작한 단어까지만 확인
+            last = bisect_left(self.starts, end)
+            first = 0
+            if start != float('-inf'):
+                # 단어 길이는 수 초를 넘지 않으므로 start 직전부터 확인
+                first = max(0, bisect_right(self.starts, start) - 1)
+                while first > 0 and self.ends[first - 1] > start:
+                    first -= 1
+            return [i for i in range(first, last) if self.ends[i] > start]
+        return [i for i in range(len(self)) if self.starts[i] < end and self.ends[i] > start]
+
+    def words(self, start=None, end=None):
+        """기존 word_segments 형식 (list of dict)"""
+        return [{
+            'start': round(self.starts[i], 3),
+            'end': round(self.ends[i], 3),
+            'word': self._string(self.word_ids[i]),
+            'score': round(self.scores[i], 3),
+            'segment_id': self.segment_ids[i],
+        } for i in self.indices(start, end)]
+
+    def columns(self, start=None, end=None, fields=WORD_FIELDS):
+        """열 단위 응답 (단어마다 키를 반복하지 않음 - 긴 녹음 전송량 감소)"""
+        selected = self.indices(start, end)
+        readers = {
+            'start': lambda i: round(self.starts[i], 2),
+            'end': lambda i: round(self.ends[i], 2),
+            'word': lambda i: self._string(self.word_ids[i]),
+            'score': lambda i: round(self.scores[i], 2),
+            'segment_id': lambda i: self.segment_ids[i],
+        }
+        return {field: [readers[field](i) for i in selected] for field in fields}
+
+
+class LegacyWords:
+    """alignment_data['word_segments'](JSON)를 PackedWords와 같은 방식으로 읽음 (변환 전 레코드)"""
+
+    def __init__(self, word_segments):
+        self._words = word_segments or []
+
+    def __len__(self):
+        return len(self._words)
+
+    @property
+    def duration(self):
+        return max((word.get('end', 0) for word in self._words), default=0.0)
+
+    def _selected(self, start=None, end=None):
+        start = float('-inf') if start is None else start
+        end = float('inf') if end is None else end
+        return [w for w in self._words if w.get('start', 0) < end and w.get('end', 0) > start]
+
+    def words(self, start=None, end=None):
+        return [{field: word.get(field, 0) for field in WORD_FIELDS} for word in self._selected(start, end)]
+
+    def columns(self, start=None, end=None, fields=WORD_FIELDS):
+        selected = self._selected(start, end)
+        return {field: [word.get(field, 0) for word in selected] for field in fields}
+
+
+def word_accessor(audio):
+    """AudioRecord의 단어 alignment 접근자 (없으면 None)"""
+    from .models import WordAlignment
+
+    packed = WordAlignment.objects.filter(audio_id=audio.id).values_list('packed', flat=True).first()
+    if packed is not None:
+        return PackedWords(packed)
+    data = audio.alignment_data or {}
+    if data.get('word_segments'):
+        return LegacyWords(data['word_segments'])
+    return None
+
+
+def split_alignment(result):
+    """WhisperX 결과 → (alignment_data JSON, packed bytes)"""
+    words = result.get('word_segments') or []
+    alignment_data = {
+        'segments': result.get('segments', []),
+        'transcription': result.get('transcription', ''),
+        'word_count': len(words),
+        'success': True,
+    }
+    return alignment_data, pack_words(words)
+
+
+def save_alignment(audio, result):
+    """
+    alignment 결과 저장: segments/전사는 audio.alignment_data(JSON), 단어는 WordAlignment(packed)
+    audio 저장은 호출한 쪽에서.
+    """
+    from .models import WordAlignment
+
+    audio.alignment_data, packed = split_alignment(result)
+    WordAlignment.objects.update_or_create(
+        audio_id=audio.id,
+        defaults={'packed': packed, 'word_count': audio.alignment_data['word_count']},
+    )
+
+
+def full_alignment_data(audio):
+    """기존 형식 alignment_data (word_segments 포함) - 하위 호환 API용"""
+    data = dict(audio.alignment_data or {})
+    if data.get('success') and 'word_segments' not in data:
+        accessor = word_accessor(audio)
+        data['word_segments'] = accessor.words() if accessor else []
+    return data
@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class VoiceAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "voice_app"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from .db_setup import apply_sqlite_pragmas
+
+        # SpeakerSummary 갱신 시그널 등록
+        from . import signals  # noqa: F401
+
+        # SQLite WAL / busy_timeout 등 연결 설정
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid='voice_app.sqlite_pragmas')
@@ -0,0 +1,345 @@
+# voice_app/audio_analysis.py
+"""
+WAV 헤더 파싱 및 PCM 분석 (ffmpeg/ffprobe 프로세스 없이 Python/NumPy로 처리)
+
+- RIFF 헤더만 읽어 이미 Whisper 입력 형식(16kHz, 모노, 16bit PCM)인지 확인
+  → 변환 없이 rename/hard link로 그대로 사용
+- 샘플은 np.memmap으로 읽으므로 파일 전체를 메모리에 올리지 않음
+- numpy는 분석 함수가 호출될 때만 import
+"""
+
+import io
+import math
+import os
+import struct
+
+from django.conf import settings
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+TARGET_SAMPLE_RATE = 16000
+DBFS_FLOOR = -120.0
+POWER_FLOOR = 10 ** (DBFS_FLOOR / 10)  # DBFS_FLOOR에 해당하는 평균 제곱
+
+# 레벨 계산 시 한 번에 읽는 샘플 수 (10초 분량)
+ANALYSIS_BLOCK_SAMPLES = TARGET_SAMPLE_RATE * 10
+FRAME_MS = 20
+CLIP_LEVEL = 32767 / 32768.0
+
+# SNR 추정: 하위 10% 프레임을 잡음 기준으로, 잡음보다 6dB 이상 큰 프레임을 음성으로 간주
+NOISE_FLOOR_PERCENTILE = 10
+SPEECH_MARGIN_DB = 6.0
+# 음성 프레임 절대 하한 (vad.MIN_SPEECH_DBFS와 같은 값 - 작은 목소리도 음성으로 판정)
+MIN_SPEECH_DBFS = -55.0
+
+
+def _parse_riff(f, file_size=None):
+    riff = f.read(12)
+    if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+        return None
+
+    header = {}
+    while True:
+        chunk = f.read(8)
+        if len(chunk) < 8:
+            break
+        chunk_id, chunk_size = chunk[:4], struct.unpack('<I', chunk[4:])[0]
+
+        if chunk_id == b'fmt ':
+            fmt = f.read(chunk_size)
+            if len(fmt) < 16:
+                return None
+            format_tag, channels, sample_rate, byte_rate, block_align, bits = struct.unpack('<HHIIHH', fmt[:16])
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                # SubFormat GUID의 앞 2바이트가 실제 포맷 코드
+                format_tag = struct.unpack('<H', fmt[24:26])[0]
+            header.update({
+                'format_tag': format_tag,
+                'channels': channels,
+                'sample_rate': sample_rate,
+                'byte_rate': byte_rate,
+                'block_align': block_align,
+                'bits_per_sample': bits,
+            })
+            if chunk_size & 1:
+                f.seek(1, io.SEEK_CUR)
+        elif chunk_id == b'data':
+            header['data_offset'] = f.tell()
+            available = file_size - header['data_offset'] if file_size is not None else None
+            # 스트리밍으로 생성된 WAV는 크기가 0 또는 0xFFFFFFFF로 기록되는 경우가 있음
+            if available is not None and (chunk_size in (0, 0xFFFFFFFF) or chunk_size > available):
+                chunk_size = available
+            header['data_size'] = chunk_size
+            break
+        else:
+            f.seek(chunk_size + (chunk_size & 1), io.SEEK_CUR)
+
+    return header if 'format_tag' in header else None
+
+
+def read_wav_header(path):
+    """
+    WAV 파일의 RIFF 헤더 파싱
+
+    Returns:
+        dict | None: format_tag, channels, sample_rate, bits_per_sample, data_offset, data_size
+                     (WAV가 아니거나 헤더가 손상된 경우 None)
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _parse_riff(f, os.path.getsize(path))
+    except (OSError, struct.error):
+        return None
+
+
+def parse_wav_header(data):
+    """업로드 첫 청크 등 바이트 버퍼에서 헤더 파싱 (data 청크가 버퍼 밖이어도 fmt만 있으면 반환)"""
+    try:
+        return _parse_riff(io.BytesIO(data))
+    except struct.error:
+        return None
+
+
+def is_whisper_ready(header):
+    """16kHz / 모노 / 16bit PCM 여부"""
+    return bool(header) and (
+        header['format_tag'] == WAVE_FORMAT_PCM
+        and header['channels'] == 1
+        and header['sample_rate'] == TARGET_SAMPLE_RATE
+        and header['bits_per_sample'] == 16
+    )
+
+
+def adopt_ready_wav(source_path, wav_path, keep_source=False):
+    """
+    이미 Whisper 입력 형식인 WAV면 변환 없이 wav_path 위치로 옮김.
+    같은 경로면 아무것도 하지 않고, 원본을 유지해야 하면 hard link(불가능하면 False 반환).
+
+    Returns:
+        dict | None: 헤더 정보 (형식이 맞지 않으면 None → ffmpeg 변환 필요)
+    """
+    header = read_wav_header(source_path)
+    if not is_whisper_ready(header) or 'data_offset' not in header:
+        return None
+
+    if os.path.abspath(source_path) != os.path.abspath(wav_path):
+        os.makedirs(os.path.dirname(wav_path), exist_ok=True)
+        if keep_source:
+            try:
+                os.link(source_path, wav_path)
+            except OSError:
+                return None
+        else:
+            os.replace(source_path, wav_path)
+
+    print(f"[Audio] {os.path.basename(source_path)} is already 16kHz mono PCM, skipping conversion")
+    return header
+
+
+def load_pcm16(path, header=None):
+    """
+    16bit PCM 샘플을 np.memmap으로 반환 (다채널이면 (frames, channels) 형태)
+    """
+    import numpy as np
+
+    header = header or read_wav_header(path)
+    if not header or header['format_tag'] != WAVE_FORMAT_PCM or header['bits_per_sample'] != 16 \
+            or 'data_offset' not in header:
+        return None
+
+    channels = max(1, header['channels'])
+    frames = header['data_size'] // (2 * channels)
+    if frames == 0:
+        return np.zeros((0,), dtype='<i2')
+
+    samples = np.memmap(path, dtype='<i2', mode='r', offset=header['data_offset'], shape=(frames * channels,))
+    return samples.reshape(frames, channels) if channels > 1 else samples
+
+
+def _to_dbfs(value, reference):
+    if value <= 0:
+        return DBFS_FLOOR
+    return max(DBFS_FLOOR, 20 * math.log10(value / reference))
+
+
+def frame_powers(samples, sample_rate, frame_ms=FRAME_MS):
+    """
+    프레임별 평균 제곱(풀스케일=1.0 기준), peak, 클리핑 샘플 수, 전체 제곱합을 한 번에 계산.
+    ANALYSIS_BLOCK_SAMPLES 단위(프레임 크기의 배수)로 memmap을 읽어 벡터 연산한다.
+    samples는 16bit PCM(int16, load_pcm16) 또는 -1.0 ~ 1.0 float 배열.
+
+    Returns:
+        tuple: (powers ndarray, peak, clipped_samples, sum_squares)
+    """
+    import numpy as np
+
+    mono = samples if samples.ndim == 1 else samples[:, 0]
+    total = mono.shape[0]
+    scale = 32768.0 if mono.dtype.kind == 'i' else 1.0
+    frame = max(1, int(sample_rate * frame_ms / 1000))
+    block_size = max(frame, ANALYSIS_BLOCK_SAMPLES // frame * frame)
+
+    powers = []
+    peak = 0.0
+    clipped = 0
+    sum_squares = 0.0
+    for start in range(0, total, block_size):
+        block = np.asarray(mono[start:start + block_size], dtype=np.float32)
+        if scale != 1.0:
+            block /= scale
+        if not block.size:
+            continue
+        magnitude = np.abs(block)
+        peak = max(peak, float(magnitude.max()))
+        clipped += int(np.count_nonzero(magnitude >= CLIP_LEVEL))
+        sum_squares += float(np.dot(block, block))
+
+        n_frames = block.size // frame
+        if n_frames:
+            framed = block[:n_frames * frame].reshape(n_frames, frame)
+            powers.append(np.einsum('ij,ij->i', framed, framed) / frame)
+
+    powers = np.concatenate(powers) if powers else np.zeros(0, dtype=np.float32)
+    return powers, peak, clipped, sum_squares
+
+
+def noise_floor_power(powers, noise_percentile=NOISE_FLOOR_PERCENTILE):
+    """
+    잡음 기준 에너지 (프레임 에너지 하위 noise_percentile% 프레임들의 평균, 풀스케일=1.0 기준)
+    디지털 무음(샘플이 모두 0인 프레임)은 잡음이 아니므로 제외하고, DBFS_FLOOR 아래로는 내려가지 않음
+    (무음 패딩이 있는 녹음에서 잡음 기준이 -120dB 근처로 잡혀 SNR이 90dB 이상으로 나오는 것 방지)
+    """
+    import numpy as np
+
+    powers = np.asarray(powers, dtype=np.float64)
+    nonzero = powers[powers > 0]
+    if nonzero.size:
+        powers = nonzero
+    threshold = np.percentile(powers, noise_percentile)
+    return max(float(powers[powers <= threshold].mean()), POWER_FLOOR)
+
+
+def estimate_snr(powers, noise_percentile=NOISE_FLOOR_PERCENTILE, speech_margin_db=SPEECH_MARGIN_DB):
+    """
+    프레임 에너지 기반 SNR 추정
+    - 잡음 기준: noise_floor_power() (디지털 무음 프레임 제외)
+    - 음성 프레임: 잡음 기준보다 speech_margin_db 이상 큰 프레임
+    - snr_mean: 음성 프레임 평균 에너지 / 잡음 에너지, snr_max/min: 음성 프레임별 SNR의 최대/최소
+
+    Returns:
+        dict: snr_mean, snr_max, snr_min (dB, 음성 프레임이 없으면 모두 0.0), noise_floor_dbfs
+    """
+    import numpy as np
+
+    if powers is None or len(powers) == 0:
+        return {'snr_mean': None, 'snr_max': None, 'snr_min': None, 'noise_floor_dbfs': None}
+
+    noise_power = noise_floor_power(powers, noise_percentile)
+    powers = np.maximum(np.asarray(powers, dtype=np.float64), POWER_FLOOR)
+
+    speech = powers[powers >= noise_power * 10 ** (speech_margin_db / 10)]
+    noise_floor_dbfs = round(10 * math.log10(noise_power), 2)
+    if speech.size == 0:
+        return {'snr_mean': 0.0, 'snr_max': 0.0, 'snr_min': 0.0, 'noise_floor_dbfs': noise_floor_dbfs}
+
+    frame_snr = 10 * np.log10(speech / noise_power)
+    return {
+        'snr_mean': round(10 * math.log10(float(speech.mean()) / noise_power), 2),
+        'snr_max': round(float(frame_snr.max()), 2),
+        'snr_min': round(float(frame_snr.min()), 2),
+        'noise_floor_dbfs': noise_floor_dbfs,
+    }
+
+
+def analyze_wav(path, voiced_threshold_dbfs=None):
+    """
+    WAV 길이와 레벨 통계 계산 (파일 크기와 관계없이 메모리 사용량 일정)
+    - peak_dbfs / rms_dbfs: 전체 peak, RMS
+    - voiced_ratio: 프레임(20ms) 에너지가 잡음 기준 + SPEECH_MARGIN_DB 이상이면서
+      voiced_threshold_dbfs(절대 하한) 이상인 비율 (vad.detect_speech_regions와 같은 기준)
+    - clipping_ratio: 풀스케일에 닿은 샘플 비율
+    - snr_mean / snr_max / snr_min / noise_floor_dbfs: estimate_snr 참고
+
+    Returns:
+        dict | None: duration, sample_rate, channels, peak_dbfs, rms_dbfs, voiced_ratio, clipping_ratio,
+                     snr_mean, snr_max, snr_min, noise_floor_dbfs
+    """
+    import numpy as np
+
+    header = read_wav_header(path)
+    samples = load_pcm16(path, header)
+    if samples is None:
+        return None
+
+    if voiced_threshold_dbfs is None:
+        voiced_threshold_dbfs = getattr(settings, 'AUDIO_VOICED_THRESHOLD_DBFS', MIN_SPEECH_DBFS)
+
+    total = samples.shape[0]
+    powers, peak, clipped, sum_squares = frame_powers(samples, header['sample_rate'])
+
+    # 프레임 RMS(dBFS) >= 임계값  <=>  평균 제곱 >= 10^(임계값/10)
+    voiced_frames = 0
+    if len(powers):
+        threshold = max(
+            noise_floor_power(powers) * 10 ** (SPEECH_MARGIN_DB / 10),
+            10 ** (voiced_threshold_dbfs / 10),
+        )
+        voiced_frames = int(np.count_nonzero(powers >= threshold))
+    rms = math.sqrt(sum_squares / total) if total else 0.0
+
+    return {
+        'duration': total / header['sample_rate'] if header['sample_rate'] else 0.0,
+        'sample_rate': header['sample_rate'],
+        'channels': header['channels'],
+        'peak_dbfs': round(_to_dbfs(peak, 1.0), 2),
+        'rms_dbfs': round(_to_dbfs(rms, 1.0), 2),
+        'voiced_ratio': round(voiced_frames / len(powers), 4) if len(powers) else 0.0,
+        'clipping_ratio': round(clipped / total, 6) if total else 0.0,
+        **estimate_snr(powers),
+    }
+
+
+def is_silent(stats, min_voiced_ratio=None):
+    """
+    analyze_wav 결과 기준 무음 여부 (업로드 뷰는 무음이면 파일을 삭제하므로 확실한 경우만 True)
+    - 길이 0 (샘플 없음) → 무음
+    - 음성 프레임 비율이 min_voiced_ratio 미만이고 peak도 음성 하한(AUDIO_VOICED_THRESHOLD_DBFS)보다 작음 → 무음
+    - 비율은 낮지만 peak가 하한 이상인 경계 사례(아주 작은 목소리 등)는 무음으로 보지 않음 (파일 유지)
+    stats가 None이면 (WAV가 아님) 판단할 수 없으므로 False.
+    """
+    if not stats:
+        return False
+    if not stats.get('duration'):
+        return True
+    if min_voiced_ratio is None:
+        min_voiced_ratio = getattr(settings, 'AUDIO_SILENCE_MIN_VOICED_RATIO', 0.01)
+    if stats['voiced_ratio'] >= min_voiced_ratio:
+        return False
+    return stats['peak_dbfs'] < getattr(settings, 'AUDIO_VOICED_THRESHOLD_DBFS', MIN_SPEECH_DBFS)
+
+
+def analyze_file(args):
+    """
+    ProcessPoolExecutor용 진입점 (compute_snr 명령)
+    16bit PCM WAV가 아니면 임시 WAV로 변환한 뒤 분석 (원본은 변경하지 않음)
+    args: (record_id, path, voiced_threshold_dbfs) → (record_id, stats | None, error)
+    """
+    import tempfile
+    from .transcoding import run_ffmpeg_to_wav
+
+    record_id, path, voiced_threshold_dbfs = args
+    if not os.path.exists(path):
+        return record_id, None, 'file not found'
+    try:
+        stats = analyze_wav(path, voiced_threshold_dbfs=voiced_threshold_dbfs)
+        if stats is None:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                decoded = os.path.join(tmp_dir, 'decoded.wav')
+                run_ffmpeg_to_wav(path, decoded, timeout=120)
+                stats = analyze_wav(decoded, voiced_threshold_dbfs=voiced_threshold_dbfs)
+    except Exception as e:
+        return record_id, None, f'{type(e).__name__}: {e}'
+    if stats is None:
+        return record_id, None, 'could not decode audio'
+    return record_id, stats, None
@@ -146,6 +146,10 @@ def calculate_file_hash(file):
     Returns:
         str: 16진수 해시 문자열
     """
+    # 업로드 핸들러가 수신 중 계산한 해시가 있으면 파일을 다시 읽지 않음
+    if getattr(file, 'sha256', None):
+        return file.sha256
+
     sha256_hash = hashlib.sha256()
     
     file.seek(0)
@@ -0,0 +1,167 @@
+# voice_app/batch_transcribe.py
+"""
+여러 오디오 파일을 한 번에 Whisper로 전사하는 배치 엔진 (CPU backfill 용)
+
+- 파일 디코딩(ffmpeg) + log-mel 계산은 스레드 풀에서 병렬 수행
+  (ffmpeg 서브프로세스/NumPy 연산이라 GIL 영향이 적음)
+- N개 파일의 mel을 하나의 텐서 배치로 묶어 encoder + greedy decoder를 한 번에 실행
+- 다음 배치의 디코딩은 현재 배치 추론 중에 미리 시작 (파이프라이닝)
+
+배치 디코딩은 파일당 앞 30초 구간만 처리하므로, 30초를 넘는 파일은
+기존과 같이 model.transcribe()로 개별 처리한다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SAMPLE_RATE = 16000
+CHUNK_SECONDS = 30
+
+
+def prepare_mel(path, n_mels=80):
+    """
+    오디오 파일을 디코딩해 30초로 맞춘 log-mel 스펙트로그램 반환
+
+    Returns:
+        tuple: (mel 텐서 또는 None, 길이(초), 오류 메시지 또는 None)
+    """
+    import whisper
+
+    try:
+        audio = whisper.load_audio(path)
+        duration = len(audio) / SAMPLE_RATE
+        if duration > CHUNK_SECONDS:
+            return None, duration, None
+        mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio), n_mels)
+        return mel, duration, None
+    except Exception as e:
+        return None, 0.0, str(e)
+
+
+def decode_mel_batch(model, mels, language='ko'):
+    """mel 리스트를 하나의 배치로 묶어 greedy 디코딩 후 텍스트 리스트 반환"""
+    import torch
+    import whisper
+
+    batch = torch.stack(mels).to(model.device)
+    options = whisper.DecodingOptions(
+        language=language,
+        temperature=0.0,
+        without_timestamps=True,
+        fp16=False,
+    )
+    with torch.no_grad():
+        results = whisper.decode(model, batch, options)
+    return [result.text.strip() for result in results]
+
+
+class BatchTranscriber:
+    """
+    (key, 파일 경로) 목록을 batch_size 단위로 전사.
+
+    사용 예:
+        transcriber = BatchTranscriber(model, batch_size=8)
+        for key, text, error in transcriber.run(items):
+            ...
+        print(transcriber.stats)
+    """
+
+    def __init__(self, model, batch_size=8, io_workers=4, language='ko'):
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.io_workers = max(1, io_workers)
+        self.language = language
+        self.n_mels = getattr(getattr(model, 'dims', None), 'n_mels', 80)
+        self.stats = {
+            'files': 0,
+            'batched': 0,
+            'long_files': 0,
+            'failed': 0,
+            'audio_seconds': 0.0,
+            'elapsed': 0.0,
+        }
+
+    @property
+    def files_per_second(self):
+        if not self.stats['elapsed']:
+            return 0.0
+        return self.stats['files'] / self.stats['elapsed']
+
+    def _windows(self, items):
+        window = []
+        for item in items:
+            window.append(item)
+            if len(window) >= self.batch_size:
+                yield window
+                window = []
+        if window:
+            yield window
+
+    def _submit(self, executor, window):
+        return [(key, path, executor.submit(prepare_mel, path, self.n_mels)) for key, path in window]
+
+    def _transcribe_long(self, path):
+        result = self.model.transcribe(path, fp16=False, temperature=0.0, language=self.language)
+        return result['text'].strip()
+
+    def run_window(self, prepared):
+        """디코딩이 끝난 한 배치를 추론해 (key, text, error) 리스트 반환"""
+        results = []
+        batch_keys, batch_mels = [], []
+
+        for key, path, future in prepared:
+            mel, duration, error = future.result()
+            self.stats['files'] += 1
+            self.stats['audio_seconds'] += duration
+
+            if error:
+                self.stats['failed'] += 1
+                results.append((key, None, error))
+            elif mel is None:
+                # 30초 초과 파일은 기존 방식으로 개별 전사
+                self.stats['long_files'] += 1
+                try:
+                    results.append((key, self._transcribe_long(path), None))
+                except Exception as e:
+                    self.stats['failed'] += 1
+                    results.append((key, None, str(e)))
+            else:
+                batch_keys.append(key)
+                batch_mels.append(mel)
+
+        if batch_mels:
+            try:
+                texts = decode_mel_batch(self.model, batch_mels, self.language)
+                self.stats['batched'] += len(texts)
+                results.extend((key, text, None) for key, text in zip(batch_keys, texts))
+            except Exception as e:
+                self.stats['failed'] += len(batch_keys)
+                results.extend((key, None, str(e)) for key in batch_keys)
+
+        return results
+
+    def run(self, items):
+        """
+        Args:
+            items: (key, 파일 경로) iterable
+
+        Yields:
+            list: 배치별 (key, text 또는 None, 오류 메시지 또는 None) 리스트
+        """
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=self.io_workers) as executor:
+            windows = self._windows(items)
+            current = next(windows, None)
+            pending = self._submit(executor, current) if current else None
+
+            while pending is not None:
+                # 현재 배치를 추론하는 동안 다음 배치의 디코딩을 미리 시작
+                upcoming = next(windows, None)
+                next_pending = self._submit(executor, upcoming) if upcoming else None
+
+                yield self.run_window(pending)
+                self.stats['elapsed'] = time.time() - start
+
+                pending = next_pending
+
+        self.stats['elapsed'] = time.time() - start
@@ -0,0 +1,45 @@
+# voice_app/db_setup.py
+"""
+데이터베이스 연결 설정
+
+SQLite (기본)
+- connection_created 시그널에서 연결마다 PRAGMA 적용 (VoiceAppConfig.ready()에서 등록)
+  - journal_mode=WAL: 읽기와 쓰기가 서로를 막지 않음 (업로드 중에도 대시보드/목록 조회 가능)
+  - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음
+  - busy_timeout: 쓰기 잠금을 바로 실패시키지 않고 기다림 ("database is locked" 방지)
+  - mmap_size: 읽기를 메모리 매핑으로 처리
+- 설정: settings.SQLITE_PRAGMAS (값은 settings에만 정의, 없으면 PRAGMA를 적용하지 않음)
+- CONN_MAX_AGE로 연결을 재사용하므로 PRAGMA는 연결이 새로 열릴 때만 실행됨
+
+PostgreSQL
+- DB_ENGINE=postgres 환경 변수로 전환 (voice_project/settings.py)
+- category_specific_data JSONB GIN 인덱스는 migrations/0027_postgres_jsonb_indexes.py (PostgreSQL에서만 생성)
+"""
+
+_reported = False
+
+
+def sqlite_pragmas():
+    from django.conf import settings
+
+    return getattr(settings, 'SQLITE_PRAGMAS', {})
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """connection_created 수신: SQLite 연결에 PRAGMA 적용 (다른 DB는 무시)"""
+    global _reported
+
+    if connection.vendor != 'sqlite':
+        return
+
+    cursor = connection.connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        journal_mode = cursor.execute('PRAGMA journal_mode').fetchone()[0]
+    finally:
+        cursor.close()
+
+    if not _reported:
+        _reported = True
+        print(f"[DB] SQLite journal_mode={journal_mode}, pragmas={sqlite_pragmas()}")
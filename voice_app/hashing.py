@@ -0,0 +1,14 @@
+# voice_app/hashing.py
+"""파일 해시 (업로드 세션 검증, 전사 캐시 키에서 공용)"""
+
+import hashlib
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha256(path):
+    sha256_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            sha256_hash.update(block)
+    return sha256_hash.hexdigest()
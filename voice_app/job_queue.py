@@ -0,0 +1,396 @@
+# voice_app/job_queue.py
+"""
+DB 기반 전사 작업 큐
+
+HTTP 요청에서는 enqueue_job()으로 작업만 등록하고,
+실제 Whisper/WhisperX 처리는 `python manage.py run_transcription_workers`
+워커 프로세스가 claim_next_job()으로 작업을 원자적으로 가져가 수행한다.
+
+진행률 / 임대(lease)
+- 작업은 단계(load → asr → align → persist)와 진행률(0-100)을 report_progress()로 기록
+  → get_alignment_status / alignment_status_api에서 job_progress()로 조회
+- 워커는 작업을 가져갈 때 JOB_LEASE_SECONDS 동안의 임대를 받고, 처리 중에는 LeaseKeeper 스레드가
+  주기적으로 연장한다. 워커 프로세스가 죽으면 임대가 만료되고 requeue_expired_jobs()가
+  작업을 다시 대기열로 보냄 (JOB_MAX_ATTEMPTS회 넘게 실패하면 failed로 종료)
+일괄 전사 (backfill)
+- enqueue_unprocessed()는 'backfill' 작업으로 등록하고, 워커는 backfill 작업을 하나 가져가면
+  BACKFILL_BATCH_SIZE개까지 더 가져가 BatchTranscriber로 한 번에 디코딩/전사 (run_backfill_jobs)
+- 'backfill'은 'transcribe'와 같은 종류로 취급 (중복 등록 방지, 상태 조회, --kinds transcribe)
+
+- 임대를 잃은 워커(연장/진행률 기록이 0건)는 다음 진행률 보고 시점에 LeaseLost로 작업을 중단하고
+  결과를 저장하지 않음 (다른 워커가 같은 작업을 처리 중이므로)
+"""
+
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import AudioRecord, TranscriptionJob
+
+ACTIVE_JOB_STATUSES = ('queued', 'running')
+TRANSCRIBE_KINDS = ('transcribe', 'backfill')
+REQUEUE_CHECK_INTERVAL = 30  # 워커 루프에서 만료된 임대를 확인하는 간격(초)
+
+
+class LeaseLost(Exception):
+    """작업 임대가 만료되어 다른 워커에게 넘어감 - 현재 워커는 처리를 중단해야 함"""
+
+
+def _same_kinds(kind):
+    """중복 확인/상태 조회에서 같은 작업으로 보는 종류들"""
+    return TRANSCRIBE_KINDS if kind in TRANSCRIBE_KINDS else (kind,)
+
+
+def lease_seconds():
+    return getattr(settings, 'JOB_LEASE_SECONDS', 300)
+
+
+def _lease_expiry():
+    return timezone.now() + timedelta(seconds=lease_seconds())
+
+
+def _expired_lease(now):
+    """임대가 만료된 처리 중 작업 조건 (lease_expires_at이 없으면 임대 도입 전에 시작된 작업)"""
+    return Q(lease_expires_at__lt=now) | Q(
+        lease_expires_at__isnull=True, started_at__lt=now - timedelta(seconds=lease_seconds())
+    )
+
+
+def enqueue_job(audio, kind='transcribe'):
+    """
+    오디오에 대한 작업을 대기열에 등록.
+    같은 종류의 작업이 이미 대기/처리 중이면 새로 만들지 않고 기존 작업을 반환.
+    동시에 두 요청이 확인을 통과해도 job_one_active_per_audio_kind 제약으로 하나만 만들어짐.
+
+    Returns:
+        tuple: (TranscriptionJob, created)
+    """
+    existing = get_active_job(audio.id, kind)
+    if existing:
+        return existing, False
+
+    try:
+        with transaction.atomic():
+            job = TranscriptionJob.objects.create(audio=audio, kind=kind)
+    except IntegrityError:
+        # 다른 요청이 방금 등록함
+        existing = get_active_job(audio.id, kind)
+        if existing is None:
+            raise
+        return existing, False
+    print(f"[Queue] Enqueued {kind} job #{job.id} for audio ID: {audio.id}")
+    return job, True
+
+
+def enqueue_unprocessed(kind='backfill'):
+    """
+    전사되지 않은 모든 레코드에 대해 작업을 일괄 등록 (이미 대기/처리 중인 레코드는 제외).
+    기본 'backfill' 작업은 워커가 여러 개씩 모아 배치로 전사한다.
+
+    Returns:
+        int: 새로 등록된 작업 수
+    """
+    active_audio_ids = TranscriptionJob.objects.filter(
+        kind__in=_same_kinds(kind), status__in=ACTIVE_JOB_STATUSES
+    ).values('audio_id')
+    pending_ids = AudioRecord.objects.filter(transcript__isnull=True).exclude(
+        id__in=active_audio_ids
+    ).values_list('id', flat=True)
+
+    active = TranscriptionJob.objects.filter(kind__in=_same_kinds(kind), status__in=ACTIVE_JOB_STATUSES)
+    before = active.count()
+    # 그 사이 다른 요청이 등록한 오디오는 제약에 걸려 건너뜀
+    TranscriptionJob.objects.bulk_create(
+        [TranscriptionJob(audio_id=audio_id, kind=kind) for audio_id in pending_ids],
+        batch_size=500, ignore_conflicts=True,
+    )
+    created = max(0, active.count() - before)
+    print(f"[Queue] Enqueued {created} {kind} jobs for unprocessed records")
+    return created
+
+
+def get_active_job(audio_id, kind):
+    """대기/처리 중인 작업 반환 (없으면 None)"""
+    return TranscriptionJob.objects.filter(
+        audio_id=audio_id, kind__in=_same_kinds(kind), status__in=ACTIVE_JOB_STATUSES
+    ).first()
+
+
+def claim_next_job(worker_name, kinds=None):
+    """
+    가장 오래된 대기 작업을 원자적으로 가져감.
+    status='queued' 조건부 UPDATE가 1건일 때만 소유권을 얻으므로
+    여러 워커 프로세스가 동시에 호출해도 같은 작업을 중복 처리하지 않는다.
+    """
+    if kinds and 'transcribe' in kinds:
+        kinds = set(kinds) | set(TRANSCRIBE_KINDS)
+
+    while True:
+        queued = TranscriptionJob.objects.filter(status='queued')
+        if kinds:
+            queued = queued.filter(kind__in=kinds)
+
+        job_id = queued.order_by('created_at', 'id').values_list('id', flat=True).first()
+        if job_id is None:
+            return None
+
+        claimed = TranscriptionJob.objects.filter(id=job_id, status='queued').update(
+            status='running',
+            worker=worker_name,
+            started_at=timezone.now(),
+            attempts=F('attempts') + 1,
+            stage='',
+            progress=0,
+            lease_expires_at=_lease_expiry(),
+        )
+        if claimed:
+            return TranscriptionJob.objects.select_related('audio').get(id=job_id)
+        # 다른 워커가 먼저 가져감 → 다음 후보로 재시도
+
+
+def _owned(job):
+    """이 워커가 아직 소유한 작업 (임대 만료로 다른 워커에게 넘어간 경우 제외)"""
+    return TranscriptionJob.objects.filter(id=job.id, status='running', worker=job.worker)
+
+
+def finish_job(job, success, error=''):
+    """작업 종료 상태 기록"""
+    job.status = 'completed' if success else 'failed'
+    job.error = error or ''
+    job.finished_at = timezone.now()
+    updated = _owned(job).update(
+        status=job.status,
+        error=job.error,
+        finished_at=job.finished_at,
+        progress=100 if success else F('progress'),
+        lease_expires_at=None,
+    )
+    if not updated:
+        print(f"[Queue] Job #{job.id} lease was lost before finishing - result not recorded on the job")
+
+
+def report_progress(job, stage, progress):
+    """현재 단계와 진행률 기록 (임대도 함께 연장)"""
+    return _owned(job).update(
+        stage=stage,
+        progress=max(0, min(100, int(progress))),
+        lease_expires_at=_lease_expiry(),
+    )
+
+
+def renew_lease(job):
+    return _owned(job).update(lease_expires_at=_lease_expiry())
+
+
+def _mark_audio_failed(job):
+    """재시도 한도를 넘긴 작업의 AudioRecord 상태를 failed로 (processing에 머물지 않도록)"""
+    field = 'alignment_status' if job.kind == 'align' else 'status'
+    audio = AudioRecord.objects.filter(id=job.audio_id).first()
+    if audio is not None and getattr(audio, field) == 'processing':
+        setattr(audio, field, 'failed')
+        audio.save(update_fields=[field])
+
+
+def requeue_expired_jobs():
+    """
+    임대가 만료된 처리 중 작업(워커 비정상 종료)을 다시 대기열로 보냄.
+    시도 횟수가 JOB_MAX_ATTEMPTS에 도달한 작업은 failed 처리.
+
+    Returns:
+        tuple: (다시 대기열로 보낸 수, 실패 처리한 수)
+    """
+    max_attempts = getattr(settings, 'JOB_MAX_ATTEMPTS', 3)
+    now = timezone.now()
+    expired = _expired_lease(now)
+    stale = TranscriptionJob.objects.filter(expired, status='running')
+
+    requeued = failed = 0
+    for job in stale.only('id', 'audio_id', 'kind', 'attempts', 'worker'):
+        # 조회 후 LeaseKeeper가 임대를 연장했으면 UPDATE 조건(만료)에 걸리지 않아 그대로 둠
+        still_expired = _owned(job).filter(expired)
+        if job.attempts < max_attempts:
+            if still_expired.update(status='queued', worker='', stage='', progress=0, lease_expires_at=None):
+                requeued += 1
+                print(f"[Queue] Job #{job.id} lease expired (worker {job.worker}) - requeued")
+        elif still_expired.update(
+            status='failed', finished_at=now, lease_expires_at=None,
+            error=f'워커 임대 만료 ({job.attempts}회 시도)',
+        ):
+            failed += 1
+            _mark_audio_failed(job)
+            print(f"[Queue] Job #{job.id} lease expired after {job.attempts} attempts - failed")
+    return requeued, failed
+
+
+def job_progress(audio_id, kind):
+    """상태 API용 가장 최근 작업의 진행 정보 (작업이 없으면 None)"""
+    job = TranscriptionJob.objects.filter(
+        audio_id=audio_id, kind__in=_same_kinds(kind)
+    ).order_by('-created_at', '-id').first()
+    if job is None:
+        return None
+    return {
+        'job_id': job.id,
+        'job_status': job.status,
+        'stage': job.stage,
+        'stage_display': job.get_stage_display(),
+        'progress': job.progress,
+        'attempts': job.attempts,
+        'error': job.error,
+    }
+
+
+class LeaseKeeper(threading.Thread):
+    """작업 처리 중 임대를 주기적으로 연장 (진행률 보고 없이 오래 걸리는 모델 추론 구간 대비)"""
+
+    def __init__(self, job, *more_jobs):
+        super().__init__(name=f'lease-{job.id}', daemon=True)
+        self.job = job
+        self.more_jobs = more_jobs  # 배치로 함께 처리하는 작업 (run_backfill_jobs)
+        self.interval = max(1.0, lease_seconds() / 3)
+        self.lost = threading.Event()  # 연장 실패 = 다른 워커에게 넘어감
+        self._stopped = threading.Event()
+
+    def run(self):
+        try:
+            while not self._stopped.wait(self.interval):
+                for job in self.more_jobs:
+                    renew_lease(job)  # 잃은 작업은 run_backfill_jobs가 저장 직전에 걸러냄
+                if not renew_lease(self.job):
+                    print(f"[Queue] Job #{self.job.id} lease lost - stopping at next progress report")
+                    self.lost.set()
+                    break
+        finally:
+            connection.close()  # 스레드 전용 DB 연결 정리
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def run_job(job, keeper=None):
+    """
+    작업 종류에 맞는 tasks.py 함수 실행 (진행률은 작업 행에 기록)
+    임대를 잃었으면 진행률 보고 시점에 LeaseLost 발생 → 이후 단계(저장 포함)를 실행하지 않음
+    """
+    from .tasks import transcribe_audio_task, align_audio_task
+
+    def progress(stage, percent):
+        if (keeper is not None and keeper.lost.is_set()) or not report_progress(job, stage, percent):
+            raise LeaseLost(f'Job #{job.id} is no longer owned by {job.worker}')
+
+    if job.kind == 'align':
+        return align_audio_task(job.audio_id, progress=progress)
+    return transcribe_audio_task(job.audio_id, progress=progress)
+
+
+def claim_backfill_batch(job, limit=None):
+    """backfill 작업 하나를 가져간 뒤 배치 크기만큼 더 가져감 → 작업 목록"""
+    limit = limit or getattr(settings, 'BACKFILL_BATCH_SIZE', 8)
+    jobs = [job]
+    while len(jobs) < limit:
+        more = claim_next_job(job.worker, kinds=['backfill'])
+        if more is None:
+            break
+        jobs.append(more)
+    return jobs
+
+
+def run_backfill_jobs(jobs):
+    """
+    backfill 작업들을 tasks.transcribe_batch_task로 한 번에 전사하고 작업별 결과 기록
+
+    Returns:
+        int: 성공한 작업 수
+    """
+    from .tasks import transcribe_batch_task
+
+    job_ids = [job.id for job in jobs]
+
+    def owned(audio_ids):
+        return set(TranscriptionJob.objects.filter(
+            id__in=job_ids, audio_id__in=audio_ids, status='running', worker=jobs[0].worker,
+        ).values_list('audio_id', flat=True))
+
+    keeper = LeaseKeeper(*jobs)
+    keeper.start()
+    try:
+        TranscriptionJob.objects.filter(id__in=job_ids, status='running').update(stage='asr', progress=10)
+        errors = transcribe_batch_task([job.audio_id for job in jobs], owned=owned)
+    except Exception as e:
+        errors = {job.audio_id: f"{type(e).__name__}: {e}" for job in jobs}
+    finally:
+        keeper.stop()
+
+    for job in jobs:
+        finish_job(job, errors.get(job.audio_id) is None, errors.get(job.audio_id) or '')
+    return sum(1 for job in jobs if errors.get(job.audio_id) is None)
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(kinds=None, poll_interval=2.0, once=False):
+    """
+    워커 메인 루프 - 대기열이 빌 때까지 작업을 처리하고, 비어 있으면 poll_interval 만큼 대기.
+    once=True이면 대기열이 비는 즉시 종료.
+    """
+    name = worker_name()
+    print(f"[Worker {name}] Started (kinds={kinds or 'all'})")
+
+    processed = 0
+    last_requeue_check = 0
+    while True:
+        close_old_connections()
+        if time.time() - last_requeue_check >= REQUEUE_CHECK_INTERVAL:
+            requeue_expired_jobs()
+            last_requeue_check = time.time()
+
+        job = claim_next_job(name, kinds=kinds)
+
+        if job is None:
+            if once:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        if job.kind == 'backfill':
+            start = time.time()
+            jobs = claim_backfill_batch(job)
+            succeeded = run_backfill_jobs(jobs)
+            processed += len(jobs)
+            print(f"[Worker {name}] Backfill batch of {len(jobs)} jobs: {succeeded} completed "
+                  f"in {time.time() - start:.2f} seconds")
+            continue
+
+        print(f"[Worker {name}] Claimed {job.kind} job #{job.id} (audio ID: {job.audio_id})")
+        start = time.time()
+        keeper = LeaseKeeper(job)
+        keeper.start()
+        try:
+            success = run_job(job, keeper)
+            finish_job(job, bool(success), '' if success else '처리 결과가 없습니다.')
+        except LeaseLost as e:
+            # 다른 워커가 처리 중 - 작업/레코드 상태는 건드리지 않음
+            print(f"[Worker {name}] Job #{job.id} abandoned: {e}")
+            success = False
+        except Exception as e:
+            print(f"[Worker {name}] Job #{job.id} failed: {type(e).__name__}: {e}")
+            finish_job(job, False, f"{type(e).__name__}: {e}")
+            success = False
+        finally:
+            keeper.stop()
+
+        processed += 1
+        print(f"[Worker {name}] Job #{job.id} {'completed' if success else 'failed'} in {time.time() - start:.2f} seconds")
+
+    print(f"[Worker {name}] Stopped after {processed} jobs")
+    return processed
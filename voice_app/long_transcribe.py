@@ -0,0 +1,237 @@
+# voice_app/long_transcribe.py
+"""
+긴 녹음(노인 인터뷰 등) 분할 병렬 전사
+
+- 16kHz 모노 PCM WAV를 np.memmap으로 열고 30초 윈도우(OVERLAP_SECONDS 겹침) 단위로만 읽음
+  → 프로세스당 메모리 = 모델 + 윈도우 하나 (녹음 길이와 무관)
+- 윈도우는 ProcessPoolExecutor로 여러 코어에서 동시에 전사
+  - 풀은 (전사 워커) 프로세스당 하나를 처음 필요할 때 만들고 이후 파일에도 재사용 (자식 프로세스당 모델 1회 로드)
+  - 풀이 쓰는 모델 메모리는 model_registry.reserve()로 MODEL_MEMORY_BUDGET_MB에 포함
+  - 워커 수가 1이면 풀 없이 모델 관리자의 모델로 윈도우를 순서대로 전사
+- 겹치는 구간은 중간 지점을 경계로 나눠 앞 윈도우 / 뒤 윈도우 세그먼트 중 하나만 채택
+  (세그먼트 중심 시각 기준 - 실행 순서와 무관하게 항상 같은 결과)
+
+whisper_utils.transcribe_audio에서 LONG_TRANSCRIBE_MIN_SECONDS 이상인 WAV에 자동 적용.
+"""
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+from django.conf import settings
+
+from . import model_registry
+from .audio_analysis import TARGET_SAMPLE_RATE, is_whisper_ready, load_pcm16, read_wav_header
+
+WINDOW_SECONDS = 30.0
+OVERLAP_SECONDS = 5.0
+
+# 풀 자식 프로세스 전역 (initializer에서 설정)
+_model = None
+
+# 부모 프로세스의 재사용 풀
+_pool = None
+_pool_config = None  # (model_name, workers, threads)
+_pool_reservation = None  # model_registry.reserve() 키
+_pool_lock = threading.Lock()
+
+
+def wav_duration(header):
+    """WAV 헤더 → 길이(초)"""
+    if not header or 'data_size' not in header:
+        return 0.0
+    bytes_per_second = header['sample_rate'] * header['channels'] * header['bits_per_sample'] // 8
+    return header['data_size'] / bytes_per_second if bytes_per_second else 0.0
+
+
+def is_long_recording(path):
+    """분할 전사 대상 여부 (16kHz 모노 PCM이고 LONG_TRANSCRIBE_MIN_SECONDS 이상)"""
+    if not getattr(settings, 'LONG_TRANSCRIBE_ENABLED', True):
+        return False
+    header = read_wav_header(path)
+    return is_whisper_ready(header) and wav_duration(header) >= getattr(settings, 'LONG_TRANSCRIBE_MIN_SECONDS', 120)
+
+
+def plan_windows(total_samples, window_seconds=WINDOW_SECONDS, overlap_seconds=OVERLAP_SECONDS,
+                 sample_rate=TARGET_SAMPLE_RATE):
+    """
+    [(start_sample, end_sample)] - 윈도우 간격은 window - overlap, 마지막 윈도우는 파일 끝에서 자름
+    """
+    window = int(window_seconds * sample_rate)
+    step = max(1, window - int(overlap_seconds * sample_rate))
+    windows = []
+    start = 0
+    while start < total_samples:
+        end = min(start + window, total_samples)
+        windows.append((start, end))
+        if end >= total_samples:
+            break
+        start += step
+    return windows
+
+
+def _init_worker(model_name, threads):
+    """워커 프로세스 initializer - 모델을 프로세스당 한 번만 로드 (Django/DB는 사용하지 않음)"""
+    global _model
+    import torch
+    import whisper
+
+    torch.set_num_threads(max(1, threads))
+    _model = whisper.load_model(model_name, device='cpu')
+
+
+def _transcribe_window(args):
+    """윈도우 하나 전사 → (window_index, [{start, end, text}]) (풀 자식 프로세스에서 실행)"""
+    return _transcribe_samples(_model, *args)
+
+
+def _transcribe_samples(model, index, path, start, end, language):
+    """[start, end) 샘플 구간 전사 → (window_index, [{start, end, text}]) (시각은 파일 기준 절대값)"""
+    import numpy as np
+
+    samples = load_pcm16(path)  # memmap - 이 윈도우 구간만 실제로 읽힘
+    audio = np.asarray(samples[start:end], dtype=np.float32) / 32768.0
+
+    result = model.transcribe(
+        audio, language=language, temperature=0.0, fp16=False,
+        condition_on_previous_text=False,  # 윈도우 간 의존성 제거 (병렬/결정적 처리)
+    )
+    offset = start / TARGET_SAMPLE_RATE
+    segments = [
+        {
+            'start': round(offset + seg['start'], 2),
+            'end': round(offset + seg['end'], 2),
+            'text': seg['text'].strip(),
+        }
+        for seg in result.get('segments', [])
+        if seg.get('text', '').strip()
+    ]
+    return index, segments
+
+
+def merge_windows(windows, window_segments, sample_rate=TARGET_SAMPLE_RATE):
+    """
+    겹치는 윈도우 결과 병합
+
+    윈도우 i와 i+1이 겹치는 구간의 중간 지점을 경계로 삼아, 세그먼트 중심이 경계 앞이면
+    윈도우 i, 뒤면 윈도우 i+1의 세그먼트만 남긴다.
+    """
+    merged = []
+    for i, segments in enumerate(window_segments):
+        low = 0.0
+        high = float('inf')
+        if i > 0:
+            prev_end = windows[i - 1][1] / sample_rate
+            low = (windows[i][0] / sample_rate + prev_end) / 2
+        if i + 1 < len(windows):
+            high = (windows[i + 1][0] / sample_rate + windows[i][1] / sample_rate) / 2
+
+        for seg in segments:
+            center = (seg['start'] + seg['end']) / 2
+            if low <= center < high:
+                merged.append(seg)
+    return merged
+
+
+def default_workers():
+    workers = getattr(settings, 'LONG_TRANSCRIBE_WORKERS', 0) or min(4, os.cpu_count() or 1)
+    return max(1, workers)
+
+
+def _get_pool(model_name, workers, threads):
+    """재사용 풀 반환 (설정이 바뀌었을 때만 새로 만듦). _pool_lock 안에서 호출."""
+    global _pool, _pool_config, _pool_reservation
+
+    config = (model_name, workers, threads)
+    if _pool is not None and _pool_config == config:
+        return _pool
+    _shutdown_pool()
+
+    # 자식 프로세스마다 모델이 하나씩 올라가므로 그만큼 예산에서 확보 (사용 중이 아닌 모델은 내보냄)
+    size_bytes = model_registry.estimate_bytes(model_registry.model_key('whisper', model_name, 'cpu')) * workers
+    _pool_reservation = model_registry.reserve('whisper-pool', model_name, size_bytes, 'cpu', f'x{workers}')
+
+    # spawn: 부모 프로세스의 torch 스레드/DB 연결 상태를 물려받지 않음
+    context = multiprocessing.get_context('spawn')
+    _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                initializer=_init_worker, initargs=(model_name, threads))
+    _pool_config = config
+    print(f"[LongTranscribe] Started pool: {workers} processes x {threads} threads ({model_name})")
+    return _pool
+
+
+def _shutdown_pool():
+    global _pool, _pool_config, _pool_reservation
+
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    if _pool_reservation is not None:
+        model_registry.release(_pool_reservation)
+    _pool = _pool_config = _pool_reservation = None
+
+
+def shutdown_pool():
+    """재사용 풀 종료 (프로세스 종료 시 자동 호출)"""
+    with _pool_lock:
+        _shutdown_pool()
+
+
+atexit.register(shutdown_pool)
+
+
+def transcribe_long_audio(path, model_name, language='ko', workers=None):
+    """
+    긴 WAV 분할 병렬 전사
+
+    Returns:
+        dict: text, segments, total_seconds, windows, workers (16kHz 모노 PCM이 아니면 None)
+    """
+    header = read_wav_header(path)
+    samples = load_pcm16(path, header) if is_whisper_ready(header) else None
+    if samples is None:
+        return None
+
+    windows = plan_windows(len(samples))
+    del samples
+    # 풀 크기는 파일마다 바꾸지 않음 (윈도우 수가 적은 파일도 같은 풀을 재사용)
+    workers = workers or default_workers()
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    start_time = time.time()
+    tasks = [(i, path, start, end, language) for i, (start, end) in enumerate(windows)]
+    window_segments = [None] * len(windows)
+
+    if workers == 1 or len(windows) == 1:
+        # 모델 관리자가 가진 모델로 순서대로 전사 (추가 프로세스/모델 없음)
+        with model_registry.use_whisper_model(model_name) as model:
+            for task in tasks:
+                index, segments = _transcribe_samples(model, *task)
+                window_segments[index] = segments
+    else:
+        with _pool_lock:
+            executor = _get_pool(model_name, workers, threads)
+            try:
+                for index, segments in executor.map(_transcribe_window, tasks):
+                    window_segments[index] = segments
+            except BrokenProcessPool:
+                # 자식 프로세스가 죽은 풀은 버리고 다음 파일에서 새로 만듦
+                _shutdown_pool()
+                raise
+
+    segments = merge_windows(windows, window_segments)
+    total_seconds = wav_duration(header)
+    print(
+        f"[LongTranscribe] {os.path.basename(path)}: {total_seconds:.1f}s audio, {len(windows)} windows, "
+        f"{workers} workers x {threads} threads - {time.time() - start_time:.2f} seconds"
+    )
+    return {
+        'text': ' '.join(seg['text'] for seg in segments).strip(),
+        'segments': segments,
+        'total_seconds': round(total_seconds, 2),
+        'windows': len(windows),
+        'workers': workers,
+    }
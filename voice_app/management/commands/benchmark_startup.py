@@ -0,0 +1,109 @@
+# voice_app/management/commands/benchmark_startup.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py benchmark_startup --runs 5 --path /api/status/
+
+새 프로세스에서 다음 항목을 측정:
+- `manage.py check` 전체 실행 시간
+- django.setup() 시간, 첫 요청(URLconf/views import 포함) 및 두 번째 요청 지연 시간
+- torch / whisper 모듈이 로드되었는지 여부
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+FIRST_REQUEST_SCRIPT = r"""
+import json, os, sys, time
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'voice_project.settings')
+start = time.perf_counter()
+import django
+django.setup()
+setup_time = time.perf_counter() - start
+
+from django.test import Client
+from django.test.utils import setup_test_environment
+setup_test_environment()
+client = Client()
+
+start = time.perf_counter()
+first = client.get(sys.argv[1])
+first_time = time.perf_counter() - start
+
+start = time.perf_counter()
+client.get(sys.argv[1])
+second_time = time.perf_counter() - start
+
+print(json.dumps({
+    'setup': setup_time,
+    'first_request': first_time,
+    'second_request': second_time,
+    'status_code': first.status_code,
+    'torch_loaded': 'torch' in sys.modules,
+    'whisper_loaded': 'whisper' in sys.modules,
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Django 시작 시간 벤치마크 (manage.py check, 첫 요청 지연, torch/whisper 로드 여부)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5, help='반복 횟수 (기본: 5)')
+        parser.add_argument('--path', default='/api/status/', help='첫 요청에 사용할 URL (기본: /api/status/)')
+
+    def _run(self, args):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'voice_project.settings'))
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable] + args,
+            cwd=str(settings.BASE_DIR),
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or result.stdout.strip())
+        return elapsed, result.stdout
+
+    def _summary(self, label, values):
+        self.stdout.write(
+            f"{label:<28} median {statistics.median(values) * 1000:8.1f} ms   "
+            f"min {min(values) * 1000:8.1f} ms   max {max(values) * 1000:8.1f} ms"
+        )
+
+    def handle(self, *args, **options):
+        runs = max(1, options['runs'])
+        path = options['path']
+
+        check_times = []
+        process_times = []
+        samples = []
+
+        for _ in range(runs):
+            elapsed, _ = self._run(['manage.py', 'check'])
+            check_times.append(elapsed)
+
+            elapsed, stdout = self._run(['-c', FIRST_REQUEST_SCRIPT, path])
+            process_times.append(elapsed)
+            samples.append(json.loads(stdout.strip().splitlines()[-1]))
+
+        self.stdout.write(self.style.SUCCESS(f"Startup benchmark ({runs} runs, path={path})"))
+        self._summary('manage.py check', check_times)
+        self._summary('django.setup()', [s['setup'] for s in samples])
+        self._summary('first request', [s['first_request'] for s in samples])
+        self._summary('second request', [s['second_request'] for s in samples])
+        self._summary('process total', process_times)
+
+        last = samples[-1]
+        self.stdout.write(f"status code: {last['status_code']}")
+        self.stdout.write(f"torch loaded: {last['torch_loaded']}, whisper loaded: {last['whisper_loaded']}")
+        if last['torch_loaded'] or last['whisper_loaded']:
+            self.stdout.write(self.style.WARNING("⚠ 요청 처리 과정에서 torch/whisper가 import 되었습니다."))
@@ -0,0 +1,101 @@
+# voice_app/management/commands/compute_snr.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py compute_snr --procs 8 --batch-size 500
+python manage.py compute_snr --force            # 전체 재계산
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+from voice_app.audio_analysis import analyze_file
+from voice_app.models import AudioRecord
+from voice_app.rollups import affected_pairs, refresh_after_bulk_write
+
+STATS_FIELDS = [
+    'snr_mean', 'snr_max', 'snr_min',
+    'duration', 'peak_dbfs', 'rms_dbfs', 'voiced_ratio', 'clipping_ratio',
+]
+
+
+class Command(BaseCommand):
+    help = "서버에서 SNR 및 오디오 레벨을 계산해 snr_mean/snr_max/snr_min 등을 채움 (프로세스 풀)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--procs', type=int, default=os.cpu_count() or 1, help='분석 프로세스 수 (기본: CPU 코어 수)')
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+        parser.add_argument('--category', help='특정 카테고리만 처리')
+        parser.add_argument('--limit', type=int, default=None, help='처리할 최대 레코드 수')
+        parser.add_argument('--force', action='store_true', help='이미 SNR이 있는 레코드도 재계산')
+
+    def handle(self, *args, **options):
+        records = AudioRecord.objects.exclude(audio_file='')
+        if not options['force']:
+            records = records.filter(snr_mean__isnull=True)
+        if options['category']:
+            records = records.filter(category=options['category'])
+        records = records.order_by('id').values_list('id', 'audio_file')
+        if options['limit']:
+            records = records[:options['limit']]
+
+        threshold = getattr(settings, 'AUDIO_VOICED_THRESHOLD_DBFS', -55.0)
+        tasks = [
+            (record_id, os.path.join(settings.MEDIA_ROOT, audio_file), threshold)
+            for record_id, audio_file in records.iterator(chunk_size=2000)
+        ]
+        if not tasks:
+            self.stdout.write(self.style.SUCCESS("처리할 레코드가 없습니다."))
+            return
+
+        self.stdout.write(f"🔍 {len(tasks)}개 파일 분석 시작 (프로세스 {options['procs']}개)")
+
+        # fork 전에 DB 연결을 닫아 자식 프로세스가 부모 연결을 공유하지 않도록 함
+        connections.close_all()
+
+        start = time.time()
+        pending = []
+        updated = failed = 0
+        with ProcessPoolExecutor(max_workers=max(1, options['procs'])) as executor:
+            for record_id, stats, error in executor.map(analyze_file, tasks, chunksize=16):
+                if stats is None:
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f"⚠ {record_id}: {error}"))
+                    continue
+
+                record = AudioRecord(id=record_id)
+                for field in STATS_FIELDS:
+                    setattr(record, field, stats.get(field))
+                pending.append(record)
+
+                if len(pending) >= options['batch_size']:
+                    updated += self._flush(pending, start, updated, failed, len(tasks))
+                    pending = []
+
+        if pending:
+            updated += self._flush(pending, start, updated, failed, len(tasks))
+
+        elapsed = time.time() - start
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 완료: {updated}개 갱신, {failed}개 실패, {elapsed:.1f}초 "
+            f"({(updated + failed) / elapsed if elapsed else 0:.1f} files/sec)"
+        ))
+
+    def _flush(self, records, start, updated, failed, total):
+        now = timezone.now()
+        for record in records:
+            record.updated_at = now  # auto_now는 bulk_update에 적용되지 않음 (참가자 프로필 ETag)
+        AudioRecord.objects.bulk_update(records, STATS_FIELDS + ['updated_at'])
+        # bulk_update는 시그널이 없으므로 참가자 프로필/통계 스냅샷을 직접 갱신
+        refresh_after_bulk_write(
+            affected_pairs(AudioRecord.objects.filter(id__in=[record.id for record in records])), speaker=False,
+        )
+        done = updated + len(records) + failed
+        elapsed = time.time() - start
+        self.stdout.write(f"  {done}/{total} 처리 ({done / elapsed if elapsed else 0:.1f} files/sec)")
+        return len(records)
@@ -0,0 +1,32 @@
+# voice_app/management/commands/normalize_metadata.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py normalize_metadata --batch-size 500
+python manage.py normalize_metadata --category child
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from voice_app.metadata_normalizer import normalize_queryset
+from voice_app.models import AudioRecord
+
+
+class Command(BaseCommand):
+    help = "metadata_json의 이름/성별/나이/장소/기기/진단명을 AudioRecord 기본 컬럼으로 일괄 반영"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='bulk_update 배치 크기')
+        parser.add_argument('--category', help='특정 카테고리만 처리')
+
+    def handle(self, *args, **options):
+        records = AudioRecord.objects.all()
+        if options['category']:
+            records = records.filter(category=options['category'])
+
+        start = time.time()
+        scanned, updated = normalize_queryset(records, batch_size=max(1, options['batch_size']))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ {scanned}개 검사, {updated}개 갱신 ({time.time() - start:.1f}초)"
+        ))
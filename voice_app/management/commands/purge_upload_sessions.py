@@ -0,0 +1,20 @@
+# voice_app/management/commands/purge_upload_sessions.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py purge_upload_sessions --hours 24
+"""
+
+from django.core.management.base import BaseCommand
+
+from voice_app.upload_sessions import purge_stale_sessions
+
+
+class Command(BaseCommand):
+    help = "완료되지 않은 오래된 청크 업로드 세션의 임시 파일 정리"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24, help='마지막 청크 이후 경과 시간 (기본: 24)')
+
+    def handle(self, *args, **options):
+        count = purge_stale_sessions(max_age_hours=options['hours'])
+        self.stdout.write(self.style.SUCCESS(f"✅ 만료된 업로드 세션 {count}개 정리"))
@@ -0,0 +1,20 @@
+# voice_app/management/commands/rebuild_participant_profiles.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py rebuild_participant_profiles
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from voice_app.rollups import rebuild_participant_profiles
+
+
+class Command(BaseCommand):
+    help = "참가자 메타데이터 API용 ParticipantProfile 전체 재생성"
+
+    def handle(self, *args, **options):
+        start = time.time()
+        count = rebuild_participant_profiles()
+        self.stdout.write(self.style.SUCCESS(f"✅ 참가자 프로필 {count}개 갱신 ({time.time() - start:.1f}초)"))
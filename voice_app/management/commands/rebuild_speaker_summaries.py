@@ -0,0 +1,23 @@
+# voice_app/management/commands/rebuild_speaker_summaries.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py rebuild_speaker_summaries
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from voice_app.rollups import rebuild_speaker_summaries
+
+
+class Command(BaseCommand):
+    help = "identifier(화자)별 SpeakerSummary 집계 테이블 전체 재생성 (대시보드용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 배치 크기')
+
+    def handle(self, *args, **options):
+        start = time.time()
+        count = rebuild_speaker_summaries(batch_size=max(1, options['batch_size']))
+        self.stdout.write(self.style.SUCCESS(f"✅ 화자 요약 {count}개 생성 ({time.time() - start:.1f}초)"))
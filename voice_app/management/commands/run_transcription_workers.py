@@ -0,0 +1,81 @@
+# voice_app/management/commands/run_transcription_workers.py
+# -*- coding: utf-8 -*-
+"""
+python manage.py run_transcription_workers --procs 2
+"""
+
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+def _worker_main(kinds, poll_interval, once):
+    """워커 프로세스 진입점 - 프로세스당 모델을 한 번만 로드한 뒤 작업 루프 실행"""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:  # spawn 방식으로 시작된 경우
+        django.setup()
+
+    from django.conf import settings
+    from voice_app.job_queue import run_worker
+    from voice_app.model_registry import preload_models
+
+    # 전사 작업을 처리하는 워커는 시작 시 모델을 미리 로드 (프로세스당 한 번)
+    if not kinds or 'transcribe' in kinds or 'backfill' in kinds:
+        preload_models(getattr(settings, 'WHISPER_WORKER_PRELOAD_MODELS', None))
+
+    try:
+        run_worker(kinds=kinds, poll_interval=poll_interval, once=once)
+    except KeyboardInterrupt:
+        pass
+
+
+class Command(BaseCommand):
+    help = "DB 작업 큐의 전사/alignment 작업을 워커 프로세스 풀에서 처리"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--procs', type=int, default=1, help='워커 프로세스 수 (기본: 1)')
+        parser.add_argument('--kinds', nargs='+', choices=['transcribe', 'backfill', 'align'],
+                            help='처리할 작업 종류 (기본: 전체, transcribe는 backfill 포함)')
+        parser.add_argument('--poll-interval', type=float, default=2.0,
+                            help='대기열이 비었을 때 재확인 간격(초)')
+        parser.add_argument('--once', action='store_true',
+                            help='대기열이 비면 종료 (backfill/cron 용)')
+
+    def handle(self, *args, **options):
+        procs = max(1, options['procs'])
+        worker_args = (options['kinds'], options['poll_interval'], options['once'])
+
+        # fork 전에 DB 연결을 닫아 자식 프로세스가 부모 연결을 공유하지 않도록 함
+        connections.close_all()
+
+        workers = []
+        for _ in range(procs):
+            process = multiprocessing.Process(target=_worker_main, args=worker_args)
+            process.start()
+            workers.append(process)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 전사 워커 {procs}개 시작: {', '.join(str(p.pid) for p in workers)}"
+        ))
+
+        try:
+            while any(p.is_alive() for p in workers):
+                time.sleep(1)
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("워커 종료 중..."))
+            for process in workers:
+                if process.is_alive():
+                    process.terminate()
+        finally:
+            for process in workers:
+                process.join()
+
+        failed = [p.pid for p in workers if p.exitcode not in (0, None, -15)]
+        if failed:
+            self.stdout.write(self.style.ERROR(f"❌ 비정상 종료된 워커: {failed}"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ 모든 워커 종료"))
@@ -1,31 +1,95 @@
 # voice_app/management/commands/transcribe_all.py
 # -*- coding: utf-8 -*-
 """
-python manage.py transcribe_all
+python manage.py transcribe_all --batch-size 8 --io-workers 4
 """
 
 import os
-import whisper
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from voice_app.models import AudioRecord
+from voice_app.batch_transcribe import BatchTranscriber
+from voice_app.model_registry import default_model_name, get_whisper_model
+from voice_app import transcription_cache
+from voice_app.tasks import BATCH_CACHE_OPTIONS as CACHE_OPTIONS, apply_transcript, save_transcripts
 
 class Command(BaseCommand):
-    help = "Whisper로 모든 음성 파일을 일괄 전사"
+    help = "Whisper로 전사되지 않은 모든 음성 파일을 배치 단위로 일괄 전사"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', default=None, help="Whisper 모델 크기 (기본: settings.WHISPER_MODEL_NAME)")
+        parser.add_argument('--batch-size', type=int, default=8, help="한 번에 추론할 파일 수")
+        parser.add_argument('--io-workers', type=int, default=4, help="디코딩/log-mel 병렬 스레드 수")
+        parser.add_argument('--limit', type=int, default=None, help="처리할 최대 파일 수")
 
     def handle(self, *args, **options):
-        model = whisper.load_model("base")  # 필요시 'small', 'medium' 등으로 조정
-
-        for record in AudioRecord.objects.filter(transcription__isnull=True):
-            wav_path = os.path.join(settings.MEDIA_ROOT, str(record.audio_file))
-            if not os.path.exists(wav_path):
-                self.stdout.write(self.style.WARNING(f"파일 없음: {wav_path}"))
-                continue
-
-            try:
-                result = model.transcribe(wav_path, language='ko')
-                record.transcription = result['text']
-                record.save()
-                self.stdout.write(self.style.SUCCESS(f"✅ 전사 완료: {record.id}"))
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"❌ 전사 실패 ({record.id}): {e}"))
\ No newline at end of file
+        model_name = options['model'] or default_model_name()
+        model = get_whisper_model(model_name)
+
+        records = AudioRecord.objects.filter(transcript__isnull=True).only(
+            'id', 'identifier', 'category', 'audio_file', 'manual_transcript', 'status'
+        ).order_by('id')
+        if options['limit']:
+            records = records[:options['limit']]
+
+        records_by_id = {}
+        paths_by_id = {}
+        cached_records = []
+
+        def items():
+            for record in records.iterator(chunk_size=500):
+                wav_path = os.path.join(settings.MEDIA_ROOT, str(record.audio_file))
+                if not os.path.exists(wav_path):
+                    self.stdout.write(self.style.WARNING(f"파일 없음: {wav_path}"))
+                    continue
+
+                # 같은 내용의 파일을 이미 전사했으면 캐시 결과 사용
+                text = transcription_cache.get_cached(wav_path, 'transcript', model_name, 'ko', CACHE_OPTIONS)
+                if text is not None:
+                    apply_transcript(record, text)
+                    cached_records.append(record)
+                    continue
+
+                records_by_id[record.id] = record
+                paths_by_id[record.id] = wav_path
+                yield record.id, wav_path
+
+        transcriber = BatchTranscriber(
+            model,
+            batch_size=options['batch_size'],
+            io_workers=options['io_workers'],
+            language='ko',
+        )
+
+        cached_count = 0
+        for results in transcriber.run(items()):
+            updated = []
+            for record_id, text, error in results:
+                record = records_by_id.pop(record_id)
+                wav_path = paths_by_id.pop(record_id)
+                if text is None:
+                    self.stdout.write(self.style.ERROR(f"❌ 전사 실패 ({record_id}): {error}"))
+                    continue
+                transcription_cache.store(wav_path, 'transcript', model_name, text, 'ko', CACHE_OPTIONS)
+                apply_transcript(record, text)
+                updated.append(record)
+
+            updated.extend(cached_records)
+            cached_count += len(cached_records)
+            cached_records.clear()
+            save_transcripts(updated)
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ {transcriber.stats['files']}개 처리 ({transcriber.files_per_second:.2f} files/sec)"
+            ))
+
+        if cached_records:
+            cached_count += len(cached_records)
+            save_transcripts(cached_records)
+
+        stats = transcriber.stats
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: {stats['files']}개 파일, 배치 {stats['batched']}개, 30초 초과 {stats['long_files']}개, "
+            f"실패 {stats['failed']}개, 캐시 적중 {cached_count}개, "
+            f"오디오 {stats['audio_seconds']:.1f}초 / {stats['elapsed']:.1f}초 "
+            f"({transcriber.files_per_second:.2f} files/sec)"
+        ))
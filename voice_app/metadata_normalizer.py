@@ -0,0 +1,140 @@
+# voice_app/metadata_normalizer.py
+"""
+React Native 메타데이터(category_specific_data['metadata_json']) → AudioRecord 기본 컬럼 정규화
+
+목록 화면에서 매 요청마다 행별로 JSON/Base64를 디코딩하던 extract_metadata_to_fields를 대체한다.
+- 업로드 시 1회: AudioUploadView.process_upload에서 normalize_record() 호출
+- 기존 레코드: python manage.py normalize_metadata (bulk_update 일괄 처리)
+
+이미 값이 있는 컬럼은 덮어쓰지 않는다 (업로드 폼 필드가 우선).
+"""
+
+import base64
+import binascii
+import json
+import re
+
+from django.utils import timezone
+
+# 메타데이터 키 → AudioRecord 컬럼
+FIELD_MAP = {
+    'name': 'name',
+    'gender': 'gender',
+    'age': 'age',
+    'place': 'recording_location',
+    'noise': 'noise_level',
+    'device': 'device_type',
+    'mic': 'has_microphone',
+    'diagnosis': 'diagnosis',
+}
+NORMALIZED_FIELDS = list(FIELD_MAP.values())
+
+METAINFO_KEYS = ('metainfo_child', 'metainfo_senior', 'metainfo_old', 'metainfo_adult', 'metainfo')
+
+
+def decode_metadata_json(raw):
+    """
+    dict/list, JSON 문자열, (URL-safe) Base64 인코딩 JSON을 모두 처리
+
+    Returns:
+        dict 또는 list, 디코딩 실패 시 None
+    """
+    if isinstance(raw, (dict, list)):
+        return raw
+
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    # JSON이 아니면 Base64 디코딩 시도
+    clean_b64 = re.sub(r'[^A-Za-z0-9+/=_-]', '', str(raw))
+    clean_b64 = clean_b64.replace('-', '+').replace('_', '/')
+    clean_b64 += '=' * (-len(clean_b64) % 4)
+    try:
+        decoded = base64.b64decode(clean_b64, validate=False).decode('utf-8', errors='ignore')
+        return json.loads(decoded)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+
+def extract_fields(metadata):
+    """metainfo_* 블록에서 컬럼 값 추출 (먼저 나온 블록 우선)"""
+    values = {}
+    if not isinstance(metadata, dict):
+        return values
+
+    for key in METAINFO_KEYS:
+        metainfo = metadata.get(key)
+        if not isinstance(metainfo, dict):
+            continue
+        for source, field in FIELD_MAP.items():
+            value = metainfo.get(source)
+            if value and field not in values:
+                values[field] = value
+    return values
+
+
+def normalize_record(audio):
+    """
+    audio 인스턴스의 비어 있는 기본 컬럼을 metadata_json 값으로 채움 (저장은 호출한 쪽에서)
+
+    Returns:
+        list: 변경된 필드 이름
+    """
+    data = audio.category_specific_data or {}
+    if 'metadata_json' not in data:
+        return []
+
+    metadata = decode_metadata_json(data['metadata_json'])
+    if metadata is None:
+        print(f"[Metadata] Failed to decode metadata_json for audio {audio.id}")
+        return []
+
+    changed = []
+    for field, value in extract_fields(metadata).items():
+        if getattr(audio, field):
+            continue
+        max_length = audio._meta.get_field(field).max_length
+        setattr(audio, field, str(value)[:max_length] if max_length else value)
+        changed.append(field)
+    return changed
+
+
+def normalize_queryset(queryset, batch_size=500):
+    """
+    metadata_json이 있는 레코드를 일괄 정규화
+
+    Returns:
+        tuple: (검사한 레코드 수, 갱신한 레코드 수)
+    """
+    model = queryset.model
+    from .rollups import refresh_after_bulk_write
+
+    records = queryset.filter(category_specific_data__has_key='metadata_json').only(
+        'id', 'identifier', 'category', 'category_specific_data', *NORMALIZED_FIELDS
+    ).order_by('id')
+
+    def save(pending):
+        now = timezone.now()
+        for audio in pending:
+            audio.updated_at = now  # auto_now는 bulk_update에 적용되지 않음 (참가자 프로필 ETag)
+        model.objects.bulk_update(pending, NORMALIZED_FIELDS + ['updated_at'])
+        # bulk_update는 시그널이 없으므로 화자 요약(성별 등)/참가자 프로필/통계 스냅샷을 직접 갱신
+        refresh_after_bulk_write({(audio.identifier, audio.category) for audio in pending})
+
+    scanned = updated = 0
+    pending = []
+    for audio in records.iterator(chunk_size=batch_size):
+        scanned += 1
+        if normalize_record(audio):
+            pending.append(audio)
+        if len(pending) >= batch_size:
+            save(pending)
+            updated += len(pending)
+            pending = []
+
+    if pending:
+        save(pending)
+        updated += len(pending)
+    return scanned, updated
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.24 on 2026-10-18 09:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0015_copy_transcript_to_manual'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('transcribe', 'Whisper 전사'), ('align', 'WhisperX alignment')], default='transcribe', max_length=20)),
+                ('status', models.CharField(choices=[('queued', '대기 중'), ('running', '처리 중'), ('completed', '완료'), ('failed', '실패')], default='queued', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='워커가 작업을 가져간 횟수')),
+                ('worker', models.CharField(blank=True, default='', help_text='작업을 처리한 워커 (host:pid)', max_length=100)),
+                ('error', models.TextField(blank=True, default='', help_text='실패 시 오류 메시지')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('audio', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='voice_app.audiorecord')),
+            ],
+            options={
+                'verbose_name': '전사 작업',
+                'verbose_name_plural': '전사 작업들',
+                'ordering': ['created_at', 'id'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='job_status_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.24 on 2026-10-18 10:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0016_transcriptionjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('upload_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('category', models.CharField(default='normal', max_length=20)),
+                ('filename', models.CharField(help_text='클라이언트 원본 파일명', max_length=255)),
+                ('content_type', models.CharField(blank=True, default='', max_length=100)),
+                ('total_size', models.PositiveBigIntegerField(help_text='전체 파일 크기 (bytes)')),
+                ('chunk_size', models.PositiveIntegerField(help_text='청크 크기 (bytes, 마지막 청크 제외)')),
+                ('received_chunks', models.JSONField(blank=True, default=list, help_text='수신 완료된 청크 번호 목록')),
+                ('received_size', models.PositiveBigIntegerField(default=0)),
+                ('checksum', models.CharField(blank=True, default='', help_text='클라이언트가 보낸 전체 파일 SHA256', max_length=64)),
+                ('metadata', models.JSONField(blank=True, default=dict, help_text='업로드 폼 필드 (AudioUploadView와 동일한 키)')),
+                ('status', models.CharField(choices=[('uploading', '업로드 중'), ('completed', '완료'), ('failed', '실패')], default='uploading', max_length=20)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('audio', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='upload_sessions', to='voice_app.audiorecord')),
+            ],
+            options={
+                'verbose_name': '업로드 세션',
+                'verbose_name_plural': '업로드 세션들',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0017_uploadsession'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiorecord',
+            name='duration',
+            field=models.FloatField(blank=True, help_text='오디오 길이(초)', null=True),
+        ),
+    ]
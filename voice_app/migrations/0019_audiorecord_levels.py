@@ -0,0 +1,33 @@
+# Generated by Django 4.2.24 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0018_audiorecord_duration'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiorecord',
+            name='peak_dbfs',
+            field=models.FloatField(blank=True, help_text='최대 레벨 (dBFS)', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiorecord',
+            name='rms_dbfs',
+            field=models.FloatField(blank=True, help_text='평균 RMS 레벨 (dBFS)', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiorecord',
+            name='voiced_ratio',
+            field=models.FloatField(blank=True, help_text='음성 프레임 비율 (0~1)', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiorecord',
+            name='clipping_ratio',
+            field=models.FloatField(blank=True, help_text='클리핑 샘플 비율 (0~1)', null=True),
+        ),
+    ]
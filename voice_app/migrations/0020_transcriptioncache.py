@@ -0,0 +1,35 @@
+# Generated by Django 4.2.24 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0019_audiorecord_levels'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranscriptionCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='audio_sha256 + kind + 모델 설정의 SHA256', max_length=64, unique=True)),
+                ('audio_sha256', models.CharField(db_index=True, max_length=64)),
+                ('kind', models.CharField(choices=[('transcript', '전사'), ('alignment', 'Alignment')], max_length=20)),
+                ('model_name', models.CharField(max_length=100)),
+                ('language', models.CharField(blank=True, default='', max_length=10)),
+                ('options', models.JSONField(blank=True, default=dict, help_text='디코딩 옵션')),
+                ('result', models.JSONField(help_text='전사 텍스트 또는 alignment 결과')),
+                ('size_bytes', models.PositiveIntegerField(default=0, help_text='result JSON 크기 (LRU 용량 계산용)')),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': '전사 캐시',
+                'verbose_name_plural': '전사 캐시들',
+                'ordering': ['-last_used_at'],
+            },
+        ),
+    ]
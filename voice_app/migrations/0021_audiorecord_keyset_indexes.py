@@ -0,0 +1,21 @@
+# Generated by Django 4.2.24 on 2026-10-18 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0020_transcriptioncache'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(fields=['created_at', 'id'], name='audio_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(fields=['category', 'created_at', 'id'], name='audio_cat_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 4.2.24 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+def sort_columns(data):
+    """AudioRecord.save()의 sort_columns_from_category_data와 동일한 규칙"""
+    data = data if isinstance(data, dict) else {}
+
+    task_type = data.get('task_type')
+    task_type = str(task_type)[:50] if task_type not in (None, '') else None
+
+    try:
+        sentence_index = int(str(data.get('sentence_index')).strip())
+    except (TypeError, ValueError):
+        sentence_index = None
+
+    recording_date = data.get('recording_date') or data.get('recordingDate')
+    recording_date = str(recording_date)[:40] if recording_date else None
+
+    return {'task_type': task_type, 'sentence_index': sentence_index, 'recording_date': recording_date}
+
+
+def backfill_sort_columns(apps, schema_editor):
+    """category_specific_data의 task_type / sentence_index / recording_date를 컬럼으로 복사"""
+    AudioRecord = apps.get_model('voice_app', 'AudioRecord')
+    fields = ['task_type', 'sentence_index', 'recording_date']
+
+    batch = []
+    count = 0
+    for record in AudioRecord.objects.only('id', 'category_specific_data').iterator(chunk_size=2000):
+        values = sort_columns(record.category_specific_data)
+        if not any(value is not None for value in values.values()):
+            continue
+        for field, value in values.items():
+            setattr(record, field, value)
+        batch.append(record)
+        if len(batch) >= 1000:
+            AudioRecord.objects.bulk_update(batch, fields)
+            count += len(batch)
+            batch = []
+
+    if batch:
+        AudioRecord.objects.bulk_update(batch, fields)
+        count += len(batch)
+
+    print(f"[Migration] Backfilled sort columns for {count} records")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0021_audiorecord_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='audiorecord',
+            name='task_type',
+            field=models.CharField(blank=True, db_index=True, help_text='과제 유형', max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='audiorecord',
+            name='sentence_index',
+            field=models.IntegerField(blank=True, db_index=True, help_text='문장 번호', null=True),
+        ),
+        migrations.AddField(
+            model_name='audiorecord',
+            name='recording_date',
+            field=models.CharField(blank=True, db_index=True, help_text='녹음 날짜 (ISO 문자열)', max_length=40, null=True),
+        ),
+        migrations.RunPython(backfill_sort_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 4.2.24 on 2026-10-18 14:30
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+
+# rollups.summary_fields와 동일한 규칙 (마이그레이션 시점 기준으로 고정)
+CATEGORY_DATA_FIELDS = {
+    'child': ('device', 'task_type'),
+    'senior': ('education', 'task_type', 'cognitive_decline', 'job'),
+    'auditory': ('has_hearing_aid', 'native_language'),
+}
+DATA_FIELD_MAX_LENGTHS = {
+    'device': 100, 'task_type': 50, 'education': 50, 'cognitive_decline': 50,
+    'job': 100, 'has_hearing_aid': 50, 'native_language': 50,
+}
+
+
+def _text(value, max_length):
+    if value in (None, ''):
+        return None
+    return str(value)[:max_length]
+
+
+def _gender(gender):
+    if not gender:
+        return None
+    gender_lower = gender.lower().strip()
+    if gender_lower in ['남', '남자', 'male', 'm']:
+        return '남성'
+    if gender_lower in ['여', '여자', 'female', 'f']:
+        return '여성'
+    if gender_lower in ['unknown', '미상', '불명']:
+        return '미상'
+    return gender
+
+
+def build_speaker_summaries(apps, schema_editor):
+    """기존 AudioRecord로 화자 요약 생성 (마이그레이션 직후 대시보드가 비어 보이지 않도록)"""
+    AudioRecord = apps.get_model('voice_app', 'AudioRecord')
+    SpeakerSummary = apps.get_model('voice_app', 'SpeakerSummary')
+
+    records = AudioRecord.objects.exclude(identifier__isnull=True).exclude(identifier__exact='')
+    totals = {
+        row['identifier']: row
+        for row in records.values('identifier').annotate(
+            count=Count('id'), first=Min('created_at'), last=Max('created_at'),
+        ).order_by()
+    }
+
+    summaries = []
+    current = None
+    source = records.only(
+        'id', 'identifier', 'category', 'gender', 'region', 'education_level',
+        'hearing_level', 'age_in_months', 'category_specific_data', 'created_at',
+    )
+    for record in source.order_by('identifier', '-created_at', '-id').iterator(chunk_size=2000):
+        if record.identifier == current:
+            continue
+        current = record.identifier
+        row = totals[current]
+        data = record.category_specific_data if isinstance(record.category_specific_data, dict) else {}
+        fields = {name: None for name in DATA_FIELD_MAX_LENGTHS}
+        for name in CATEGORY_DATA_FIELDS.get(record.category, ()):
+            fields[name] = _text(data.get(name), DATA_FIELD_MAX_LENGTHS[name])
+        summaries.append(SpeakerSummary(
+            identifier=current,
+            category=record.category,
+            gender=_text(_gender(record.gender), 10),
+            region=record.region,
+            education_level=record.education_level,
+            hearing_level=record.hearing_level,
+            age_in_months=record.age_in_months,
+            age_group=f"{record.age_in_months // 12}세" if record.category == 'child' and record.age_in_months else None,
+            recordings_count=row['count'],
+            first_recorded_at=row['first'],
+            last_recorded_at=row['last'],
+            **fields,
+        ))
+
+    SpeakerSummary.objects.bulk_create(summaries, batch_size=1000)
+    print(f"[Migration] Built {len(summaries)} speaker summaries")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0022_audiorecord_sort_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpeakerSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('identifier', models.CharField(max_length=6, unique=True)),
+                ('category', models.CharField(db_index=True, max_length=20)),
+                ('gender', models.CharField(blank=True, help_text='정규화된 성별 (남성/여성/미상)', max_length=10, null=True)),
+                ('region', models.CharField(blank=True, max_length=20, null=True)),
+                ('education_level', models.IntegerField(blank=True, null=True)),
+                ('hearing_level', models.CharField(blank=True, max_length=30, null=True)),
+                ('age_in_months', models.IntegerField(blank=True, null=True)),
+                ('age_group', models.CharField(blank=True, help_text='아동 연령대 (N세)', max_length=10, null=True)),
+                ('device', models.CharField(blank=True, max_length=100, null=True)),
+                ('task_type', models.CharField(blank=True, max_length=50, null=True)),
+                ('education', models.CharField(blank=True, max_length=50, null=True)),
+                ('cognitive_decline', models.CharField(blank=True, max_length=50, null=True)),
+                ('job', models.CharField(blank=True, max_length=100, null=True)),
+                ('has_hearing_aid', models.CharField(blank=True, max_length=50, null=True)),
+                ('native_language', models.CharField(blank=True, max_length=50, null=True)),
+                ('recordings_count', models.PositiveIntegerField(default=0)),
+                ('first_recorded_at', models.DateTimeField(blank=True, null=True)),
+                ('last_recorded_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '화자 요약',
+                'verbose_name_plural': '화자 요약들',
+                'ordering': ['identifier'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(fields=['identifier', 'created_at'], name='audio_identifier_created_idx'),
+        ),
+        migrations.RunPython(build_speaker_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.24 on 2026-10-18 15:00
+
+from django.db import migrations, models
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0023_speakersummary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(
+                django.db.models.functions.comparison.Coalesce(
+                    django.db.models.functions.comparison.NullIf('region', models.Value('')),
+                    django.db.models.functions.comparison.NullIf(
+                        django.db.models.fields.json.KeyTextTransform('region', 'category_specific_data'),
+                        models.Value(''),
+                    ),
+                    django.db.models.functions.comparison.NullIf(
+                        django.db.models.fields.json.KeyTextTransform('place', 'category_specific_data'),
+                        models.Value(''),
+                    ),
+                ),
+                name='audio_upload_region_idx',
+            ),
+        ),
+    ]
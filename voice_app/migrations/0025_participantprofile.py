@@ -0,0 +1,119 @@
+# Generated by Django 4.2.24 on 2026-10-18 15:30
+
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def _birth_date(record):
+    try:
+        year, month, day = int(record.birth_year), int(record.birth_month), int(record.birth_day)
+    except (TypeError, ValueError):
+        return None
+    if year > 0 and month > 0 and day > 0:
+        return f"{year:04d}-{month:02d}-{day:02d}"
+    return None
+
+
+def _profile(ParticipantProfile, records, identifier, category):
+    """rollups.refresh_participant와 동일한 규칙 (마이그레이션 시점 기준으로 고정)"""
+    latest = records.order_by('-created_at', '-id').first()
+    recording_ids = list(records.order_by('-created_at', '-id').values_list('id', flat=True))
+    status_counts = dict(records.values_list('status').annotate(count=Count('id')).order_by())
+    last_modified = records.aggregate(last=Max('updated_at'))['last']
+
+    metadata = {
+        'identifier': identifier,
+        'name': latest.name,
+        'category': latest.category,
+        'gender': latest.gender,
+        'age': latest.age,
+        'age_in_months': latest.age_in_months,
+        'birth_year': latest.birth_year,
+        'birth_month': latest.birth_month,
+        'birth_day': latest.birth_day,
+        'birth_date': _birth_date(latest),
+        'total_recordings': len(recording_ids),
+        'latest_recording_date': latest.created_at.isoformat(),
+    }
+    if latest.category_specific_data:
+        metadata['category_data'] = latest.category_specific_data
+
+    statistics = {
+        'total': len(recording_ids),
+        'completed': status_counts.get('completed', 0),
+        'pending': status_counts.get('pending', 0),
+        'processing': status_counts.get('processing', 0),
+        'failed': status_counts.get('failed', 0),
+    }
+    payload = json.dumps([metadata, statistics, recording_ids, last_modified], cls=DjangoJSONEncoder, sort_keys=True)
+    return ParticipantProfile(
+        identifier=identifier,
+        category=category,
+        metadata=metadata,
+        statistics=statistics,
+        recording_ids=recording_ids,
+        etag=hashlib.sha1(payload.encode('utf-8')).hexdigest(),
+    )
+
+
+def build_participant_profiles(apps, schema_editor):
+    """기존 AudioRecord로 참가자 프로필 생성 (마이그레이션 직후 API가 404를 반환하지 않도록)"""
+    AudioRecord = apps.get_model('voice_app', 'AudioRecord')
+    ParticipantProfile = apps.get_model('voice_app', 'ParticipantProfile')
+
+    records = AudioRecord.objects.exclude(identifier__isnull=True).exclude(identifier__exact='').defer('alignment_data')
+    pairs = records.values_list('identifier', 'category').distinct().order_by('identifier', 'category')
+
+    profiles = []
+    count = 0
+    current = None
+    for identifier, category in pairs.iterator(chunk_size=2000):
+        by_identifier = records.filter(identifier=identifier)
+        if identifier != current:
+            current = identifier
+            profiles.append(_profile(ParticipantProfile, by_identifier, identifier, ''))
+        profiles.append(_profile(ParticipantProfile, by_identifier.filter(category=category), identifier, category))
+        if len(profiles) >= 500:
+            ParticipantProfile.objects.bulk_create(profiles)
+            count += len(profiles)
+            profiles = []
+    if profiles:
+        ParticipantProfile.objects.bulk_create(profiles)
+        count += len(profiles)
+    print(f"[Migration] Built {count} participant profiles")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0024_audiorecord_upload_region_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParticipantProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('identifier', models.CharField(max_length=6)),
+                ('category', models.CharField(blank=True, default='', help_text="''이면 전체 카테고리", max_length=20)),
+                ('metadata', models.JSONField(default=dict, help_text='최신 레코드 기준 메타데이터 (API data 필드)')),
+                ('statistics', models.JSONField(default=dict, help_text='상태별 녹음 수')),
+                ('recording_ids', models.JSONField(default=list, help_text='녹음 ID 목록 (최신순)')),
+                ('etag', models.CharField(help_text='응답 ETag (프로필 내용 + 녹음 갱신 시각 해시)', max_length=40)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '참가자 프로필',
+                'verbose_name_plural': '참가자 프로필들',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='participantprofile',
+            constraint=models.UniqueConstraint(fields=('identifier', 'category'), name='participant_profile_unique'),
+        ),
+        migrations.RunPython(build_participant_profiles, migrations.RunPython.noop),
+    ]
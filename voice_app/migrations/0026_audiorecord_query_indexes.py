@@ -0,0 +1,33 @@
+# Generated by Django 4.2.24 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0025_participantprofile'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(fields=['identifier', 'category', 'created_at'], name='audio_ident_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(fields=['status', 'created_at'], name='audio_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(fields=['alignment_status', 'created_at'], name='audio_align_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(condition=models.Q(('transcript__isnull', True)), fields=['id'], name='audio_untranscribed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='audiorecord',
+            index=models.Index(condition=models.Q(('snr_mean__isnull', True)), fields=['id'], name='audio_snr_missing_idx'),
+        ),
+    ]
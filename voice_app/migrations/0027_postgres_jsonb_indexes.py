@@ -0,0 +1,36 @@
+# Generated by Django 4.2.24 on 2026-10-18 17:00
+
+from django.db import migrations
+
+# PostgreSQL 전용 - SQLite에는 JSONB/GIN이 없으므로 건너뜀
+# jsonb_ops GIN: category_specific_data__has_key (metadata_normalizer) / __contains 조회
+JSONB_INDEXES = [
+    ('audio_category_data_gin', 'voice_app_audiorecord', 'category_specific_data'),
+]
+
+
+def create_jsonb_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in JSONB_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} jsonb_ops)'
+        )
+
+
+def drop_jsonb_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in JSONB_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0026_audiorecord_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_jsonb_indexes, drop_jsonb_indexes),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.24 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0027_postgres_jsonb_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transcriptionjob',
+            name='stage',
+            field=models.CharField(blank=True, choices=[('', '-'), ('load', '오디오/모델 로드'), ('asr', '음성 인식'), ('align', 'Forced alignment'), ('persist', '결과 저장')], default='', help_text='현재 처리 단계', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='transcriptionjob',
+            name='progress',
+            field=models.PositiveSmallIntegerField(default=0, help_text='진행률 (0-100)'),
+        ),
+        migrations.AddField(
+            model_name='transcriptionjob',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, help_text='워커 임대 만료 시각 - 지나도록 갱신되지 않으면 워커가 죽은 것으로 보고 다시 대기열로 보냄', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='transcriptionjob',
+            index=models.Index(fields=['status', 'lease_expires_at'], name='job_status_lease_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transcriptionjob',
+            index=models.Index(fields=['audio', 'kind', 'created_at'], name='job_audio_kind_created_idx'),
+        ),
+    ]
@@ -0,0 +1,149 @@
+# Generated by Django 4.2.24 on 2026-10-18 19:00
+
+import struct
+import sys
+from array import array
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 이 마이그레이션 시점의 'ALN1' 형식 (alignment_store가 바뀌어도 이 파일은 그대로 유지)
+HEADER = struct.Struct('<4sBxxxII')
+
+
+def _to_bytes(values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode, data):
+    values = array(typecode, data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def pack_words(word_segments):
+    """alignment_store.pack_words와 동일한 규칙 (word_segments → bytes)"""
+    starts, ends, scores = array('f'), array('f'), array('f')
+    segment_ids, word_ids, lengths = array('i'), array('i'), array('i')
+    strings = {}
+    blob = bytearray()
+
+    for word in word_segments or []:
+        starts.append(float(word.get('start') or 0))
+        ends.append(float(word.get('end') or 0))
+        scores.append(float(word.get('score') or 0))
+        segment_ids.append(int(word.get('segment_id') or 0))
+
+        text = str(word.get('word') or '')
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+            encoded = text.encode('utf-8')
+            lengths.append(len(encoded))
+            blob += encoded
+        word_ids.append(index)
+
+    flags = 1 if all(a <= b for a, b in zip(starts, starts[1:])) else 0
+    parts = [HEADER.pack(b'ALN1', flags, len(starts), len(strings))]
+    for column in (starts, ends, scores, segment_ids, word_ids, lengths):
+        parts.append(_to_bytes(column))
+    parts.append(bytes(blob))
+    return b''.join(parts)
+
+
+def unpack_words(data):
+    """pack_words() 결과 → word_segments (list of dict)"""
+    data = bytes(data)
+    _magic, _flags, n, m = HEADER.unpack_from(data, 0)
+    offset = HEADER.size
+    columns = []
+    for typecode, count in (('f', n), ('f', n), ('f', n), ('i', n), ('i', n), ('i', m)):
+        columns.append(_from_bytes(typecode, data[offset:offset + count * 4]))
+        offset += count * 4
+    starts, ends, scores, segment_ids, word_ids, lengths = columns
+
+    strings = []
+    for length in lengths:
+        strings.append(data[offset:offset + length].decode('utf-8'))
+        offset += length
+
+    return [{
+        'start': round(starts[i], 3),
+        'end': round(ends[i], 3),
+        'word': strings[word_ids[i]],
+        'score': round(scores[i], 3),
+        'segment_id': segment_ids[i],
+    } for i in range(n)]
+
+
+def pack_existing_alignments(apps, schema_editor):
+    """alignment_data['word_segments'] → WordAlignment.packed (JSON에서는 제거)"""
+    AudioRecord = apps.get_model('voice_app', 'AudioRecord')
+    WordAlignment = apps.get_model('voice_app', 'WordAlignment')
+
+    records = AudioRecord.objects.filter(alignment_data__has_key='word_segments').only('id', 'alignment_data')
+    batch, packed = [], []
+    count = 0
+    for record in records.iterator(chunk_size=200):
+        data = dict(record.alignment_data)
+        words = data.pop('word_segments') or []
+        data['word_count'] = len(words)
+        record.alignment_data = data
+        batch.append(record)
+        packed.append(WordAlignment(audio_id=record.id, packed=pack_words(words), word_count=len(words)))
+        if len(batch) >= 200:
+            WordAlignment.objects.bulk_create(packed)
+            AudioRecord.objects.bulk_update(batch, ['alignment_data'])
+            count += len(batch)
+            batch, packed = [], []
+
+    if batch:
+        WordAlignment.objects.bulk_create(packed)
+        AudioRecord.objects.bulk_update(batch, ['alignment_data'])
+        count += len(batch)
+
+    print(f"[Migration] Packed word alignments for {count} records")
+
+
+def unpack_alignments(apps, schema_editor):
+    """되돌리기: WordAlignment.packed → alignment_data['word_segments']"""
+    AudioRecord = apps.get_model('voice_app', 'AudioRecord')
+    WordAlignment = apps.get_model('voice_app', 'WordAlignment')
+
+    for alignment in WordAlignment.objects.iterator(chunk_size=200):
+        record = AudioRecord.objects.filter(id=alignment.audio_id).only('id', 'alignment_data').first()
+        if record is None:
+            continue
+        data = dict(record.alignment_data or {})
+        data.pop('word_count', None)
+        data['word_segments'] = unpack_words(alignment.packed)
+        record.alignment_data = data
+        record.save(update_fields=['alignment_data'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0028_transcriptionjob_progress_lease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordAlignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('packed', models.BinaryField(help_text='alignment_store.pack_words() 결과')),
+                ('word_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('audio', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='word_alignment', to='voice_app.audiorecord')),
+            ],
+            options={
+                'verbose_name': '단어 alignment',
+                'verbose_name_plural': '단어 alignment들',
+            },
+        ),
+        migrations.RunPython(pack_existing_alignments, unpack_alignments),
+    ]
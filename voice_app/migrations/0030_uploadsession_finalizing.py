@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-18 20:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0029_wordalignment'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadsession',
+            name='status',
+            field=models.CharField(choices=[('uploading', '업로드 중'), ('finalizing', '조립 중'), ('completed', '완료'), ('failed', '실패')], default='uploading', max_length=20),
+        ),
+    ]
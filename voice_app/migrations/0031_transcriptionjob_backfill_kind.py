@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-18 20:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0030_uploadsession_finalizing'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='transcriptionjob',
+            name='kind',
+            field=models.CharField(choices=[('transcribe', 'Whisper 전사'), ('backfill', 'Whisper 일괄 전사'), ('align', 'WhisperX alignment')], default='transcribe', max_length=20),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.24 on 2026-10-18 21:00
+
+from django.db import migrations, models
+
+
+def fail_duplicate_active_jobs(apps, schema_editor):
+    """제약 추가 전 정리: 같은 오디오/종류 묶음의 대기·처리 중 작업이 여러 개면 처리 중 또는 가장 오래된 것만 남김"""
+    TranscriptionJob = apps.get_model('voice_app', 'TranscriptionJob')
+
+    seen = set()
+    duplicates = []
+    # '-status': 같은 오디오에서 running이 queued보다 먼저 오도록
+    active = TranscriptionJob.objects.filter(status__in=['queued', 'running']).order_by(
+        'audio_id', '-status', 'created_at', 'id'
+    )
+    for job_id, audio_id, kind in active.values_list('id', 'audio_id', 'kind').iterator(chunk_size=2000):
+        group = (audio_id, 'align' if kind == 'align' else 'transcribe')
+        if group in seen:
+            duplicates.append(job_id)
+        else:
+            seen.add(group)
+
+    for offset in range(0, len(duplicates), 500):
+        TranscriptionJob.objects.filter(id__in=duplicates[offset:offset + 500]).update(
+            status='failed', error='중복 작업 (같은 오디오의 작업이 이미 대기/처리 중)', lease_expires_at=None,
+        )
+    print(f"[Migration] Failed {len(duplicates)} duplicate active jobs")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_app', '0031_transcriptionjob_backfill_kind'),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_active_jobs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='transcriptionjob',
+            constraint=models.UniqueConstraint(
+                models.F('audio'),
+                models.Case(
+                    models.When(kind='align', then=models.Value('align')),
+                    default=models.Value('transcribe'),
+                    output_field=models.CharField(),
+                ),
+                condition=models.Q(('status__in', ['queued', 'running'])),
+                name='job_one_active_per_audio_kind',
+            ),
+        ),
+    ]
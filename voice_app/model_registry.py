@@ -0,0 +1,316 @@
+# voice_app/model_registry.py
+"""
+Whisper / WhisperX 모델 관리자 (프로세스당 하나)
+
+- 모델은 (종류, 크기, 디바이스, compute_type) 키로 한 번만 로드해 모든 호출자가 공유
+  - 'whisper'        : openai-whisper 모델 (전사, VAD 배치 전사, transcribe_all)
+  - 'whisperx-asr'   : WhisperX ASR 파이프라인
+  - 'whisperx-align' : WhisperX 정렬 모델 (크기 자리에 언어 코드) → (model, metadata)
+- use_model()로 빌린 모델은 참조 수가 0이 될 때까지 내보내지 않음
+- get_model()로 받은 모델은 프로세스 수명 동안 고정 (호출자가 계속 들고 쓰므로)
+- 전체 메모리가 MODEL_MEMORY_BUDGET_MB를 넘으면 사용 중이 아닌 모델을 오래 안 쓴 순서(LRU)로 내보냄
+- loaded_models(): 로드된 모델과 메모리 사용량 (/api/status/의 models 항목)
+- torch/whisper는 실제로 모델이 필요한 시점에만 import 되므로
+  목록 페이지만 처리하는 웹 워커나 manage.py 명령은 torch를 로드하지 않음
+- 웹/전사 워커 시작 시 settings.WHISPER_PRELOAD_MODELS 로 미리 로드 가능
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# 로드 전 메모리 추정용 파라미터 수 (백만 단위) - 실제 크기는 로드 후 측정값으로 갱신
+APPROX_PARAMS_M = {
+    'tiny': 39, 'base': 74, 'small': 244, 'medium': 769,
+    'large': 1550, 'large-v1': 1550, 'large-v2': 1550, 'large-v3': 1550,
+}
+ALIGN_MODEL_PARAMS_M = 317  # wav2vec2 large 계열 정렬 모델
+BYTES_PER_PARAM = {'float32': 4, 'float16': 2, 'int8': 1}
+
+_entries = OrderedDict()  # key → _Entry (앞쪽일수록 오래 안 쓴 모델)
+_known_bytes = {}  # key → 마지막으로 측정한 크기 (다시 로드할 때 추정값으로 사용)
+_lock = threading.RLock()
+_load_locks = {}
+
+
+class _Entry:
+    def __init__(self, key, model, size_bytes, load_seconds):
+        self.key = key
+        self.model = model
+        self.size_bytes = size_bytes
+        self.load_seconds = load_seconds
+        self.refs = 0
+        self.pinned = False  # get_model()로 넘겨준 모델 - 내보내지 않음
+        self.uses = 0
+        self.loaded_at = time.time()
+        self.last_used = self.loaded_at
+
+
+def default_model_name():
+    return getattr(settings, 'WHISPER_MODEL_NAME', 'base')
+
+
+def memory_budget_bytes():
+    return int(getattr(settings, 'MODEL_MEMORY_BUDGET_MB', 6144)) * 1024 * 1024
+
+
+def default_device():
+    import torch
+    return 'cuda' if torch.cuda.is_available() else 'cpu'
+
+
+def model_key(kind, size, device=None, compute_type=''):
+    if kind == 'whisper':
+        compute_type = compute_type or 'float32'
+    return (kind, size, device or default_device(), compute_type or '')
+
+
+def _rss_bytes():
+    """현재 프로세스 RSS (Linux /proc 기준, 측정 불가 시 0)"""
+    try:
+        import os
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def _tensor_bytes(model):
+    """torch 모듈의 파라미터 + 버퍼 크기 (torch 모듈이 아니면 0)"""
+    total = 0
+    for obj in (model if isinstance(model, tuple) else (model,)):
+        if callable(getattr(obj, 'parameters', None)) and callable(getattr(obj, 'buffers', None)):
+            total += sum(p.numel() * p.element_size() for p in obj.parameters())
+            total += sum(b.numel() * b.element_size() for b in obj.buffers())
+    return total
+
+
+def estimate_bytes(key):
+    """로드 전 예상 크기"""
+    if key in _known_bytes:
+        return _known_bytes[key]
+    kind, size, _device, compute_type = key
+    params_m = ALIGN_MODEL_PARAMS_M if kind == 'whisperx-align' else APPROX_PARAMS_M.get(size, APPROX_PARAMS_M['medium'])
+    return params_m * 1_000_000 * BYTES_PER_PARAM.get(compute_type, 4)
+
+
+def _load(key):
+    kind, size, device, compute_type = key
+    if kind == 'whisper':
+        import whisper
+        return whisper.load_model(size, device=device)
+    if kind == 'whisperx-asr':
+        import whisperx
+        return whisperx.load_model(size, device, compute_type=compute_type)
+    if kind == 'whisperx-align':
+        import whisperx
+        return whisperx.load_align_model(language_code=size, device=device)
+    raise ValueError(f'Unknown model kind: {kind}')
+
+
+def _release_memory(devices):
+    import gc
+    gc.collect()
+    if 'cuda' in devices:
+        import torch
+        torch.cuda.empty_cache()
+
+
+def _evict_for(needed_bytes, keep=None):
+    """needed_bytes를 더 올릴 수 있도록 사용 중이 아닌 모델을 LRU 순서로 내보냄 (_lock 안에서 호출)"""
+    budget = memory_budget_bytes()
+    used = sum(entry.size_bytes for entry in _entries.values())
+    evicted = []
+    for key, entry in list(_entries.items()):
+        if used + needed_bytes <= budget:
+            break
+        if entry.refs > 0 or key == keep:
+            continue
+        del _entries[key]
+        used -= entry.size_bytes
+        evicted.append(key)
+        print(f"[Models] Evicted {_label(key)} ({entry.size_bytes / 1024 / 1024:.0f} MB, idle {time.time() - entry.last_used:.0f}s)")
+
+    if used + needed_bytes > budget:
+        print(f"[Models] Warning: {(used + needed_bytes) / 1024 / 1024:.0f} MB exceeds budget "
+              f"{budget / 1024 / 1024:.0f} MB (remaining models are in use)")
+    if evicted:
+        _release_memory({key[2] for key in evicted})
+    return evicted
+
+
+def _label(key):
+    kind, size, device, compute_type = key
+    return f"{kind}:{size}@{device}" + (f"/{compute_type}" if compute_type else '')
+
+
+def _get_entry(key):
+    """모델 엔트리 반환 (없으면 로드). 같은 키는 동시에 한 번만 로드."""
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            return entry
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None:
+                _entries.move_to_end(key)
+                return entry
+            _evict_for(estimate_bytes(key))
+
+        print(f"[Models] Loading {_label(key)}...")
+        start = time.time()
+        rss_before = _rss_bytes()
+        model = _load(key)
+        load_seconds = time.time() - start
+        size_bytes = _tensor_bytes(model) or max(0, _rss_bytes() - rss_before) or estimate_bytes(key)
+        print(f"[Models] Loaded {_label(key)} in {load_seconds:.2f} seconds ({size_bytes / 1024 / 1024:.0f} MB)")
+
+        with _lock:
+            entry = _Entry(key, model, size_bytes, load_seconds)
+            _entries[key] = entry
+            _known_bytes[key] = size_bytes
+            _evict_for(0, keep=key)
+            return entry
+
+
+@contextmanager
+def use_model(kind, size, device=None, compute_type=''):
+    """
+    모델을 빌려 사용 (with 블록 동안은 내보내지 않음)
+
+        with use_model('whisper', 'base') as model:
+            model.transcribe(...)
+    """
+    key = model_key(kind, size, device, compute_type)
+    while True:
+        entry = _get_entry(key)
+        with _lock:
+            # 로드와 참조 증가 사이에 다른 스레드가 내보냈으면 다시 가져옴
+            if _entries.get(key) is entry:
+                entry.refs += 1
+                entry.uses += 1
+                entry.last_used = time.time()
+                break
+    try:
+        yield entry.model
+    finally:
+        with _lock:
+            entry.refs -= 1
+            entry.last_used = time.time()
+
+
+def get_model(kind, size, device=None, compute_type=''):
+    """
+    모델 반환 - 프로세스 수명 동안 계속 쓰는 호출자용 (배치 명령, 워커 미리 로드 등).
+    반환한 모델은 고정(pinned)되어 예산을 넘어도 내보내지 않는다 (사용 중 내보내고 다시 로드하는 일 방지).
+    잠깐 쓰고 돌려줄 때는 use_model()을 사용. 로드 실패 시 예외를 그대로 전달한다.
+    """
+    key = model_key(kind, size, device, compute_type)
+    while True:
+        entry = _get_entry(key)
+        with _lock:
+            if _entries.get(key) is entry:
+                if not entry.pinned:
+                    entry.pinned = True
+                    entry.refs += 1  # 프로세스 수명 동안 놓지 않는 참조
+                entry.uses += 1
+                entry.last_used = time.time()
+                return entry.model
+
+
+def load_model(kind, size, device=None, compute_type=''):
+    """모델을 로드만 해 둠 (참조/고정 없음 - 미리 로드용, 예산을 넘으면 내보낼 수 있음)"""
+    _get_entry(model_key(kind, size, device, compute_type))
+
+
+def get_whisper_model(name=None):
+    """Whisper 모델 반환 (프로세스당 한 번만 로드)"""
+    return get_model('whisper', name or default_model_name())
+
+
+def use_whisper_model(name=None):
+    return use_model('whisper', name or default_model_name())
+
+
+def reserve(kind, size, size_bytes, device='cpu', compute_type=''):
+    """
+    이 프로세스 밖(자식 프로세스 풀 등)에서 쓰는 모델 메모리를 예산에 등록.
+    release()까지 내보내지 않으며, 등록 전에 예산을 넘는 만큼 사용 중이 아닌 모델을 내보낸다.
+    """
+    key = (kind, size, device, compute_type)
+    with _lock:
+        release(key)
+        _evict_for(size_bytes)
+        entry = _Entry(key, None, size_bytes, 0.0)
+        entry.refs = 1
+        _entries[key] = entry
+        print(f"[Models] Reserved {_label(key)} ({size_bytes / 1024 / 1024:.0f} MB)")
+    return key
+
+
+def release(key):
+    """reserve()로 등록한 메모리 해제"""
+    with _lock:
+        if key in _entries and _entries[key].model is None:
+            del _entries[key]
+
+
+def unload(kind=None):
+    """사용 중이 아닌 모델 내보내기 (kind 지정 시 해당 종류만). 내보낸 수 반환."""
+    with _lock:
+        keys = [key for key, entry in _entries.items() if entry.refs == 0 and (kind is None or key[0] == kind)]
+        for key in keys:
+            del _entries[key]
+    if keys:
+        _release_memory({key[2] for key in keys})
+    return len(keys)
+
+
+def is_loaded(name=None, kind='whisper'):
+    name = name or default_model_name()
+    return any(key[0] == kind and key[1] == name for key in list(_entries))
+
+
+def loaded_models():
+    """로드된 모델 목록과 메모리 사용량 (점검용)"""
+    now = time.time()
+    with _lock:
+        models = [{
+            'kind': entry.key[0],
+            'size': entry.key[1],
+            'device': entry.key[2],
+            'compute_type': entry.key[3],
+            'memory_mb': round(entry.size_bytes / 1024 / 1024, 1),
+            'refs': entry.refs,
+            'pinned': entry.pinned,
+            'uses': entry.uses,
+            'load_seconds': round(entry.load_seconds, 2),
+            'idle_seconds': round(now - entry.last_used, 1),
+        } for entry in _entries.values()]
+    return {
+        'budget_mb': round(memory_budget_bytes() / 1024 / 1024),
+        'used_mb': round(sum(m['memory_mb'] for m in models), 1),
+        'models': models,
+    }
+
+
+def preload_models(names=None):
+    """
+    지정한 Whisper 모델들을 미리 로드 (기본값: settings.WHISPER_PRELOAD_MODELS).
+    실패해도 프로세스 시작을 막지 않고 첫 사용 시 다시 시도한다.
+    """
+    if names is None:
+        names = getattr(settings, 'WHISPER_PRELOAD_MODELS', [])
+
+    for name in names:
+        try:
+            load_model('whisper', name)
+        except Exception as e:
+            print(f"[Whisper Error] Failed to preload model '{name}': {e}")
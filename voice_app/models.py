@@ -1,13 +1,52 @@
 from django.db import models
+from django.db.models import Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Coalesce, NullIf
 from django.core.validators import RegexValidator
 from django.utils import timezone
 import json
+import math
+import uuid
 
 def category_upload_path(instance, filename):
     """카테고리별로 파일 저장 경로를 결정하는 함수"""
     category = instance.category or 'normal'
     return f'audio/{category}/{filename}'
 
+def upload_region_expression():
+    """
+    업로드 지역: region 컬럼 → category_specific_data['region'] → category_specific_data['place'] 순 첫 값.
+    사용자 프로필 지역 집계와 표현식 인덱스(audio_upload_region_idx)가 같은 식을 사용해야 인덱스가 쓰인다.
+    """
+    return Coalesce(
+        NullIf('region', Value('')),
+        NullIf(KeyTextTransform('region', 'category_specific_data'), Value('')),
+        NullIf(KeyTextTransform('place', 'category_specific_data'), Value('')),
+    )
+
+
+# category_specific_data 키 → 정렬용 컬럼 (AudioRecord.save()에서 동기화)
+SORT_COLUMN_KEYS = ('task_type', 'sentence_index', 'recording_date')
+
+
+def sort_columns_from_category_data(data):
+    """category_specific_data에서 task_type / sentence_index / recording_date 컬럼 값 추출"""
+    data = data if isinstance(data, dict) else {}
+
+    task_type = data.get('task_type')
+    task_type = str(task_type)[:50] if task_type not in (None, '') else None
+
+    try:
+        sentence_index = int(str(data.get('sentence_index')).strip())
+    except (TypeError, ValueError):
+        sentence_index = None
+
+    recording_date = data.get('recording_date') or data.get('recordingDate')
+    recording_date = str(recording_date)[:40] if recording_date else None
+
+    return {'task_type': task_type, 'sentence_index': sentence_index, 'recording_date': recording_date}
+
+
 class AudioRecord(models.Model):
     identifier_validator = RegexValidator(
         regex=r'^[CSA]\d{5}$',
@@ -52,6 +91,11 @@ class AudioRecord(models.Model):
     education_level = models.IntegerField(null=True, blank=True, help_text='총 교육년수 (Senior/Auditory)', db_index=True)
     hearing_level = models.CharField(max_length=30, null=True, blank=True, help_text='청력 수준 (Auditory)', db_index=True)
     age_in_months = models.IntegerField(null=True, blank=True, help_text='나이(개월) (Child/Auditory)')
+
+    # 목록 정렬/필터용으로 category_specific_data에서 승격한 컬럼 (save()에서 자동 동기화)
+    task_type = models.CharField(max_length=50, null=True, blank=True, help_text='과제 유형', db_index=True)
+    sentence_index = models.IntegerField(null=True, blank=True, help_text='문장 번호', db_index=True)
+    recording_date = models.CharField(max_length=40, null=True, blank=True, help_text='녹음 날짜 (ISO 문자열)', db_index=True)
     
     # 카테고리별 특화 데이터를 저장하는 JSON 필드
     category_specific_data = models.JSONField(default=dict, blank=True, help_text='카테고리별 특화 데이터')
@@ -65,6 +109,11 @@ class AudioRecord(models.Model):
     snr_mean = models.FloatField(null=True, blank=True, help_text='평균 SNR 값')
     snr_max = models.FloatField(null=True, blank=True, help_text='최대 SNR 값')
     snr_min = models.FloatField(null=True, blank=True, help_text='최소 SNR 값')
+    duration = models.FloatField(null=True, blank=True, help_text='오디오 길이(초)')
+    peak_dbfs = models.FloatField(null=True, blank=True, help_text='최대 레벨 (dBFS)')
+    rms_dbfs = models.FloatField(null=True, blank=True, help_text='평균 RMS 레벨 (dBFS)')
+    voiced_ratio = models.FloatField(null=True, blank=True, help_text='음성 프레임 비율 (0~1)')
+    clipping_ratio = models.FloatField(null=True, blank=True, help_text='클리핑 샘플 비율 (0~1)')
     
     status = models.CharField(
         max_length=20,
@@ -101,7 +150,7 @@ class AudioRecord(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     def save(self, *args, **kwargs):
-        """저장 시 나이 자동 계산"""
+        """저장 시 나이 자동 계산 + category_specific_data 정렬 컬럼 동기화"""
         if self.birth_year:
             try:
                 current_year = timezone.now().year
@@ -109,6 +158,12 @@ class AudioRecord(models.Model):
                 self.age = str(current_year - birth_year)
             except (ValueError, TypeError):
                 pass
+
+        for field, value in sort_columns_from_category_data(self.category_specific_data).items():
+            setattr(self, field, value)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'category_specific_data' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | set(SORT_COLUMN_KEYS)
         super().save(*args, **kwargs)
 
     # 카테고리별 특화 데이터 접근 메서드들
@@ -598,6 +653,16 @@ class AudioRecord(models.Model):
         if self.snr_min is not None:
             metadata['SNR 최소'] = f"{self.snr_min:.2f} dB"
         
+        # 오디오 레벨 정보
+        if self.duration is not None:
+            metadata['길이'] = f"{self.duration:.2f}초"
+        if self.rms_dbfs is not None:
+            metadata['평균 레벨'] = f"{self.rms_dbfs:.1f} dBFS (최대 {self.peak_dbfs:.1f} dBFS)"
+        if self.voiced_ratio is not None:
+            metadata['음성 구간 비율'] = f"{self.voiced_ratio * 100:.1f}%"
+        if self.clipping_ratio:
+            metadata['클리핑 비율'] = f"{self.clipping_ratio * 100:.3f}%"
+        
         return metadata
 
     def get_formatted_category_data(self):
@@ -657,3 +722,257 @@ class AudioRecord(models.Model):
         verbose_name = '음성 레코드'
         verbose_name_plural = '음성 레코드들'
         ordering = ['-created_at']
+        indexes = [
+            # 목록 API keyset 페이지네이션 (voice_app/pagination.py)
+            models.Index(fields=['created_at', 'id'], name='audio_created_id_idx'),
+            models.Index(fields=['category', 'created_at', 'id'], name='audio_cat_created_id_idx'),
+            # 화자별 최신 레코드 / 녹음 수 (SpeakerSummary 갱신, identifier_audio_list, audio_list?identifier=)
+            models.Index(fields=['identifier', 'created_at'], name='audio_identifier_created_idx'),
+            # 카테고리별 참가자 프로필 갱신 / 참가자 API
+            models.Index(fields=['identifier', 'category', 'created_at'], name='audio_ident_cat_created_idx'),
+            # 상태별 조회 (reset_processing_status, 대시보드 상태 통계)
+            models.Index(fields=['status', 'created_at'], name='audio_status_created_idx'),
+            models.Index(fields=['alignment_status', 'created_at'], name='audio_align_status_idx'),
+            # 전사 / SNR backfill 대상 (부분 인덱스 - 처리가 끝난 행은 인덱스에 없음)
+            models.Index(fields=['id'], condition=models.Q(transcript__isnull=True), name='audio_untranscribed_idx'),
+            models.Index(fields=['id'], condition=models.Q(snr_mean__isnull=True), name='audio_snr_missing_idx'),
+            # 사용자 프로필 업로드 지역 집계 (JSON 키 추출 표현식 인덱스)
+            models.Index(upload_region_expression(), name='audio_upload_region_idx'),
+        ]
+
+
+class TranscriptionJob(models.Model):
+    """Whisper 전사 / WhisperX alignment 작업 큐 (DB 기반, run_transcription_workers가 처리)"""
+
+    KIND_CHOICES = [
+        ('transcribe', 'Whisper 전사'),
+        ('backfill', 'Whisper 일괄 전사'),  # 미전사 일괄 등록 - 워커가 여러 개를 모아 배치로 전사
+        ('align', 'WhisperX alignment'),
+    ]
+
+    STATUS_CHOICES = [
+        ('queued', '대기 중'),
+        ('running', '처리 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+
+    STAGE_CHOICES = [
+        ('', '-'),
+        ('load', '오디오/모델 로드'),
+        ('asr', '음성 인식'),
+        ('align', 'Forced alignment'),
+        ('persist', '결과 저장'),
+    ]
+
+    audio = models.ForeignKey(AudioRecord, on_delete=models.CASCADE, related_name='jobs')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='transcribe')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0, help_text='워커가 작업을 가져간 횟수')
+    worker = models.CharField(max_length=100, blank=True, default='', help_text='작업을 처리한 워커 (host:pid)')
+    error = models.TextField(blank=True, default='', help_text='실패 시 오류 메시지')
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES, blank=True, default='', help_text='현재 처리 단계')
+    progress = models.PositiveSmallIntegerField(default=0, help_text='진행률 (0-100)')
+    lease_expires_at = models.DateTimeField(
+        null=True, blank=True,
+        help_text='워커 임대 만료 시각 - 지나도록 갱신되지 않으면 워커가 죽은 것으로 보고 다시 대기열로 보냄',
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.id} (audio {self.audio_id}) - {self.get_status_display()}"
+
+    class Meta:
+        verbose_name = '전사 작업'
+        verbose_name_plural = '전사 작업들'
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='job_status_created_idx'),
+            models.Index(fields=['status', 'lease_expires_at'], name='job_status_lease_idx'),
+            models.Index(fields=['audio', 'kind', 'created_at'], name='job_audio_kind_created_idx'),
+        ]
+        constraints = [
+            # 오디오당 대기/처리 중 작업은 종류 묶음(전사+backfill / align)별로 하나만 (job_queue.enqueue_job)
+            models.UniqueConstraint(
+                'audio',
+                models.Case(
+                    models.When(kind='align', then=Value('align')),
+                    default=Value('transcribe'),
+                    output_field=models.CharField(),
+                ),
+                condition=models.Q(status__in=['queued', 'running']),
+                name='job_one_active_per_audio_kind',
+            ),
+        ]
+
+
+class UploadSession(models.Model):
+    """재개 가능한 청크 업로드 세션 (모바일 앱용, voice_app/upload_sessions.py 참고)"""
+
+    STATUS_CHOICES = [
+        ('uploading', '업로드 중'),
+        ('finalizing', '조립 중'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+
+    upload_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    category = models.CharField(max_length=20, default='normal')
+    filename = models.CharField(max_length=255, help_text='클라이언트 원본 파일명')
+    content_type = models.CharField(max_length=100, blank=True, default='')
+    total_size = models.PositiveBigIntegerField(help_text='전체 파일 크기 (bytes)')
+    chunk_size = models.PositiveIntegerField(help_text='청크 크기 (bytes, 마지막 청크 제외)')
+    received_chunks = models.JSONField(default=list, blank=True, help_text='수신 완료된 청크 번호 목록')
+    received_size = models.PositiveBigIntegerField(default=0)
+    checksum = models.CharField(max_length=64, blank=True, default='', help_text='클라이언트가 보낸 전체 파일 SHA256')
+    metadata = models.JSONField(default=dict, blank=True, help_text='업로드 폼 필드 (AudioUploadView와 동일한 키)')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='uploading')
+    audio = models.ForeignKey(AudioRecord, on_delete=models.SET_NULL, null=True, blank=True, related_name='upload_sessions')
+    error = models.TextField(blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    @property
+    def chunk_count(self):
+        return max(1, math.ceil(self.total_size / self.chunk_size))
+
+    def expected_chunk_length(self, index):
+        """index번째 청크의 크기 (마지막 청크는 나머지 크기)"""
+        if index == self.chunk_count - 1:
+            return self.total_size - self.chunk_size * index
+        return self.chunk_size
+
+    def missing_chunks(self):
+        received = set(self.received_chunks)
+        return [i for i in range(self.chunk_count) if i not in received]
+
+    def __str__(self):
+        return f"{self.filename} ({self.upload_id}) - {self.get_status_display()}"
+
+    class Meta:
+        verbose_name = '업로드 세션'
+        verbose_name_plural = '업로드 세션들'
+        ordering = ['-created_at']
+
+
+class TranscriptionCache(models.Model):
+    """
+    오디오 내용(SHA256) + 모델 설정 기준 전사/alignment 결과 캐시 (voice_app/transcription_cache.py 참고)
+    같은 파일의 재업로드/재시도에서는 Whisper를 다시 실행하지 않는다.
+    """
+
+    KIND_CHOICES = [
+        ('transcript', '전사'),
+        ('alignment', 'Alignment'),
+    ]
+
+    key = models.CharField(max_length=64, unique=True, help_text='audio_sha256 + kind + 모델 설정의 SHA256')
+    audio_sha256 = models.CharField(max_length=64, db_index=True)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    model_name = models.CharField(max_length=100)
+    language = models.CharField(max_length=10, blank=True, default='')
+    options = models.JSONField(default=dict, blank=True, help_text='디코딩 옵션')
+    result = models.JSONField(help_text='전사 텍스트 또는 alignment 결과')
+    size_bytes = models.PositiveIntegerField(default=0, help_text='result JSON 크기 (LRU 용량 계산용)')
+    hit_count = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.audio_sha256[:12]} ({self.model_name}/{self.language})"
+
+    class Meta:
+        verbose_name = '전사 캐시'
+        verbose_name_plural = '전사 캐시들'
+        ordering = ['-last_used_at']
+
+
+class SpeakerSummary(models.Model):
+    """
+    identifier(화자)별 집계 테이블 - 대시보드용 (voice_app/rollups.py 참고)
+    AudioRecord 저장/삭제 시그널로 갱신되며, rebuild_speaker_summaries 명령으로 전체 재계산한다.
+    화자 정보는 해당 identifier의 가장 최근 레코드 기준.
+    """
+
+    identifier = models.CharField(max_length=6, unique=True)
+    category = models.CharField(max_length=20, db_index=True)
+    gender = models.CharField(max_length=10, null=True, blank=True, help_text='정규화된 성별 (남성/여성/미상)')
+    region = models.CharField(max_length=20, null=True, blank=True)
+    education_level = models.IntegerField(null=True, blank=True)
+    hearing_level = models.CharField(max_length=30, null=True, blank=True)
+    age_in_months = models.IntegerField(null=True, blank=True)
+    age_group = models.CharField(max_length=10, null=True, blank=True, help_text='아동 연령대 (N세)')
+
+    # category_specific_data에서 가져온 대시보드 분류 값
+    device = models.CharField(max_length=100, null=True, blank=True)
+    task_type = models.CharField(max_length=50, null=True, blank=True)
+    education = models.CharField(max_length=50, null=True, blank=True)
+    cognitive_decline = models.CharField(max_length=50, null=True, blank=True)
+    job = models.CharField(max_length=100, null=True, blank=True)
+    has_hearing_aid = models.CharField(max_length=50, null=True, blank=True)
+    native_language = models.CharField(max_length=50, null=True, blank=True)
+
+    recordings_count = models.PositiveIntegerField(default=0)
+    first_recorded_at = models.DateTimeField(null=True, blank=True)
+    last_recorded_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.identifier} ({self.category}, {self.recordings_count}개)"
+
+    class Meta:
+        verbose_name = '화자 요약'
+        verbose_name_plural = '화자 요약들'
+        ordering = ['identifier']
+
+
+class ParticipantProfile(models.Model):
+    """
+    참가자 메타데이터 API용 materialized 프로필 (voice_app/rollups.py 참고)
+    category가 ''이면 전체 카테고리 기준 (/api/child/participant/{id}/), 아니면 해당 카테고리 기준.
+    AudioRecord 저장/삭제 시그널로 갱신된다.
+    """
+
+    identifier = models.CharField(max_length=6)
+    category = models.CharField(max_length=20, blank=True, default='', help_text="''이면 전체 카테고리")
+    metadata = models.JSONField(default=dict, help_text='최신 레코드 기준 메타데이터 (API data 필드)')
+    statistics = models.JSONField(default=dict, help_text='상태별 녹음 수')
+    recording_ids = models.JSONField(default=list, help_text='녹음 ID 목록 (최신순)')
+    etag = models.CharField(max_length=40, help_text='응답 ETag (프로필 내용 + 녹음 갱신 시각 해시)')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.identifier} ({self.category or '전체'})"
+
+    class Meta:
+        verbose_name = '참가자 프로필'
+        verbose_name_plural = '참가자 프로필들'
+        constraints = [
+            models.UniqueConstraint(fields=['identifier', 'category'], name='participant_profile_unique'),
+        ]
+
+
+class WordAlignment(models.Model):
+    """
+    단어 단위 alignment (voice_app/alignment_store.py 참고)
+    word_segments를 float32/int32 열 배열 + 문자열 테이블로 압축 저장하고,
+    AudioRecord.alignment_data(JSON)에는 segments / transcription만 남긴다.
+    """
+
+    audio = models.OneToOneField(AudioRecord, on_delete=models.CASCADE, related_name='word_alignment')
+    packed = models.BinaryField(help_text='alignment_store.pack_words() 결과')
+    word_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"audio {self.audio_id} ({self.word_count} words)"
+
+    class Meta:
+        verbose_name = '단어 alignment'
+        verbose_name_plural = '단어 alignment들'
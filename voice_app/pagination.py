@@ -0,0 +1,119 @@
+# voice_app/pagination.py
+"""
+(created_at, id) 기준 keyset(cursor) 페이지네이션
+
+- OFFSET 없이 마지막 행의 (created_at, id) 다음부터 읽으므로 테이블 크기와 무관하게
+  페이지당 인덱스 범위 스캔 한 번으로 처리 (audio_created_id_idx / audio_cat_created_id_idx)
+- 커서는 base64url로 인코딩한 [created_at, id] (클라이언트는 내용을 해석하지 않고 그대로 전달)
+- 행은 .values()로 읽어 모델 인스턴스를 만들지 않음
+
+응답 형식:
+    {"count": <이 페이지 행 수>, "results": [...], "next_cursor": "..." 또는 null, "has_more": bool}
+"""
+
+import base64
+import json
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+LIST_FIELDS = (
+    'id', 'audio_file', 'category', 'gender', 'age', 'transcript', 'manual_transcript',
+    'status', 'snr_mean', 'snr_max', 'snr_min', 'created_at',
+)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at, pk):
+    raw = json.dumps([created_at.isoformat(), pk], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, pk = json.loads(raw)
+        created_at = parse_datetime(created_at)
+        if created_at is None:
+            raise ValueError
+        return created_at, int(pk)
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise InvalidCursor('유효하지 않은 cursor입니다.')
+
+
+def page_limit(value):
+    """?limit 값을 기본값/최대값 범위로 보정"""
+    default = getattr(settings, 'API_PAGE_SIZE', 50)
+    maximum = getattr(settings, 'API_MAX_PAGE_SIZE', 200)
+    try:
+        limit = int(value) if value not in (None, '') else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, maximum))
+
+
+def keyset_page(queryset, cursor=None, limit=None, fields=LIST_FIELDS):
+    """
+    created_at, id 내림차순(최신순) 한 페이지
+
+    Returns:
+        tuple: (행 dict 리스트, next_cursor 또는 None)
+    """
+    limit = page_limit(limit)
+    queryset = queryset.order_by('-created_at', '-id')
+
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+    # limit + 1개를 읽어 다음 페이지 존재 여부 확인
+    rows = list(queryset.values(*fields)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = encode_cursor(rows[-1]['created_at'], rows[-1]['id']) if has_more else None
+    return rows, next_cursor
+
+
+def serialize_audio_row(row):
+    """AudioRecord .values() 행 → 목록 API 항목 (기존 응답 키 유지)"""
+    audio_file = row['audio_file']
+    return {
+        'id': row['id'],
+        'audio_file': default_storage.url(audio_file) if audio_file else None,
+        'category': row['category'],
+        'gender': row['gender'],
+        'age': row['age'],
+        'transcript': row['manual_transcript'] or row['transcript'],  # 수동 전사 우선, 없으면 자동 전사
+        'status': row['status'],
+        'snr_mean': row['snr_mean'],
+        'snr_max': row['snr_max'],
+        'snr_min': row['snr_min'],
+        'created_at': row['created_at'].isoformat(),
+        'detail_url': f"/audio/{row['id']}/",
+        'web_detail_url': f"http://210.125.101.159:8001/audio/{row['id']}/",
+    }
+
+
+def audio_list_page(queryset, params):
+    """
+    ?cursor=&limit= 파라미터로 오디오 목록 한 페이지 응답 데이터 생성
+
+    Raises:
+        InvalidCursor: cursor 디코딩 실패
+    """
+    limit = page_limit(params.get('limit'))
+    rows, next_cursor = keyset_page(queryset, params.get('cursor'), limit)
+    results = [serialize_audio_row(row) for row in rows]
+    return {
+        'count': len(results),
+        'limit': limit,
+        'results': results,
+        'next_cursor': next_cursor,
+        'has_more': next_cursor is not None,
+    }
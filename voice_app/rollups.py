@@ -0,0 +1,291 @@
+# voice_app/rollups.py
+"""
+화자(identifier)별 집계 테이블
+
+SpeakerSummary (대시보드)
+- refresh_speaker(identifier): 한 화자만 다시 계산 (업로드/수정/삭제 시그널에서 호출, voice_app/signals.py)
+- rebuild_speaker_summaries(): 전체 재계산 (python manage.py rebuild_speaker_summaries)
+
+ParticipantProfile (참가자 메타데이터 API)
+- refresh_participant(identifier, category): 전체('') / 카테고리별 프로필 갱신 (시그널에서 호출)
+- rebuild_participant_profiles(): 전체 재계산 (python manage.py rebuild_participant_profiles)
+
+일괄 쓰기 (bulk_update / QuerySet.update)는 post_save 시그널이 없으므로
+쓰기 후 refresh_after_bulk_write(affected_pairs(...))를 직접 호출한다.
+
+화자 정보는 해당 identifier의 가장 최근 레코드 기준 (AudioRecord 기본 정렬 -created_at).
+"""
+
+import hashlib
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q
+from django.utils import timezone
+
+# category_specific_data 키 → SpeakerSummary 필드 (카테고리별로 대시보드에서 쓰는 값만)
+CATEGORY_DATA_FIELDS = {
+    'child': ('device', 'task_type'),
+    'senior': ('education', 'task_type', 'cognitive_decline', 'job'),
+    'auditory': ('has_hearing_aid', 'native_language'),
+}
+
+# AudioRecord에서 요약을 만들 때 읽는 컬럼
+SOURCE_FIELDS = (
+    'id', 'identifier', 'category', 'gender', 'region', 'education_level',
+    'hearing_level', 'age_in_months', 'category_specific_data', 'created_at',
+)
+
+# 참가자 프로필을 만들 때 최신 레코드에서 읽는 컬럼 / 상태별 개수 (statistics 키 순서)
+PROFILE_SOURCE_FIELDS = (
+    'id', 'identifier', 'name', 'category', 'gender', 'age', 'age_in_months',
+    'birth_year', 'birth_month', 'birth_day', 'category_specific_data', 'created_at',
+)
+PROFILE_STATUSES = ('completed', 'pending', 'processing', 'failed')
+
+
+def normalize_gender(gender):
+    """다양한 형식의 성별 데이터를 통일된 형식으로 변환"""
+    if not gender:
+        return None
+    gender_lower = gender.lower().strip()
+    if gender_lower in ['남', '남자', 'male', 'm']:
+        return '남성'
+    elif gender_lower in ['여', '여자', 'female', 'f']:
+        return '여성'
+    elif gender_lower in ['unknown', '미상', '불명']:
+        return '미상'
+    return gender  # 그 외의 경우 원본 반환
+
+
+def _text(value, max_length):
+    if value in (None, ''):
+        return None
+    return str(value)[:max_length]
+
+
+def summary_fields(record):
+    """최신 AudioRecord 한 건 → SpeakerSummary 필드 dict (녹음 수/기간 제외)"""
+    from .models import SpeakerSummary
+
+    data = record.category_specific_data or {}
+    fields = {
+        'category': record.category,
+        'gender': _text(normalize_gender(record.gender), 10),
+        'region': record.region,
+        'education_level': record.education_level,
+        'hearing_level': record.hearing_level,
+        'age_in_months': record.age_in_months,
+        'age_group': None,
+    }
+    if record.category == 'child' and record.age_in_months:
+        fields['age_group'] = f"{record.age_in_months // 12}세"
+
+    for name in ('device', 'task_type', 'education', 'cognitive_decline', 'job', 'has_hearing_aid', 'native_language'):
+        fields[name] = None
+    for name in CATEGORY_DATA_FIELDS.get(record.category, ()):
+        fields[name] = _text(data.get(name), SpeakerSummary._meta.get_field(name).max_length)
+    return fields
+
+
+def refresh_speaker(identifier):
+    """한 화자의 요약을 다시 계산 (레코드가 없으면 요약 삭제)"""
+    from .models import AudioRecord, SpeakerSummary
+
+    if not identifier:
+        return None
+
+    records = AudioRecord.objects.filter(identifier=identifier)
+    latest = records.only(*SOURCE_FIELDS).order_by('-created_at', '-id').first()
+    if latest is None:
+        SpeakerSummary.objects.filter(identifier=identifier).delete()
+        return None
+
+    totals = records.aggregate(count=Count('id'), first=Min('created_at'), last=Max('created_at'))
+    summary, _ = SpeakerSummary.objects.update_or_create(
+        identifier=identifier,
+        defaults={
+            **summary_fields(latest),
+            'recordings_count': totals['count'],
+            'first_recorded_at': totals['first'],
+            'last_recorded_at': totals['last'],
+        },
+    )
+    return summary
+
+
+def affected_pairs(queryset):
+    """일괄 쓰기 대상 레코드들의 {(identifier, category)} (identifier 없는 레코드 제외)"""
+    return set(
+        queryset.exclude(identifier__isnull=True).exclude(identifier__exact='')
+        .order_by().values_list('identifier', 'category').distinct()
+    )
+
+
+def refresh_after_bulk_write(pairs, speaker=True):
+    """
+    bulk_update / QuerySet.update 후 요약/참가자 프로필 갱신 + 통계 스냅샷 무효화 (시그널 대신)
+    참가자 프로필 ETag에 녹음 수정 시각이 들어가므로 쓰기에서 updated_at도 함께 갱신해야 한다.
+
+    Args:
+        pairs: affected_pairs() 결과
+        speaker: 화자 요약에 쓰이는 필드(SUMMARY_SOURCE_FIELDS)가 바뀐 경우만 True
+
+    Returns:
+        int: 갱신한 화자 수
+    """
+    from . import stats_cache
+
+    pairs = {(identifier, category) for identifier, category in pairs if identifier}
+    identifiers = {identifier for identifier, _ in pairs}
+    for identifier in identifiers:
+        if speaker:
+            refresh_speaker(identifier)
+        refresh_participant(identifier)
+    for identifier, category in pairs:
+        refresh_participant(identifier, category)
+    stats_cache.invalidate()
+    return len(identifiers)
+
+
+def rebuild_speaker_summaries(batch_size=1000):
+    """
+    모든 화자 요약을 다시 만듦 (레코드를 identifier, 최신순으로 한 번만 순회)
+
+    Returns:
+        int: 생성된 요약 수
+    """
+    from .models import AudioRecord, SpeakerSummary
+
+    records = AudioRecord.objects.exclude(identifier__isnull=True).exclude(identifier__exact='')
+    totals = {
+        row['identifier']: row
+        for row in records.values('identifier').annotate(
+            count=Count('id'), first=Min('created_at'), last=Max('created_at'),
+        ).order_by()
+    }
+
+    summaries = []
+    current = None
+    for record in records.only(*SOURCE_FIELDS).order_by('identifier', '-created_at', '-id').iterator(chunk_size=2000):
+        if record.identifier == current:
+            continue
+        current = record.identifier
+        row = totals[current]
+        summaries.append(SpeakerSummary(
+            identifier=current,
+            recordings_count=row['count'],
+            first_recorded_at=row['first'],
+            last_recorded_at=row['last'],
+            **summary_fields(record),
+        ))
+
+    with transaction.atomic():
+        SpeakerSummary.objects.all().delete()
+        SpeakerSummary.objects.bulk_create(summaries, batch_size=batch_size)
+    return len(summaries)
+
+
+def _birth_date(record):
+    """birth_year / birth_month / birth_day → YYYY-MM-DD (불완전하면 None)"""
+    try:
+        year, month, day = int(record.birth_year), int(record.birth_month), int(record.birth_day)
+    except (TypeError, ValueError):
+        return None
+    if year > 0 and month > 0 and day > 0:
+        return f"{year:04d}-{month:02d}-{day:02d}"
+    return None
+
+
+def refresh_participant(identifier, category=''):
+    """
+    참가자 프로필 갱신 (category=''이면 전체 카테고리 기준). 레코드가 없으면 프로필 삭제.
+    """
+    from .models import AudioRecord, ParticipantProfile
+
+    if not identifier:
+        return None
+
+    records = AudioRecord.objects.filter(identifier=identifier)
+    if category:
+        records = records.filter(category=category)
+
+    # 프로필에 쓰는 컬럼만 읽음 (alignment_data 등 큰 컬럼 제외)
+    latest = records.only(*PROFILE_SOURCE_FIELDS).order_by('-created_at', '-id').first()
+    if latest is None:
+        ParticipantProfile.objects.filter(identifier=identifier, category=category).delete()
+        return None
+
+    recording_ids = list(records.order_by('-created_at', '-id').values_list('id', flat=True))
+    # 상태별 개수와 마지막 수정 시각은 한 번의 집계 쿼리로
+    totals = records.aggregate(
+        last=Max('updated_at'),
+        **{status: Count('id', filter=Q(status=status)) for status in PROFILE_STATUSES},
+    )
+    status_counts = {status: totals[status] for status in PROFILE_STATUSES}
+    last_modified = totals['last']
+
+    metadata = {
+        'identifier': identifier,
+        'name': latest.name,
+        'category': latest.category,
+        'gender': latest.gender,
+        'age': latest.age,
+        'age_in_months': latest.age_in_months,
+        'birth_year': latest.birth_year,
+        'birth_month': latest.birth_month,
+        'birth_day': latest.birth_day,
+        'birth_date': _birth_date(latest),
+        'total_recordings': len(recording_ids),
+        'latest_recording_date': latest.created_at.isoformat(),
+    }
+    # 카테고리별 상세 메타데이터 (category_specific_data)
+    if latest.category_specific_data:
+        metadata['category_data'] = latest.category_specific_data
+
+    statistics = {'total': len(recording_ids), **status_counts}
+
+    # 녹음 전사/상태 수정도 ETag에 반영되도록 마지막 수정 시각 포함
+    payload = json.dumps([metadata, statistics, recording_ids, last_modified], cls=DjangoJSONEncoder, sort_keys=True)
+    profile, _ = ParticipantProfile.objects.update_or_create(
+        identifier=identifier,
+        category=category,
+        defaults={
+            'metadata': metadata,
+            'statistics': statistics,
+            'recording_ids': recording_ids,
+            'etag': hashlib.sha1(payload.encode('utf-8')).hexdigest(),
+        },
+    )
+    return profile
+
+
+def rebuild_participant_profiles():
+    """
+    모든 참가자 프로필을 다시 만듦
+
+    Returns:
+        int: 생성/갱신된 프로필 수
+    """
+    from .models import AudioRecord, ParticipantProfile
+
+    pairs = (
+        AudioRecord.objects.exclude(identifier__isnull=True).exclude(identifier__exact='')
+        .values_list('identifier', 'category').distinct().order_by('identifier', 'category')
+    )
+
+    started = timezone.now()
+    count = 0
+    identifiers = set()
+    for identifier, category in pairs.iterator(chunk_size=2000):
+        if identifier not in identifiers:
+            identifiers.add(identifier)
+            refresh_participant(identifier)
+            count += 1
+        refresh_participant(identifier, category)
+        count += 1
+
+    # 이번에 갱신되지 않은 프로필 = 더 이상 레코드가 없는 참가자/카테고리
+    ParticipantProfile.objects.filter(updated_at__lt=started).delete()
+    return count
@@ -0,0 +1,58 @@
+# voice_app/signals.py
+"""
+AudioRecord 저장/삭제 시 SpeakerSummary / ParticipantProfile 갱신 + 통계 스냅샷 무효화
+(VoiceAppConfig.ready()에서 연결)
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .models import AudioRecord
+from .rollups import refresh_participant, refresh_speaker
+from . import stats_cache
+
+# 이 필드들이 바뀌지 않은 save(update_fields=...)는 요약에 영향이 없음
+SUMMARY_SOURCE_FIELDS = {
+    'identifier', 'category', 'gender', 'region', 'education_level',
+    'hearing_level', 'age_in_months', 'category_specific_data',
+}
+
+
+def _refresh_on_commit(records, speaker=True):
+    """(identifier, category) 쌍들의 SpeakerSummary / ParticipantProfile 갱신 예약"""
+    records = {record for record in records if record[0]}
+    for identifier in {identifier for identifier, _ in records}:
+        if speaker:
+            transaction.on_commit(lambda identifier=identifier: refresh_speaker(identifier))
+        transaction.on_commit(lambda identifier=identifier: refresh_participant(identifier))
+    for identifier, category in records:
+        transaction.on_commit(lambda identifier=identifier, category=category: refresh_participant(identifier, category))
+
+
+@receiver(post_init, sender=AudioRecord)
+def remember_identifier(sender, instance, **kwargs):
+    # identifier/category가 바뀌면 이전 화자 요약도 다시 계산하기 위해 로드 시점 값 보관
+    # (.only()로 지연 로드된 필드는 __dict__에 없으므로 추가 쿼리 없이 건너뜀)
+    instance._loaded_identifier = instance.__dict__.get('identifier')
+    instance._loaded_category = instance.__dict__.get('category')
+
+
+@receiver(post_save, sender=AudioRecord)
+def update_speaker_summary(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    transaction.on_commit(stats_cache.invalidate)
+
+    # 참가자 프로필은 녹음 목록/상태도 담으므로 항상 갱신, 화자 요약은 관련 필드가 바뀐 경우만
+    speaker = update_fields is None or bool(SUMMARY_SOURCE_FIELDS.intersection(update_fields))
+    current = (instance.__dict__.get('identifier'), instance.__dict__.get('category'))
+    previous = (getattr(instance, '_loaded_identifier', None), getattr(instance, '_loaded_category', None))
+    _refresh_on_commit([current, previous], speaker=speaker)
+    instance._loaded_identifier, instance._loaded_category = current
+
+
+@receiver(post_delete, sender=AudioRecord)
+def remove_from_speaker_summary(sender, instance, **kwargs):
+    transaction.on_commit(stats_cache.invalidate)
+    _refresh_on_commit([(instance.__dict__.get('identifier'), instance.__dict__.get('category'))])
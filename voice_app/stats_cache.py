@@ -0,0 +1,89 @@
+# voice_app/stats_cache.py
+"""
+대시보드 / 사용자 프로필 통계 스냅샷 캐시
+
+- 저장소: settings.CACHES['stats'] (기본 FileBasedCache - 웹 워커 프로세스 간 공유)
+- 무효화: AudioRecord post_save / post_delete 시그널이 invalidate()로 '변경 시각'만 기록
+  (voice_app/signals.py) → 다음 요청에서 스냅샷을 다시 계산
+- 변경이 계속되는 수집 행사 중에도 STATS_CACHE_MIN_AGE 초 안에 만든 스냅샷은 그대로 사용해
+  재계산은 최대 그 간격마다 한 번만 일어남
+- 변경이 없어도 STATS_CACHE_TTL 초가 지나면 다시 계산 (타이머 갱신)
+- 재계산 중인 다른 요청은 이전 스냅샷을 그대로 받음 (동시 재계산 방지 잠금)
+  스냅샷이 아직 없으면 잠금을 가진 요청의 계산이 끝나기를 COLD_WAIT_SECONDS 동안 기다림
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+
+DIRTY_KEY = 'stats:dirty_at'
+LOCK_TIMEOUT = 60
+COLD_WAIT_SECONDS = 10
+COLD_POLL_INTERVAL = 0.1
+
+
+def _cache():
+    try:
+        return caches['stats']
+    except InvalidCacheBackendError:
+        return caches['default']
+
+
+def invalidate():
+    """통계에 영향을 주는 데이터가 바뀌었음을 기록"""
+    _cache().set(DIRTY_KEY, time.time(), None)
+
+
+def get_snapshot(name, builder):
+    """
+    name 스냅샷을 반환하고, 없거나 오래됐으면 builder()로 다시 계산
+
+    Returns:
+        tuple: (builder 결과, 스냅샷 생성 시각(epoch 초))
+    """
+    cache = _cache()
+    key = f'stats:snapshot:{name}'
+    ttl = getattr(settings, 'STATS_CACHE_TTL', 300)
+    min_age = getattr(settings, 'STATS_CACHE_MIN_AGE', 30)
+
+    snapshot = cache.get(key)
+    now = time.time()
+    if snapshot is not None:
+        age = now - snapshot['generated_at']
+        dirty_at = cache.get(DIRTY_KEY) or 0
+        if age < min_age or (snapshot['generated_at'] >= dirty_at and age < ttl):
+            return snapshot['data'], snapshot['generated_at']
+
+    # 다른 요청이 이미 계산 중이면 이전 스냅샷 사용 (잠금은 직접 얻은 경우에만 해제)
+    lock_key = f'stats:lock:{name}'
+    acquired = cache.add(lock_key, 1, LOCK_TIMEOUT)
+    if not acquired:
+        if snapshot is not None:
+            return snapshot['data'], snapshot['generated_at']
+        # 첫 계산 - 잠금을 가진 요청이 스냅샷을 저장할 때까지 대기, 시간 안에 없으면 직접 계산
+        deadline = time.time() + COLD_WAIT_SECONDS
+        while time.time() < deadline:
+            time.sleep(COLD_POLL_INTERVAL)
+            snapshot = cache.get(key)
+            if snapshot is not None:
+                return snapshot['data'], snapshot['generated_at']
+            acquired = cache.add(lock_key, 1, LOCK_TIMEOUT)
+            if acquired:
+                break
+
+    try:
+        started = time.time()
+        data = builder()
+        snapshot = {'data': data, 'generated_at': started}
+        cache.set(key, snapshot, None)
+        print(f"[Stats] Rebuilt '{name}' snapshot in {(time.time() - started) * 1000:.0f} ms")
+        return data, started
+    finally:
+        if acquired:
+            cache.delete(lock_key)
+
+
+def snapshot_age(generated_at):
+    """템플릿 표시용 스냅샷 나이 (초)"""
+    return max(0, int(time.time() - generated_at))
@@ -1,15 +1,41 @@
 # voice_app/tasks.py
 
+from django.conf import settings
+from django.utils import timezone
+
 from .models import AudioRecord
-from .whisper_utils import transcribe_audio
+from .job_queue import LeaseLost
+from .alignment_store import save_alignment
+from .batch_transcribe import BatchTranscriber
+from .model_registry import default_model_name, use_whisper_model
+from .rollups import refresh_after_bulk_write
+from .whisper_utils import transcribe_audio, transcribe_and_align_whisperx
+from . import transcription_cache
 import os
 
-def transcribe_audio_task(audio_id):
+# 배치 전사 결과 캐시 키 옵션 (transcribe_all과 공유)
+BATCH_CACHE_OPTIONS = {'temperature': 0.0, 'fp16': False, 'batch': True}
+TRANSCRIPT_FIELDS = ['transcript', 'manual_transcript', 'status', 'updated_at']
+
+
+def _report(progress, stage, percent):
+    """진행률 콜백 호출 (워커 밖에서 직접 실행하면 progress=None)"""
+    if progress:
+        progress(stage, percent)
+
+
+def transcribe_audio_task(audio_id, progress=None):
+    """
+    Whisper 전사 실행 후 AudioRecord.status 갱신. 성공 여부(bool) 반환
+
+    progress(stage, percent): 단계별 진행률 콜백 (job_queue.run_job에서 전달)
+    """
     audio = None  # 예외 발생 시 참조할 수 있도록 미리 정의
     
     print(f"[Task] transcribe_audio_task started for audio ID: {audio_id}")
 
     try:
+        _report(progress, 'load', 0)
         audio = AudioRecord.objects.get(id=audio_id)
         print(f"[Task] AudioRecord found: ID={audio.id}")
         
@@ -25,16 +51,18 @@ def transcribe_audio_task(audio_id):
             print(f"[Task Error] Audio file does not exist: {audio_path}")
             audio.status = 'failed'
             audio.save()
-            return
+            return False
         
         print(f"[Task] Audio file exists, size: {os.path.getsize(audio_path)} bytes")
         print(f"[Task] Calling transcribe_audio()...")
         
+        _report(progress, 'asr', 10)
         result = transcribe_audio(audio_path)
         
-        print(f"[Task] transcribe_audio() returned: {result[:100] if result else 'None'}...")
+        print(f"[Task] transcribe_audio() returned: {result[:100] if result is not None else 'None'}...")
         
-        if result:
+        _report(progress, 'persist', 90)
+        if result is not None:  # 빈 문자열 = 음성이 없는 녹음 (실패 아님)
             audio.transcript = result  # Whisper 자동 전사 결과
             # manual_transcript가 비어있으면 자동 전사 결과로 초기화
             if not audio.manual_transcript:
@@ -45,9 +73,14 @@ def transcribe_audio_task(audio_id):
             audio.status = 'failed'
             print(f"[Task Failed] No transcription result for ID {audio_id}")
         audio.save()
+        return result is not None
 
     except AudioRecord.DoesNotExist:
         print(f"[Task Error] AudioRecord with ID {audio_id} not found.")
+        return False
+    except LeaseLost:
+        # 작업이 다른 워커에게 넘어감 - 레코드 상태는 새 워커가 갱신
+        raise
     except Exception as e:
         print(f"[Task Error] Exception in transcription for ID {audio_id}: {type(e).__name__}: {e}")
         import traceback
@@ -55,4 +88,152 @@ def transcribe_audio_task(audio_id):
         if audio:
             audio.status = 'failed'
             audio.save()
+        return False
+
+
+def align_audio_task(audio_id, progress=None):
+    """
+    WhisperX 전사 + forced alignment 실행 후 alignment_status 갱신. 성공 여부(bool) 반환
+
+    progress(stage, percent): load → asr → align → persist 단계별 진행률 콜백
+    """
+    audio = None
+
+    print(f"[Task] align_audio_task started for audio ID: {audio_id}")
+
+    try:
+        _report(progress, 'load', 0)
+        audio = AudioRecord.objects.get(id=audio_id)
+
+        audio.alignment_status = 'processing'
+        audio.save()
+
+        result = transcribe_and_align_whisperx(audio.audio_file.path, progress=progress)
+
+        _report(progress, 'persist', 90)
+        if result['success']:
+            # segments/전사는 alignment_data(JSON), 단어는 WordAlignment에 압축 저장
+            save_alignment(audio, result)
+            audio.alignment_status = 'completed'
+
+            # 전사가 없었다면 전사도 업데이트
+            if not audio.transcript:
+                audio.transcript = result['transcription']
+                # manual_transcript가 비어있으면 자동 전사 결과로 초기화
+                if not audio.manual_transcript:
+                    audio.manual_transcript = result['transcription']
+                audio.status = 'completed'
+            print(f"[Task Success] Alignment completed for ID {audio_id}")
+        else:
+            audio.alignment_data = {
+                'error': result['error'],
+                'success': False
+            }
+            audio.alignment_status = 'failed'
+            print(f"[Task Failed] Alignment failed for ID {audio_id}: {result['error']}")
+        audio.save()
+        return result['success']
+
+    except AudioRecord.DoesNotExist:
+        print(f"[Task Error] AudioRecord with ID {audio_id} not found.")
+        return False
+    except LeaseLost:
+        # 작업이 다른 워커에게 넘어감 - 레코드 상태는 새 워커가 갱신
+        raise
+    except Exception as e:
+        print(f"[Task Error] Exception in alignment for ID {audio_id}: {type(e).__name__}: {e}")
+        import traceback
+        traceback.print_exc()
+        if audio:
+            audio.alignment_status = 'failed'
+            audio.save()
+        return False
+
+
+
+def apply_transcript(record, text):
+    """전사 결과를 레코드에 반영 (저장은 save_transcripts)"""
+    record.transcript = text
+    # manual_transcript가 비어있으면 자동 전사 결과로 초기화
+    if not record.manual_transcript:
+        record.manual_transcript = text
+    record.status = 'completed'
+
+
+def save_transcripts(records):
+    """
+    전사 결과 일괄 저장 (bulk_update) + 시그널 대신 참가자 프로필/통계 스냅샷 갱신
+    records는 identifier, category를 함께 로드한 레코드
+    """
+    if not records:
+        return
+    now = timezone.now()
+    for record in records:
+        record.updated_at = now  # auto_now는 bulk_update에 적용되지 않음 (참가자 프로필 ETag)
+    AudioRecord.objects.bulk_update(records, TRANSCRIPT_FIELDS)
+    refresh_after_bulk_write({(record.identifier, record.category) for record in records}, speaker=False)
+
+
+def transcribe_batch_task(audio_ids, owned=None):
+    """
+    여러 레코드를 BatchTranscriber로 한 번에 전사 (대기열의 backfill 작업, job_queue.run_backfill_jobs)
+
+    Args:
+        audio_ids: 전사할 AudioRecord id 목록
+        owned(audio_ids) → set: 저장 직전 아직 이 워커가 소유한 작업의 audio_id (임대를 잃은 작업은 저장하지 않음)
+
+    Returns:
+        dict: {audio_id: None(성공) 또는 오류 메시지}
+    """
+    model_name = default_model_name()
+    records = AudioRecord.objects.filter(id__in=audio_ids).only(
+        'id', 'identifier', 'category', 'audio_file', 'transcript', 'manual_transcript', 'status'
+    )
+    records_by_id = {record.id: record for record in records}
+    errors = {audio_id: '레코드를 찾을 수 없습니다.' for audio_id in audio_ids if audio_id not in records_by_id}
+
+    done, items, paths = [], [], {}
+    for record in records_by_id.values():
+        path = os.path.join(settings.MEDIA_ROOT, str(record.audio_file)) if record.audio_file else ''
+        if not path or not os.path.exists(path):
+            errors[record.id] = f'오디오 파일이 없습니다: {path}'
+            continue
+        # 같은 내용의 파일을 이미 전사했으면 캐시 결과 사용
+        text = transcription_cache.get_cached(path, 'transcript', model_name, 'ko', BATCH_CACHE_OPTIONS)
+        if text is not None:
+            apply_transcript(record, text)
+            done.append(record)
+        else:
+            items.append((record.id, path))
+            paths[record.id] = path
+
+    if items:
+        with use_whisper_model(model_name) as model:
+            transcriber = BatchTranscriber(
+                model,
+                batch_size=len(items),
+                io_workers=getattr(settings, 'BACKFILL_IO_WORKERS', 4),
+                language='ko',
+            )
+            for results in transcriber.run(items):
+                for audio_id, text, error in results:
+                    if text is None:
+                        errors[audio_id] = error or '처리 결과가 없습니다.'
+                        continue
+                    transcription_cache.store(paths[audio_id], 'transcript', model_name, text, 'ko', BATCH_CACHE_OPTIONS)
+                    apply_transcript(records_by_id[audio_id], text)
+                    done.append(records_by_id[audio_id])
+        stats = transcriber.stats
+        print(f"[Task] Batch transcribed {stats['files']} files ({stats['batched']} batched, "
+              f"{stats['long_files']} long, {stats['failed']} failed) in {stats['elapsed']:.2f} seconds")
+
+    failed = [records_by_id[audio_id] for audio_id in errors if audio_id in records_by_id]
+    for record in failed:
+        record.status = 'failed'
 
+    if owned is not None:
+        keep = owned(list(records_by_id))
+        done = [record for record in done if record.id in keep]
+        failed = [record for record in failed if record.id in keep]
+    save_transcripts(done + failed)
+    return {audio_id: errors.get(audio_id) for audio_id in audio_ids}
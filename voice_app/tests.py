@@ -1,3 +1,760 @@
-from django.test import TestCase
+import hashlib
+import importlib
+import importlib.util
+import io
+import os
+import re
+import shutil
+import struct
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Q
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from .alignment_store import LegacyWords, PackedWords, pack_words
+from .audio_analysis import (
+    DBFS_FLOOR, WAVE_FORMAT_PCM, estimate_snr, is_silent, is_whisper_ready, parse_wav_header, read_wav_header,
+)
+from .job_queue import (
+    claim_next_job, enqueue_job, enqueue_unprocessed, finish_job, renew_lease, requeue_expired_jobs,
+)
+from .models import AudioRecord, ParticipantProfile, SpeakerSummary, TranscriptionJob, UploadSession
+from .pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_page, page_limit
+from . import stats_cache
+from .rollups import affected_pairs, refresh_after_bulk_write
+from .vad import detect_speech_regions, split_long_regions
+from .upload_sessions import (
+    UploadSessionError, assemble_session, begin_finalize, create_session, reopen_session,
+    session_file_path, write_chunk,
+)
+
+# EXPLAIN QUERY PLAN에서 인덱스 없이 테이블 전체를 읽는 단계 ("SCAN voice_app_audiorecord")
+FULL_SCAN = re.compile(r'\bSCAN voice_app_audiorecord\b(?! USING)')
+
+# 집계 테스트에서 통계 스냅샷 무효화가 파일 캐시(cache/stats)에 쓰지 않도록
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'stats': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'stats-test'},
+}
+
+
+@unittest.skipUnless(connection.vendor == 'sqlite', 'SQLite 쿼리 플랜 기준 테스트')
+class AudioRecordQueryPlanTest(TestCase):
+    """주요 목록/집계/backfill 쿼리가 AudioRecord 전체 스캔으로 바뀌지 않았는지 확인"""
+
+    RECORDS = 12000
+    CATEGORIES = ('child', 'senior', 'normal', 'auditory', 'atypical')
+
+    @classmethod
+    def setUpTestData(cls):
+        records = []
+        for i in range(cls.RECORDS):
+            records.append(AudioRecord(
+                audio_file='test.wav',
+                identifier=f"C{i % 500:05d}",
+                category=cls.CATEGORIES[i % len(cls.CATEGORIES)],
+                status='processing' if i % 50 == 0 else 'completed',
+                alignment_status='processing' if i % 40 == 0 else 'completed',
+                transcript=None if i % 30 == 0 else '전사',
+                snr_mean=None if i % 25 == 0 else 20.0,
+            ))
+        AudioRecord.objects.bulk_create(records, batch_size=1000)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def assertUsesIndex(self, queryset):
+        plan = queryset.explain()
+        self.assertIsNone(FULL_SCAN.search(plan), f"full table scan:\n{queryset.query}\n{plan}")
+
+    def test_list_ordering(self):
+        self.assertUsesIndex(AudioRecord.objects.order_by('-created_at', '-id')[:10])
+
+    def test_category_list(self):
+        self.assertUsesIndex(AudioRecord.objects.filter(category='child').order_by('-created_at', '-id')[:10])
+
+    def test_identifier_list(self):
+        self.assertUsesIndex(AudioRecord.objects.filter(identifier='C00001').order_by('-created_at', '-id')[:10])
+
+    def test_identifier_category_list(self):
+        self.assertUsesIndex(
+            AudioRecord.objects.filter(identifier='C00001', category='child').order_by('-created_at', '-id')[:10]
+        )
+
+    def test_identifier_category_counts(self):
+        self.assertUsesIndex(
+            AudioRecord.objects.filter(identifier='C00001').values('category').annotate(count=Count('id')).order_by()
+        )
+
+    def test_keyset_cursor(self):
+        latest = AudioRecord.objects.order_by('-created_at', '-id').values('created_at', 'id')[100]
+        self.assertUsesIndex(
+            AudioRecord.objects.filter(
+                Q(created_at__lt=latest['created_at']) | Q(created_at=latest['created_at'], id__lt=latest['id'])
+            ).order_by('-created_at', '-id')[:51]
+        )
+
+    def test_status_filters(self):
+        self.assertUsesIndex(AudioRecord.objects.filter(status='processing'))
+        self.assertUsesIndex(AudioRecord.objects.filter(alignment_status='processing'))
+
+    def test_backfill_targets(self):
+        self.assertUsesIndex(AudioRecord.objects.filter(transcript__isnull=True).order_by('id').values('id'))
+        self.assertUsesIndex(AudioRecord.objects.filter(snr_mean__isnull=True).order_by('id').values('id'))
+
+
+class UploadSessionTest(TestCase):
+    """청크 업로드 세션: 순서 무관 기록, 재전송, finalize 소유권, 체크섬 불일치"""
+
+    CHUNK_SIZE = 1000
+
+    def setUp(self):
+        upload_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, upload_dir, True)
+        override = override_settings(UPLOAD_SESSION_DIR=upload_dir)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.data = os.urandom(2500)
+
+    def create(self, **kwargs):
+        return create_session('test.wav', len(self.data), chunk_size=self.CHUNK_SIZE, **kwargs)
+
+    def send(self, session, index, **kwargs):
+        chunk = self.data[index * self.CHUNK_SIZE:(index + 1) * self.CHUNK_SIZE]
+        return write_chunk(session, index, io.BytesIO(chunk), len(chunk), **kwargs)
+
+    def test_out_of_order_chunks(self):
+        session = self.create()
+        self.assertEqual(session.chunk_count, 3)
+        self.send(session, 2)
+        session = self.send(session, 0, offset=0)
+        self.assertEqual(session.missing_chunks(), [1])
+
+        with self.assertRaises(UploadSessionError) as ctx:
+            assemble_session(session)
+        self.assertEqual(ctx.exception.status_code, 409)
+        self.assertEqual(ctx.exception.extra['missing_chunks'], [1])
+
+        session = self.send(session, 1)
+        assembled = assemble_session(session)
+        with assembled:
+            self.assertEqual(assembled.read(), self.data)
+        self.assertEqual(assembled.sha256, hashlib.sha256(self.data).hexdigest())
+
+    def test_resent_chunk_counted_once(self):
+        session = self.create()
+        self.send(session, 0)
+        session = self.send(session, 0)
+        self.assertEqual(session.received_chunks, [0])
+        self.assertEqual(session.received_size, self.CHUNK_SIZE)
+
+    def test_rejects_bad_chunk(self):
+        session = self.create()
+        with self.assertRaises(UploadSessionError) as ctx:
+            self.send(session, 1, offset=0)
+        self.assertEqual(ctx.exception.status_code, 409)
+        with self.assertRaises(UploadSessionError) as ctx:
+            write_chunk(session, 2, io.BytesIO(b'x' * 10), 10)
+        self.assertEqual(ctx.exception.status_code, 400)
+        with self.assertRaises(UploadSessionError) as ctx:
+            self.send(session, 0, chunk_sha256='0' * 64)
+        self.assertEqual(ctx.exception.status_code, 422)
+
+    def test_checksum_mismatch_fails_session(self):
+        session = self.create(checksum='0' * 64)
+        for index in range(session.chunk_count):
+            session = self.send(session, index)
+
+        with self.assertRaises(UploadSessionError) as ctx:
+            assemble_session(session)
+        self.assertEqual(ctx.exception.status_code, 422)
+        self.assertEqual(ctx.exception.extra['sha256'], hashlib.sha256(self.data).hexdigest())
+
+        session.refresh_from_db()
+        self.assertEqual(session.status, 'failed')
+        self.assertFalse(os.path.exists(session_file_path(session)))
+
+    def test_finalize_claimed_once(self):
+        session = self.create()
+        self.assertEqual(begin_finalize(session).status, 'finalizing')
+
+        with self.assertRaises(UploadSessionError) as ctx:
+            begin_finalize(UploadSession.objects.get(pk=session.pk))
+        self.assertEqual(ctx.exception.status_code, 409)
+        with self.assertRaises(UploadSessionError):
+            self.send(session, 0)
+
+        reopen_session(session)
+        self.assertEqual(session.status, 'uploading')
+        self.send(session, 0)
+
+    def test_finalize_completed_session(self):
+        session = self.create()
+        UploadSession.objects.filter(pk=session.pk).update(status='completed')
+        self.assertEqual(begin_finalize(session).status, 'completed')
+
+
+def wav_bytes(pcm, sample_rate=16000, channels=1, bits=16, extensible=False, data_size=None, extra_chunk=b''):
+    """테스트용 WAV 바이트 (extra_chunk는 fmt와 data 사이에 넣을 LIST 청크 본문)"""
+    block_align = channels * bits // 8
+    fmt = struct.pack('<HHIIHH', 0xFFFE if extensible else WAVE_FORMAT_PCM,
+                      channels, sample_rate, sample_rate * block_align, block_align, bits)
+    if extensible:
+        # cbSize, wValidBitsPerSample, dwChannelMask, SubFormat GUID (앞 2바이트가 포맷 코드)
+        fmt += struct.pack('<HHI', 22, bits, 0x4) + struct.pack('<H', WAVE_FORMAT_PCM) + bytes(14)
+    body = b'WAVE' + b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+    if extra_chunk:
+        body += b'LIST' + struct.pack('<I', len(extra_chunk)) + extra_chunk + b'\0' * (len(extra_chunk) & 1)
+    body += b'data' + struct.pack('<I', len(pcm) if data_size is None else data_size) + pcm
+    return b'RIFF' + struct.pack('<I', len(body)) + body
+
+
+class WavHeaderTest(SimpleTestCase):
+    """RIFF 헤더 파싱: PCM, WAVE_FORMAT_EXTENSIBLE, 스트리밍 WAV의 data 크기"""
+
+    PCM = b'\x01\x00' * 1600
+
+    def read(self, data):
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
+            f.write(data)
+        self.addCleanup(os.remove, f.name)
+        return read_wav_header(f.name)
+
+    def test_pcm(self):
+        header = parse_wav_header(wav_bytes(self.PCM))
+        self.assertEqual(header, {
+            'format_tag': WAVE_FORMAT_PCM,
+            'channels': 1,
+            'sample_rate': 16000,
+            'byte_rate': 32000,
+            'block_align': 2,
+            'bits_per_sample': 16,
+            'data_offset': 44,
+            'data_size': len(self.PCM),
+        })
+        self.assertTrue(is_whisper_ready(header))
+
+    def test_extensible_uses_subformat(self):
+        header = parse_wav_header(wav_bytes(self.PCM, extensible=True))
+        self.assertEqual(header['format_tag'], WAVE_FORMAT_PCM)
+        self.assertEqual(header['data_offset'], 68)
+        self.assertTrue(is_whisper_ready(header))
+
+    def test_skips_odd_sized_chunk(self):
+        header = self.read(wav_bytes(self.PCM, extra_chunk=b'INFOabc'))
+        self.assertEqual(header['data_offset'], 44 + 8 + 8)
+        self.assertEqual(header['data_size'], len(self.PCM))
+
+    def test_streamed_data_size(self):
+        for data_size in (0, 0xFFFFFFFF, len(self.PCM) * 2):
+            with self.subTest(data_size=data_size):
+                self.assertEqual(self.read(wav_bytes(self.PCM, data_size=data_size))['data_size'], len(self.PCM))
+
+    def test_not_whisper_ready(self):
+        self.assertFalse(is_whisper_ready(parse_wav_header(wav_bytes(self.PCM * 2, channels=2))))
+        self.assertFalse(is_whisper_ready(parse_wav_header(wav_bytes(self.PCM, sample_rate=44100))))
+        self.assertFalse(is_whisper_ready(None))
+
+    def test_invalid_header(self):
+        self.assertIsNone(parse_wav_header(b'ID3\x03' + bytes(60)))
+        self.assertIsNone(parse_wav_header(wav_bytes(self.PCM)[:30]))
+        self.assertIsNone(self.read(b''))
+
+
+class KeysetPaginationTest(TestCase):
+    """(created_at, id) 커서 페이지: 같은 created_at이 여러 행이어도 누락/중복 없이 최신순"""
+
+    @classmethod
+    def setUpTestData(cls):
+        AudioRecord.objects.bulk_create(
+            AudioRecord(audio_file='test.wav', category='child' if i % 2 else 'normal') for i in range(7)
+        )
+        base = timezone.now()
+        # id 1~3은 같은 시각, 나머지는 id가 클수록 이전 시각
+        for offset, record in enumerate(AudioRecord.objects.order_by('id')):
+            created_at = base if offset < 3 else base - timedelta(minutes=offset)
+            AudioRecord.objects.filter(pk=record.pk).update(created_at=created_at)
+
+    def pages(self, queryset, limit):
+        pages, cursor = [], None
+        while True:
+            rows, cursor = keyset_page(queryset, cursor, limit)
+            pages.append([row['id'] for row in rows])
+            if cursor is None:
+                return pages
+
+    def test_walks_all_rows_once(self):
+        expected = list(AudioRecord.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        for limit in (1, 2, 3, 7, 50):
+            with self.subTest(limit=limit):
+                pages = self.pages(AudioRecord.objects.all(), limit)
+                self.assertEqual([pk for page in pages for pk in page], expected)
+                self.assertTrue(all(len(page) <= limit for page in pages))
+                self.assertEqual(len(pages), -(-len(expected) // limit))
+
+    def test_filtered_queryset(self):
+        queryset = AudioRecord.objects.filter(category='child')
+        expected = list(queryset.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual([pk for page in self.pages(queryset, 2) for pk in page], expected)
+
+    def test_cursor_round_trip(self):
+        created_at = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(created_at, 42)), (created_at, 42))
+
+    def test_invalid_cursor(self):
+        for cursor in ('not-a-cursor', encode_cursor(timezone.now(), 1)[:-4], 'WyJ4IiwxXQ'):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                keyset_page(AudioRecord.objects.all(), cursor, 2)
+
+    @override_settings(API_PAGE_SIZE=50, API_MAX_PAGE_SIZE=200)
+    def test_page_limit(self):
+        self.assertEqual(page_limit(None), 50)
+        self.assertEqual(page_limit(''), 50)
+        self.assertEqual(page_limit('abc'), 50)
+        self.assertEqual(page_limit('0'), 1)
+        self.assertEqual(page_limit('20'), 20)
+        self.assertEqual(page_limit(10000), 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SpeakerSummaryRollupTest(TestCase):
+    """저장/삭제 시그널과 일괄 쓰기 후 SpeakerSummary 갱신"""
+
+    def create(self, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return AudioRecord.objects.create(audio_file='test.wav', **fields)
+
+    def test_save_and_delete(self):
+        first = self.create(identifier='C00001', category='child', gender='남')
+        summary = SpeakerSummary.objects.get(identifier='C00001')
+        self.assertEqual(summary.recordings_count, 1)
+        self.assertEqual(summary.gender, '남성')
+
+        second = self.create(identifier='C00001', category='child', gender='여')
+        summary = SpeakerSummary.objects.get(identifier='C00001')
+        self.assertEqual(summary.recordings_count, 2)
+        self.assertEqual(summary.gender, '여성')  # 가장 최근 레코드 기준
+
+        with self.captureOnCommitCallbacks(execute=True):
+            second.delete()
+        summary = SpeakerSummary.objects.get(identifier='C00001')
+        self.assertEqual(summary.recordings_count, 1)
+        self.assertEqual(summary.gender, '남성')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertFalse(SpeakerSummary.objects.filter(identifier='C00001').exists())
+
+    def test_identifier_change_refreshes_both_speakers(self):
+        self.create(identifier='C00001', category='child')
+        record = self.create(identifier='C00001', category='child')
+
+        record = AudioRecord.objects.get(pk=record.pk)
+        record.identifier = 'C00002'
+        with self.captureOnCommitCallbacks(execute=True):
+            record.save()
+        self.assertEqual(SpeakerSummary.objects.get(identifier='C00001').recordings_count, 1)
+        self.assertEqual(SpeakerSummary.objects.get(identifier='C00002').recordings_count, 1)
+
+    def test_update_fields(self):
+        record = self.create(identifier='C00001', category='child', gender='남')
+        SpeakerSummary.objects.filter(identifier='C00001').update(region='stale')
+
+        # 요약에 쓰이지 않는 필드만 저장하면 요약은 다시 계산하지 않음
+        record.transcript = '전사'
+        with self.captureOnCommitCallbacks(execute=True):
+            record.save(update_fields=['transcript'])
+        self.assertEqual(SpeakerSummary.objects.get(identifier='C00001').region, 'stale')
+
+        record.gender = '여'
+        with self.captureOnCommitCallbacks(execute=True):
+            record.save(update_fields=['gender'])
+        summary = SpeakerSummary.objects.get(identifier='C00001')
+        self.assertIsNone(summary.region)
+        self.assertEqual(summary.gender, '여성')
+
+    def test_refresh_after_bulk_write(self):
+        record = self.create(identifier='C00001', category='child', gender='남')
+        queryset = AudioRecord.objects.filter(pk=record.pk)
+        queryset.update(gender='여', updated_at=timezone.now())
+        self.assertEqual(SpeakerSummary.objects.get(identifier='C00001').gender, '남성')
+
+        self.assertEqual(refresh_after_bulk_write(affected_pairs(queryset)), 1)
+        self.assertEqual(SpeakerSummary.objects.get(identifier='C00001').gender, '여성')
+
+    def test_affected_pairs_skips_blank_identifier(self):
+        AudioRecord.objects.bulk_create([
+            AudioRecord(audio_file='test.wav', identifier='C00001', category='child'),
+            AudioRecord(audio_file='test.wav', identifier='C00001', category='normal'),
+            AudioRecord(audio_file='test.wav', identifier='', category='child'),
+            AudioRecord(audio_file='test.wav', identifier=None, category='child'),
+        ])
+        self.assertEqual(
+            affected_pairs(AudioRecord.objects.all()),
+            {('C00001', 'child'), ('C00001', 'normal')},
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ParticipantProfileTest(TestCase):
+    """참가자 프로필 갱신과 참가자 API의 ETag / 304"""
+
+    URL = '/api/participant/C00001/'
+
+    def create(self, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return AudioRecord.objects.create(audio_file='test.wav', identifier='C00001', **fields)
+
+    def get(self, etag=None, **params):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(self.URL, params, **headers)
+
+    def test_profiles_per_category(self):
+        child = self.create(category='child', status='completed')
+        self.create(category='normal', status='failed')
+
+        combined = ParticipantProfile.objects.get(identifier='C00001', category='')
+        self.assertEqual(combined.statistics, {'total': 2, 'completed': 1, 'pending': 0, 'processing': 0, 'failed': 1})
+        self.assertEqual(ParticipantProfile.objects.get(identifier='C00001', category='child').recording_ids, [child.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            child.delete()
+        self.assertFalse(ParticipantProfile.objects.filter(identifier='C00001', category='child').exists())
+        self.assertEqual(ParticipantProfile.objects.get(identifier='C00001', category='').statistics['total'], 1)
+
+    def test_etag_not_modified(self):
+        self.create(category='child')
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+        # 페이지가 다르면 ETag도 다름
+        response = self.get(etag, recordings_limit=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_changes_after_save(self):
+        record = self.create(category='child')
+        etag = self.get()['ETag']
+
+        record.transcript = '전사'
+        with self.captureOnCommitCallbacks(execute=True):
+            record.save(update_fields=['transcript', 'updated_at'])
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['data']['recordings'][0]['transcript'], '전사')
+
+    def test_etag_changes_after_bulk_write(self):
+        self.create(category='child')
+        etag = self.get()['ETag']
+
+        queryset = AudioRecord.objects.filter(identifier='C00001')
+        queryset.update(transcript='전사', updated_at=timezone.now() + timedelta(seconds=1))
+        refresh_after_bulk_write(affected_pairs(queryset), speaker=False)
+        self.assertEqual(self.get(etag).status_code, 200)
+
+    def test_builds_missing_profile(self):
+        AudioRecord.objects.bulk_create([AudioRecord(audio_file='test.wav', identifier='C00001', category='child')])
+        self.assertFalse(ParticipantProfile.objects.exists())
+
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['statistics']['total'], 1)
+        self.assertTrue(ParticipantProfile.objects.filter(identifier='C00001', category='').exists())
+
+    def test_unknown_participant(self):
+        self.assertEqual(self.get().status_code, 404)
+
+
+@override_settings(JOB_LEASE_SECONDS=300, JOB_MAX_ATTEMPTS=2)
+class JobQueueTest(TestCase):
+    """작업 큐: 중복 등록 방지, 원자적 claim, 임대 연장/만료 후 재등록"""
+
+    def setUp(self):
+        self.audios = AudioRecord.objects.bulk_create(
+            AudioRecord(audio_file='test.wav', status='processing') for _ in range(3)
+        )
+
+    def expire(self, job):
+        TranscriptionJob.objects.filter(pk=job.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+    def test_enqueue_deduplicates(self):
+        job, created = enqueue_job(self.audios[0])
+        self.assertTrue(created)
+        self.assertEqual(enqueue_job(self.audios[0]), (job, False))
+        self.assertEqual(enqueue_job(self.audios[0], kind='backfill'), (job, False))
+        self.assertTrue(enqueue_job(self.audios[0], kind='align')[1])
+
+    def test_one_active_job_per_audio(self):
+        job, _ = enqueue_job(self.audios[0])
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            TranscriptionJob.objects.create(audio=self.audios[0], kind='backfill')
+
+        # 끝난 작업은 제약 대상이 아님
+        TranscriptionJob.objects.filter(pk=job.pk).update(status='completed')
+        self.assertTrue(enqueue_job(self.audios[0])[1])
+
+    def test_enqueue_unprocessed(self):
+        AudioRecord.objects.filter(pk=self.audios[2].pk).update(transcript='전사')
+        enqueue_job(self.audios[0])
+        self.assertEqual(enqueue_unprocessed(), 1)
+        self.assertEqual(
+            TranscriptionJob.objects.get(audio=self.audios[1]).kind, 'backfill',
+        )
+        self.assertEqual(enqueue_unprocessed(), 0)
+
+    def test_claim_in_order_once(self):
+        first, _ = enqueue_job(self.audios[0])
+        second, _ = enqueue_job(self.audios[1], kind='backfill')
+
+        job = claim_next_job('worker-a')
+        self.assertEqual(job.pk, first.pk)
+        self.assertEqual((job.status, job.worker, job.attempts), ('running', 'worker-a', 1))
+        self.assertGreater(job.lease_expires_at, timezone.now())
+
+        self.assertEqual(claim_next_job('worker-b', kinds=['transcribe']).pk, second.pk)
+        self.assertIsNone(claim_next_job('worker-c'))
+
+    def test_claim_filters_kinds(self):
+        enqueue_job(self.audios[0])
+        self.assertIsNone(claim_next_job('worker-a', kinds=['align']))
+        self.assertIsNotNone(claim_next_job('worker-a', kinds=['transcribe']))
+
+    def test_finish_job(self):
+        enqueue_job(self.audios[0])
+        job = claim_next_job('worker-a')
+        finish_job(job, True)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.progress), ('completed', 100))
+        self.assertIsNone(job.lease_expires_at)
+
+    def test_requeue_expired(self):
+        enqueue_job(self.audios[0])
+        job = claim_next_job('worker-a')
+        self.assertEqual(requeue_expired_jobs(), (0, 0))
+
+        self.expire(job)
+        self.assertEqual(requeue_expired_jobs(), (1, 0))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.worker), ('queued', ''))
+
+    def test_requeue_legacy_job_without_lease(self):
+        enqueue_job(self.audios[0])
+        job = claim_next_job('worker-a')
+        TranscriptionJob.objects.filter(pk=job.pk).update(
+            lease_expires_at=None, started_at=timezone.now() - timedelta(seconds=301),
+        )
+        self.assertEqual(requeue_expired_jobs(), (1, 0))
+
+    def test_expired_after_max_attempts_fails(self):
+        enqueue_job(self.audios[0])
+        for _ in range(2):
+            job = claim_next_job('worker-a')
+            self.expire(job)
+            requeue_expired_jobs()
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        self.assertEqual(AudioRecord.objects.get(pk=self.audios[0].pk).status, 'failed')
+
+    def test_lost_lease_cannot_renew_or_finish(self):
+        enqueue_job(self.audios[0])
+        stale = claim_next_job('worker-a')
+        self.assertEqual(renew_lease(stale), 1)
+
+        self.expire(stale)
+        requeue_expired_jobs()
+        current = claim_next_job('worker-b')
+        self.assertEqual(current.pk, stale.pk)
+
+        self.assertEqual(renew_lease(stale), 0)
+        finish_job(stale, False, 'late')
+        current.refresh_from_db()
+        self.assertEqual((current.status, current.worker, current.error), ('running', 'worker-b', ''))
+
+
+class PackedWordsTest(SimpleTestCase):
+    """packed 단어 alignment: 왕복 변환, 시간 범위 조회, 정렬되지 않은 입력, 0029 마이그레이션과의 호환"""
+
+    WORDS = [
+        {'start': 0.0, 'end': 0.5, 'word': '안녕', 'score': 0.75, 'segment_id': 0},
+        {'start': 0.5, 'end': 1.25, 'word': '하세요', 'score': 0.5, 'segment_id': 0},
+        {'start': 2.0, 'end': 2.5, 'word': '안녕', 'score': 1.0, 'segment_id': 1},
+        {'start': 3.0, 'end': 4.5, 'word': 'hello', 'score': 0.25, 'segment_id': 1},
+    ]
+
+    def test_round_trip(self):
+        packed = PackedWords(pack_words(self.WORDS))
+        self.assertEqual(len(packed), 4)
+        self.assertEqual(packed.words(), self.WORDS)
+        self.assertEqual(packed.duration, 4.5)
+        self.assertEqual(len(packed._lengths), 3)  # 같은 단어 문자열은 한 번만 저장
+
+    def test_empty(self):
+        packed = PackedWords(pack_words([]))
+        self.assertEqual(len(packed), 0)
+        self.assertEqual(packed.words(0, 10), [])
+        self.assertEqual(packed.duration, 0.0)
+
+    def test_time_range(self):
+        packed = PackedWords(pack_words(self.WORDS))
+        legacy = LegacyWords(self.WORDS)
+        for start, end, expected in (
+            (None, None, [0, 1, 2, 3]),
+            (0.5, 2.0, [1]),        # 경계에서 끝나거나 시작하는 단어는 제외
+            (0.4, 2.1, [0, 1, 2]),
+            (1.0, None, [1, 2, 3]),
+            (None, 0.5, [0]),
+            (4.5, 10.0, []),
+            (3.5, 3.6, [3]),        # 구간이 단어 안에 포함
+        ):
+            with self.subTest(start=start, end=end):
+                self.assertEqual(packed.words(start, end), [self.WORDS[i] for i in expected])
+                self.assertEqual(legacy.words(start, end), [self.WORDS[i] for i in expected])
+
+    def test_unsorted_input(self):
+        words = [self.WORDS[3], self.WORDS[0], self.WORDS[2], self.WORDS[1]]
+        packed = PackedWords(pack_words(words))
+        self.assertEqual(packed.words(0.4, 2.1), [self.WORDS[0], self.WORDS[2], self.WORDS[1]])
+
+    def test_columns(self):
+        packed = PackedWords(pack_words(self.WORDS))
+        self.assertEqual(packed.columns(2.0, 5.0, fields=('word', 'start')), {
+            'word': ['안녕', 'hello'],
+            'start': [2.0, 3.0],
+        })
+
+    def test_invalid_magic(self):
+        with self.assertRaises(ValueError):
+            PackedWords(b'XXXX' + pack_words(self.WORDS)[4:])
+
+    def test_migration_helpers_match(self):
+        migration = importlib.import_module('voice_app.migrations.0029_wordalignment')
+        data = pack_words(self.WORDS)
+        self.assertEqual(migration.pack_words(self.WORDS), data)
+        self.assertEqual(migration.unpack_words(data), PackedWords(data).words())
+
+
+@unittest.skipUnless(HAS_NUMPY, 'numpy 필요')
+class EstimateSnrTest(SimpleTestCase):
+    """프레임 에너지 기반 SNR: 디지털 무음 프레임이 잡음 기준을 끌어내리지 않는지 확인"""
+
+    def test_zero_frames_excluded_from_noise_floor(self):
+        noise, speech = 1e-5, 1e-2  # -50dBFS 잡음, -20dBFS 음성
+        stats = estimate_snr([0.0] * 50 + [noise] * 30 + [speech] * 20)
+        self.assertAlmostEqual(stats['noise_floor_dbfs'], -50.0, places=1)
+        self.assertAlmostEqual(stats['snr_mean'], 30.0, places=1)
+
+    def test_all_zero(self):
+        stats = estimate_snr([0.0] * 10)
+        self.assertEqual(stats['noise_floor_dbfs'], DBFS_FLOOR)
+        self.assertEqual(stats['snr_mean'], 0.0)
+
+
+@override_settings(AUDIO_VOICED_THRESHOLD_DBFS=-55.0, AUDIO_SILENCE_MIN_VOICED_RATIO=0.01)
+class SilenceCheckTest(SimpleTestCase):
+    """무음 판정: 업로드 파일 삭제로 이어지므로 확실한 무음만 True"""
+
+    def test_zero_length_is_silent(self):
+        self.assertTrue(is_silent({'duration': 0.0, 'voiced_ratio': 0.0, 'peak_dbfs': DBFS_FLOOR}))
+
+    def test_unknown_is_not_silent(self):
+        self.assertFalse(is_silent(None))
+
+    def test_silent(self):
+        self.assertTrue(is_silent({'duration': 3.0, 'voiced_ratio': 0.0, 'peak_dbfs': -70.0}))
+
+    def test_borderline_kept(self):
+        # 음성 프레임 비율은 낮지만 peak가 음성 하한 이상 (아주 작은 목소리)
+        self.assertFalse(is_silent({'duration': 3.0, 'voiced_ratio': 0.005, 'peak_dbfs': -45.0}))
+
+    def test_voiced(self):
+        self.assertFalse(is_silent({'duration': 3.0, 'voiced_ratio': 0.2, 'peak_dbfs': -70.0}))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, STATS_CACHE_TTL=300, STATS_CACHE_MIN_AGE=0)
+class StatsSnapshotTest(SimpleTestCase):
+    """통계 스냅샷 잠금: 다른 요청이 가진 잠금은 해제하지 않음"""
+
+    LOCK_KEY = 'stats:lock:test'
+
+    def setUp(self):
+        self.cache = stats_cache._cache()
+        self.cache.clear()
+
+    def test_rebuilds_after_invalidate(self):
+        self.assertEqual(stats_cache.get_snapshot('test', lambda: 1)[0], 1)
+        self.assertEqual(stats_cache.get_snapshot('test', lambda: 2)[0], 1)
+        self.cache.set(stats_cache.DIRTY_KEY, time.time() + 1, None)
+        self.assertEqual(stats_cache.get_snapshot('test', lambda: 3)[0], 3)
+        self.assertIsNone(self.cache.get(self.LOCK_KEY))
+
+    def test_stale_snapshot_while_locked(self):
+        stats_cache.get_snapshot('test', lambda: 1)
+        self.cache.set(stats_cache.DIRTY_KEY, time.time() + 1, None)
+        self.cache.add(self.LOCK_KEY, 1)
+        self.assertEqual(stats_cache.get_snapshot('test', lambda: 2)[0], 1)
+        self.assertEqual(self.cache.get(self.LOCK_KEY), 1)
+
+    def test_cold_start_keeps_other_lock(self):
+        self.cache.add(self.LOCK_KEY, 1)
+        with mock.patch.object(stats_cache, 'COLD_WAIT_SECONDS', 0.2):
+            self.assertEqual(stats_cache.get_snapshot('test', lambda: 1)[0], 1)
+        self.assertEqual(self.cache.get(self.LOCK_KEY), 1)
+
+
+@unittest.skipUnless(HAS_NUMPY, 'numpy 필요')
+class SpeechRegionTest(SimpleTestCase):
+    """VAD 구간: 여유(pad)를 붙인 구간끼리 겹치지 않고, int16 / float 입력 결과가 같음"""
+
+    def signal(self, bursts, total=4.0):
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        audio = rng.normal(0, 0.001, int(total * 16000)).astype(np.float32)  # 약 -60dBFS 잡음
+        for start, end in bursts:
+            audio[int(start * 16000):int(end * 16000)] += rng.normal(0, 0.1, int((end - start) * 16000))
+        return audio
+
+    def assertDisjoint(self, regions):
+        for (_, end), (start, _) in zip(regions, regions[1:]):
+            self.assertLess(end, start)
+
+    def test_padded_regions_do_not_overlap(self):
+        # 0.36초 끊김: min_gap(0.3초)보다 길지만 양쪽 pad(0.2초씩)를 붙이면 겹침
+        regions = detect_speech_regions(self.signal([(0.5, 1.0), (1.36, 2.0), (3.0, 3.5)]))
+        self.assertEqual(len(regions), 2)
+        self.assertDisjoint(regions)
+        self.assertAlmostEqual(regions[0][0], 0.3, delta=0.05)
+        self.assertAlmostEqual(regions[0][1], 2.2, delta=0.05)
+
+    def test_int16_matches_float(self):
+        import numpy as np
+
+        audio = self.signal([(0.5, 1.0), (2.0, 3.0)])
+        pcm = np.clip(audio * 32768, -32768, 32767).astype('<i2')
+        self.assertEqual(len(detect_speech_regions(pcm)), len(detect_speech_regions(audio)))
+
+    def test_silence(self):
+        import numpy as np
+
+        self.assertEqual(detect_speech_regions(np.zeros(16000 * 2, dtype=np.float32)), [])
+        self.assertEqual(detect_speech_regions(np.zeros(0, dtype=np.float32)), [])
+
+    def test_split_long_region(self):
+        audio = self.signal([(0.0, 20.0), (20.5, 70.0)], total=70.0)
+        pieces = split_long_regions(audio, [(0.0, 70.0)])
+        self.assertTrue(all(end - start <= 30.0 for start, end in pieces))
+        self.assertAlmostEqual(pieces[0][1], 20.25, delta=0.3)  # 가장 조용한 틈에서 자름
@@ -0,0 +1,243 @@
+# voice_app/transcoding.py
+"""
+ffmpeg 변환 서비스
+
+- ffprobe를 따로 실행하지 않고 ffmpeg 한 번으로 입력 스트림 정보(코덱, 샘플레이트, 채널, 길이)
+  확인과 16kHz 모노 PCM WAV 변환을 동시에 수행 (stderr의 스트림 정보를 파싱)
+- 손상된 파일 복구용 `-err_detect ignore_err`를 처음부터 적용해 재시도 프로세스를 띄우지 않음
+- 변환은 크기가 제한된 스레드 풀에서 실행 (TRANSCODE_POOL_SIZE, 기본값: CPU 코어 수)
+  대기열이 가득 차면 TRANSCODE_QUEUE_TIMEOUT 초 동안 기다린 뒤 TranscodeQueueFull 발생
+- 업로드 중 스트리밍 변환(upload_handlers)도 같은 ffmpeg 실행 슬롯(TRANSCODE_POOL_SIZE개)을 사용
+  빈 슬롯이 없으면 기다리지 않고 업로드 완료 후 풀에서 변환
+- 대기 시간 / 변환 시간 통계는 get_transcode_metrics()로 조회 (/api/status/)
+"""
+
+import os
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+STREAM_RE = re.compile(r'Stream #0:\d+.*?: Audio: (?P<codec>[\w]+).*?, (?P<rate>\d+) Hz, (?P<layout>[^,]+)')
+DURATION_RE = re.compile(r'Duration: (?P<h>\d+):(?P<m>\d+):(?P<s>\d+(?:\.\d+)?)')
+
+
+class TranscodeError(Exception):
+    """ffmpeg 변환 실패 (stderr 포함)"""
+
+    def __init__(self, message, stderr=''):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+class TranscodeQueueFull(TranscodeError):
+    """변환 대기열이 가득 참"""
+
+
+def parse_stream_info(stderr):
+    """
+    ffmpeg stderr에서 첫 번째 입력 오디오 스트림 정보 추출
+
+    Returns:
+        dict: codec, sample_rate, channels, duration (찾지 못한 값은 None)
+    """
+    info = {'codec': None, 'sample_rate': None, 'channels': None, 'duration': None}
+
+    # 'Output #0' 이후는 출력 스트림 정보이므로 입력 부분만 사용
+    input_section = stderr.split('Output #0', 1)[0]
+
+    match = STREAM_RE.search(input_section)
+    if match:
+        layout = match.group('layout').strip()
+        info['codec'] = match.group('codec')
+        info['sample_rate'] = int(match.group('rate'))
+        if layout == 'mono':
+            info['channels'] = 1
+        elif layout == 'stereo':
+            info['channels'] = 2
+        else:
+            channels = re.match(r'(\d+) channels', layout)
+            info['channels'] = int(channels.group(1)) if channels else None
+
+    match = DURATION_RE.search(input_section)
+    if match:
+        info['duration'] = int(match.group('h')) * 3600 + int(match.group('m')) * 60 + float(match.group('s'))
+
+    return info
+
+
+def run_ffmpeg_to_wav(input_path, output_path, timeout=None):
+    """
+    ffmpeg 한 번 실행으로 입력 정보 확인 + 16kHz 모노 PCM WAV 변환.
+    입력과 출력 경로가 같으면 임시 파일에 쓴 뒤 교체한다.
+
+    Returns:
+        dict: 입력 스트림 정보 (parse_stream_info 결과)
+    """
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Input file does not exist: {input_path}")
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    same_file = os.path.abspath(input_path) == os.path.abspath(output_path)
+    target = output_path + '.tmp.wav' if same_file else output_path
+
+    command = [
+        'ffmpeg', '-y', '-hide_banner', '-nostdin',
+        '-err_detect', 'ignore_err',
+        '-i', input_path,
+        '-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1',
+        target,
+    ]
+    timeout = timeout or getattr(settings, 'TRANSCODE_TIMEOUT', 60)
+
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if os.path.exists(target) and same_file:
+            os.remove(target)
+        raise TranscodeError("ffmpeg conversion timed out")
+
+    if result.returncode != 0 or not os.path.exists(target):
+        if same_file and os.path.exists(target):
+            os.remove(target)
+        raise TranscodeError(f"ffmpeg conversion failed: {result.stderr}", stderr=result.stderr)
+
+    if same_file:
+        os.replace(target, output_path)
+
+    return parse_stream_info(result.stderr)
+
+
+class TranscodeService:
+    """크기 제한 스레드 풀 + 대기열 + 처리 시간 통계"""
+
+    def __init__(self, pool_size=None, queue_size=None, queue_timeout=None):
+        self.pool_size = pool_size or getattr(settings, 'TRANSCODE_POOL_SIZE', None) or os.cpu_count() or 1
+        queue_size = queue_size if queue_size is not None else getattr(settings, 'TRANSCODE_QUEUE_SIZE', self.pool_size * 4)
+        self.queue_timeout = queue_timeout if queue_timeout is not None else getattr(settings, 'TRANSCODE_QUEUE_TIMEOUT', 30)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix='transcode')
+        # 실행 중 + 대기 중 작업 수 제한
+        self._slots = threading.BoundedSemaphore(self.pool_size + queue_size)
+        self._capacity = self.pool_size + queue_size
+        # 동시에 실행되는 ffmpeg 프로세스 수 제한 (풀 변환 + 업로드 스트리밍 변환)
+        self._processes = threading.BoundedSemaphore(self.pool_size)
+
+        self._lock = threading.Lock()
+        self._waits = deque(maxlen=500)
+        self._durations = deque(maxlen=500)
+        self._counts = {'completed': 0, 'failed': 0, 'rejected': 0, 'stream_fallback': 0}
+        self._running = 0
+        self._pending = 0
+        self._streaming = 0
+
+    def transcode(self, input_path, output_path, timeout=None):
+        """변환 작업을 풀에 넣고 완료될 때까지 대기 (결과에 queue_wait / elapsed 포함)"""
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self._counts['rejected'] += 1
+            raise TranscodeQueueFull(f"변환 대기열이 가득 찼습니다 ({self._capacity}개 처리/대기 중)")
+
+        submitted = time.perf_counter()
+        with self._lock:
+            self._pending += 1
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self._pending -= 1
+                self._running += 1
+                self._waits.append(started - submitted)
+            try:
+                with self._processes:
+                    info = run_ffmpeg_to_wav(input_path, output_path, timeout=timeout)
+                success = True
+                return {'input': info, 'queue_wait': started - submitted, 'elapsed': time.perf_counter() - started}
+            except Exception:
+                success = False
+                raise
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._durations.append(time.perf_counter() - started)
+                    self._counts['completed' if success else 'failed'] += 1
+                self._slots.release()
+
+        return self._executor.submit(job).result()
+
+    def try_acquire_stream(self):
+        """업로드 스트리밍 변환용 ffmpeg 슬롯 (비어 있지 않으면 기다리지 않고 False)"""
+        acquired = self._processes.acquire(blocking=False)
+        with self._lock:
+            if acquired:
+                self._streaming += 1
+            else:
+                self._counts['stream_fallback'] += 1
+        return acquired
+
+    def release_stream(self):
+        with self._lock:
+            self._streaming -= 1
+        self._processes.release()
+
+    def metrics(self):
+        with self._lock:
+            waits = sorted(self._waits)
+            durations = sorted(self._durations)
+            return {
+                'pool_size': self.pool_size,
+                'capacity': self._capacity,
+                'running': self._running,
+                'queued': self._pending,
+                'streaming': self._streaming,
+                **self._counts,
+                'queue_wait_ms': _percentiles(waits),
+                'transcode_ms': _percentiles(durations),
+            }
+
+
+def _percentiles(values):
+    if not values:
+        return {'p50': None, 'p95': None, 'max': None}
+
+    def pick(q):
+        return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 1)
+
+    return {'p50': pick(0.5), 'p95': pick(0.95), 'max': round(values[-1] * 1000, 1)}
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_transcode_service():
+    """프로세스당 하나의 TranscodeService"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = TranscodeService()
+    return _service
+
+
+def transcode_to_wav(input_path, output_path, timeout=None):
+    return get_transcode_service().transcode(input_path, output_path, timeout=timeout)
+
+
+def acquire_stream_slot():
+    return get_transcode_service().try_acquire_stream()
+
+
+def release_stream_slot():
+    get_transcode_service().release_stream()
+
+
+def get_transcode_metrics():
+    # 아직 변환이 한 번도 없으면 풀을 만들지 않음
+    if _service is None:
+        return {'pool_size': getattr(settings, 'TRANSCODE_POOL_SIZE', None) or os.cpu_count(), 'completed': 0}
+    return _service.metrics()
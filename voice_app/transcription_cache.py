@@ -0,0 +1,163 @@
+# voice_app/transcription_cache.py
+"""
+내용 주소 기반(content-addressed) 전사 캐시
+
+- 키: 오디오 파일 SHA256 + 종류(transcript/alignment) + 모델 이름 + 언어 + 디코딩 옵션
+  → 같은 바이트의 재업로드, 앱 재시도, reset_processing_status 후 재전사에서 Whisper를 다시 실행하지 않음
+- 저장소: TranscriptionCache 테이블 (프로세스/워커 간 공유, 재시작 후에도 유지)
+- 용량 제한: TRANSCRIPTION_CACHE_MAX_ENTRIES / TRANSCRIPTION_CACHE_MAX_BYTES 초과 시
+  last_used_at이 오래된 항목부터 삭제 (LRU)
+  (정리는 프로세스당 TRANSCRIPTION_CACHE_EVICT_INTERVAL 초에 한 번 - 저장할 때마다 전체 COUNT/SUM을 하지 않음)
+- 파일 해시는 (경로, 크기, 수정 시각) 기준으로 프로세스 안에서 재사용
+"""
+
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .hashing import file_sha256
+
+_last_evicted = None  # 이 프로세스에서 마지막으로 evict()를 실행한 시각 (time.monotonic)
+
+
+def cache_enabled():
+    return getattr(settings, 'TRANSCRIPTION_CACHE_ENABLED', True)
+
+
+@lru_cache(maxsize=1024)
+def _hash_file(path, size, mtime_ns):
+    return file_sha256(path)
+
+
+def audio_sha256(path):
+    """파일 SHA256 (같은 파일을 다시 읽지 않도록 크기/수정 시각 기준으로 메모이즈)"""
+    stat = os.stat(path)
+    return _hash_file(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+def make_key(sha256, kind, model_name, language='', options=None):
+    payload = json.dumps(
+        [sha256, kind, model_name, language or '', options or {}],
+        sort_keys=True, ensure_ascii=False, separators=(',', ':'),
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def get_cached(audio_path, kind, model_name, language='', options=None):
+    """
+    캐시된 결과 반환 (없으면 None). 적중 시 last_used_at / hit_count 갱신.
+    """
+    from .models import TranscriptionCache
+
+    if not cache_enabled():
+        return None
+
+    try:
+        key = make_key(audio_sha256(audio_path), kind, model_name, language, options)
+    except OSError:
+        return None
+
+    entry = TranscriptionCache.objects.filter(key=key).values('id', 'result').first()
+    if entry is None:
+        return None
+
+    TranscriptionCache.objects.filter(id=entry['id']).update(
+        last_used_at=timezone.now(), hit_count=F('hit_count') + 1,
+    )
+    print(f"[Cache] {kind} hit for {os.path.basename(audio_path)} ({model_name})")
+    return entry['result']
+
+
+def store(audio_path, kind, model_name, result, language='', options=None):
+    """결과를 캐시에 저장하고 용량 제한을 넘으면 오래된 항목 정리"""
+    from .models import TranscriptionCache
+
+    if not cache_enabled() or result is None:
+        return
+
+    try:
+        sha256 = audio_sha256(audio_path)
+    except OSError:
+        return
+
+    key = make_key(sha256, kind, model_name, language, options)
+    size_bytes = len(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+    defaults = {
+        'audio_sha256': sha256,
+        'kind': kind,
+        'model_name': model_name,
+        'language': language or '',
+        'options': options or {},
+        'result': result,
+        'size_bytes': size_bytes,
+        'last_used_at': timezone.now(),
+    }
+    try:
+        TranscriptionCache.objects.update_or_create(key=key, defaults=defaults)
+    except IntegrityError:
+        # 다른 워커가 같은 키를 동시에 저장한 경우 - 결과는 동일하므로 무시
+        return
+
+    maybe_evict()
+
+
+def maybe_evict():
+    """마지막 정리 후 TRANSCRIPTION_CACHE_EVICT_INTERVAL 초가 지났으면 evict() (프로세스 시작 후 첫 저장 포함)"""
+    global _last_evicted
+
+    interval = getattr(settings, 'TRANSCRIPTION_CACHE_EVICT_INTERVAL', 300)
+    now = time.monotonic()
+    if _last_evicted is not None and now - _last_evicted < interval:
+        return 0
+    _last_evicted = now
+    return evict()
+
+
+def _delete_ids(ids, batch_size=500):
+    from .models import TranscriptionCache
+
+    deleted = 0
+    for offset in range(0, len(ids), batch_size):
+        deleted += TranscriptionCache.objects.filter(id__in=ids[offset:offset + batch_size]).delete()[0]
+    return deleted
+
+
+def evict(max_entries=None, max_bytes=None):
+    """
+    LRU 정리: 항목 수 / 전체 크기 제한을 넘는 만큼 last_used_at이 오래된 항목부터 삭제
+
+    Returns:
+        int: 삭제된 항목 수
+    """
+    from .models import TranscriptionCache
+
+    max_entries = max_entries if max_entries is not None else getattr(settings, 'TRANSCRIPTION_CACHE_MAX_ENTRIES', 50000)
+    max_bytes = max_bytes if max_bytes is not None else getattr(settings, 'TRANSCRIPTION_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+
+    entries = TranscriptionCache.objects.order_by('last_used_at', 'id')
+    deleted = 0
+
+    overflow = entries.count() - max_entries
+    if overflow > 0:
+        deleted += _delete_ids(list(entries.values_list('id', flat=True)[:overflow]))
+
+    total_bytes = TranscriptionCache.objects.aggregate(total=Sum('size_bytes'))['total'] or 0
+    if total_bytes > max_bytes:
+        ids = []
+        for entry_id, size_bytes in entries.values_list('id', 'size_bytes').iterator(chunk_size=1000):
+            if total_bytes <= max_bytes:
+                break
+            ids.append(entry_id)
+            total_bytes -= size_bytes
+        deleted += _delete_ids(ids)
+
+    if deleted:
+        print(f"[Cache] Evicted {deleted} entries")
+    return deleted
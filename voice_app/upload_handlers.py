@@ -0,0 +1,173 @@
+# voice_app/upload_handlers.py
+"""
+스트리밍 업로드 핸들러
+
+- 업로드 청크를 메모리에 모으지 않고 바로 디스크 임시 파일에 기록
+- 청크가 도착하는 대로 SHA256 해시 계산 (업로드 완료 후 파일을 다시 읽지 않음)
+- 파이프 입력이 가능한 형식(wav, mp3, flac, ogg, opus, webm)은 청크를 ffmpeg stdin으로
+  흘려보내 업로드가 끝나기 전에 16kHz 모노 WAV 변환을 시작
+  (m4a/mp4는 moov atom이 파일 끝에 있는 경우가 많아 업로드 완료 후 변환,
+   이미 16kHz 모노 PCM WAV인 경우는 변환하지 않음)
+- 스트리밍 변환은 변환 서비스의 ffmpeg 실행 슬롯을 사용 (transcoding.acquire_stream_slot)
+  빈 슬롯이 없으면 ffmpeg를 띄우지 않고 업로드 완료 후 일반 변환으로 처리
+
+업로드 크기와 관계없이 요청당 메모리 사용량은 청크 크기(기본 64KB) 수준으로 유지된다.
+settings.FILE_UPLOAD_HANDLERS 에 등록해서 사용.
+"""
+
+import hashlib
+import os
+import subprocess
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+from .audio_analysis import is_whisper_ready, parse_wav_header
+from .transcoding import acquire_stream_slot, release_stream_slot
+
+# ffmpeg가 stdin(pipe)에서 바로 디코딩할 수 있는 확장자
+PIPE_TRANSCODE_EXTENSIONS = {'wav', 'mp3', 'flac', 'ogg', 'opus', 'webm'}
+
+
+class StreamedUploadedFile(TemporaryUploadedFile):
+    """
+    디스크 임시 파일 + 업로드 중 계산된 부가 정보
+    - sha256: 업로드 바이트 전체의 SHA256
+    - streamed_wav_path: 업로드와 동시에 변환된 WAV 경로 (없으면 None)
+    """
+
+    sha256 = None
+    streamed_wav_path = None
+
+    def close(self):
+        # 뷰에서 가져가지 않은 변환 결과는 요청 종료 시 정리
+        if self.streamed_wav_path and os.path.exists(self.streamed_wav_path):
+            try:
+                os.remove(self.streamed_wav_path)
+            except OSError:
+                pass
+        self.streamed_wav_path = None
+        return super().close()
+
+
+class StreamingAudioUploadHandler(FileUploadHandler):
+    """청크 단위로 디스크에 기록하면서 해시 계산 및 ffmpeg 스트리밍 변환"""
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = StreamedUploadedFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.hasher = hashlib.sha256()
+        self.transcoder = None
+        self.transcode_path = None
+        self.transcode_log = None
+        self.stream_slot = False
+
+        ext = os.path.splitext(self.file_name or '')[1].lstrip('.').lower()
+        # ffmpeg는 첫 청크를 받은 뒤 시작 (이미 16kHz 모노 PCM WAV면 변환하지 않음)
+        self.transcode_pending = getattr(settings, 'UPLOAD_STREAM_TRANSCODE', True) and ext in PIPE_TRANSCODE_EXTENSIONS
+
+    def _start_transcoder(self, first_chunk):
+        self.transcode_pending = False
+        if is_whisper_ready(parse_wav_header(first_chunk)):
+            return
+        if not acquire_stream_slot():
+            print(f"[Upload] No free ffmpeg slot for {self.file_name} - converting after upload")
+            return
+        self.stream_slot = True
+
+        fd, self.transcode_path = tempfile.mkstemp(suffix='.wav', dir=settings.FILE_UPLOAD_TEMP_DIR)
+        os.close(fd)
+        self.transcode_log = tempfile.TemporaryFile(dir=settings.FILE_UPLOAD_TEMP_DIR)
+
+        command = [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', 'pipe:0',
+            '-acodec', 'pcm_s16le',
+            '-ar', '16000',
+            '-ac', '1',
+            '-f', 'wav', self.transcode_path,
+        ]
+        try:
+            # stderr는 파일로 보내 파이프 버퍼가 가득 차서 멈추는 일이 없도록 함
+            self.transcoder = subprocess.Popen(
+                command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=self.transcode_log
+            )
+        except OSError as e:
+            print(f"[Upload] ffmpeg streaming disabled: {e}")
+            self._discard_transcode()
+
+    def _release_slot(self):
+        if self.stream_slot:
+            self.stream_slot = False
+            release_stream_slot()
+
+    def _discard_transcode(self):
+        if self.transcoder and self.transcoder.poll() is None:
+            self.transcoder.kill()
+            self.transcoder.wait()
+        self.transcoder = None
+        self._release_slot()
+        if self.transcode_path and os.path.exists(self.transcode_path):
+            os.remove(self.transcode_path)
+        self.transcode_path = None
+        if self.transcode_log:
+            self.transcode_log.close()
+            self.transcode_log = None
+
+    def receive_data_chunk(self, raw_data, start):
+        self.hasher.update(raw_data)
+        self.file.write(raw_data)
+
+        if self.transcode_pending:
+            self._start_transcoder(raw_data)
+
+        if self.transcoder:
+            try:
+                self.transcoder.stdin.write(raw_data)
+            except (BrokenPipeError, OSError) as e:
+                # ffmpeg가 입력을 거부한 경우 → 업로드 완료 후 일반 변환으로 대체
+                print(f"[Upload] ffmpeg stream aborted for {self.file_name}: {e}")
+                self._discard_transcode()
+        # None 반환 → 다음 핸들러로 청크를 넘기지 않음
+        return None
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.sha256 = self.hasher.hexdigest()
+
+        if self.transcoder:
+            try:
+                self.transcoder.stdin.close()
+                returncode = self.transcoder.wait(timeout=60)
+            except (subprocess.TimeoutExpired, OSError) as e:
+                print(f"[Upload] ffmpeg stream did not finish for {self.file_name}: {e}")
+                returncode = None
+
+            if returncode == 0 and os.path.getsize(self.transcode_path) > 44:
+                self.file.streamed_wav_path = self.transcode_path
+                self.transcode_log.close()
+                self.transcoder = None
+                self.transcode_path = None
+                self.transcode_log = None
+                self._release_slot()
+            else:
+                self.transcode_log.seek(0)
+                stderr = self.transcode_log.read().decode(errors='ignore').strip()
+                print(f"[Upload] ffmpeg stream failed for {self.file_name} (code {returncode}): {stderr[-500:]}")
+                self._discard_transcode()
+
+        print(f"[Upload] Received {self.file_name}: {file_size} bytes, sha256={self.file.sha256[:12]}…")
+        return self.file
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file'):
+            self._discard_transcode()
+            temp_location = self.file.temporary_file_path()
+            try:
+                self.file.close()
+                os.remove(temp_location)
+            except FileNotFoundError:
+                pass
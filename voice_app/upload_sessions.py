@@ -0,0 +1,264 @@
+# voice_app/upload_sessions.py
+"""
+재개 가능한 청크 업로드 (모바일 앱용)
+
+1. POST   /api/uploads/                              세션 생성 (파일 크기, 청크 크기, 메타데이터)
+2. PUT    /api/uploads/<upload_id>/chunks/<index>/   청크 전송 (Upload-Offset 헤더 = index * chunk_size)
+3. GET    /api/uploads/<upload_id>/                  진행 상황 조회 (누락된 청크 목록)
+4. POST   /api/uploads/<upload_id>/finalize/         SHA256 검증 후 AudioUploadView와 동일하게 변환/저장
+   - uploading → finalizing 조건부 UPDATE에 성공한 요청만 조립/변환을 수행하므로
+     응답을 못 받은 클라이언트가 finalize를 다시 보내도 AudioRecord가 두 번 만들어지지 않음
+     (처리 중이면 409, 이미 완료됐으면 기존 결과 반환)
+
+청크는 미리 전체 크기로 만들어 둔 .part 파일의 해당 위치에 바로 기록되므로
+순서와 관계없이 재전송할 수 있고, 끊긴 경우 누락된 청크만 다시 보내면 된다.
+"""
+
+import hashlib
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from .hashing import file_sha256
+from .models import UploadSession
+
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class UploadSessionError(Exception):
+    """업로드 세션 오류 (status_code는 HTTP 응답 코드)"""
+
+    def __init__(self, message, status_code=400, **extra):
+        super().__init__(message)
+        self.status_code = status_code
+        self.extra = extra
+
+
+class AssembledUpload(File):
+    """
+    조립이 끝난 .part 파일을 UploadedFile처럼 다루기 위한 래퍼.
+    temporary_file_path()가 있으므로 default_storage.save()가 복사 대신 이동한다.
+    """
+
+    def __init__(self, path, name, content_type='', sha256=None):
+        super().__init__(open(path, 'rb'), name=name)
+        self._path = path
+        self.content_type = content_type
+        self.sha256 = sha256
+
+    def temporary_file_path(self):
+        return self._path
+
+
+def session_dir():
+    path = getattr(settings, 'UPLOAD_SESSION_DIR', os.path.join(settings.MEDIA_ROOT, 'upload_sessions'))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def session_file_path(session):
+    return os.path.join(session_dir(), f"{session.upload_id.hex}.part")
+
+
+def _normalize_metadata(metadata):
+    """폼 필드와 같은 형태가 되도록 스칼라 값은 문자열로 변환 (dict/list는 그대로)"""
+    normalized = {}
+    for key, value in (metadata or {}).items():
+        if value is None or isinstance(value, (dict, list, str)):
+            normalized[key] = value
+        elif isinstance(value, bool):
+            normalized[key] = 'true' if value else 'false'
+        else:
+            normalized[key] = str(value)
+    return normalized
+
+
+def create_session(filename, total_size, chunk_size=None, category='normal',
+                   content_type='', checksum='', metadata=None):
+    """세션 생성 및 전체 크기의 .part 파일 미리 할당"""
+    max_size = getattr(settings, 'UPLOAD_SESSION_MAX_SIZE', 200 * 1024 * 1024)
+    max_chunk = getattr(settings, 'UPLOAD_CHUNK_MAX_SIZE', 8 * 1024 * 1024)
+    chunk_size = chunk_size or getattr(settings, 'UPLOAD_CHUNK_DEFAULT_SIZE', 1024 * 1024)
+
+    if not filename:
+        raise UploadSessionError('filename이 필요합니다.')
+    if total_size <= 0 or total_size > max_size:
+        raise UploadSessionError(f'total_size는 1 ~ {max_size} bytes 범위여야 합니다.')
+    if chunk_size <= 0 or chunk_size > max_chunk:
+        raise UploadSessionError(f'chunk_size는 1 ~ {max_chunk} bytes 범위여야 합니다.')
+
+    session = UploadSession.objects.create(
+        filename=os.path.basename(filename),
+        category=category or 'normal',
+        content_type=content_type or '',
+        total_size=total_size,
+        chunk_size=chunk_size,
+        checksum=(checksum or '').lower(),
+        metadata=_normalize_metadata(metadata),
+    )
+
+    with open(session_file_path(session), 'wb') as f:
+        f.truncate(total_size)
+
+    print(f"[UploadSession] Created {session.upload_id}: {session.filename}, "
+          f"{total_size} bytes in {session.chunk_count} chunks")
+    return session
+
+
+def get_session(upload_id):
+    try:
+        return UploadSession.objects.get(upload_id=upload_id)
+    except UploadSession.DoesNotExist:
+        raise UploadSessionError('업로드 세션을 찾을 수 없습니다.', status_code=404)
+
+
+def session_progress(session):
+    return {
+        'upload_id': str(session.upload_id),
+        'status': session.status,
+        'filename': session.filename,
+        'total_size': session.total_size,
+        'chunk_size': session.chunk_size,
+        'chunk_count': session.chunk_count,
+        'received_size': session.received_size,
+        'received_chunks': sorted(session.received_chunks),
+        'missing_chunks': session.missing_chunks(),
+        'audio_id': session.audio_id,
+        'error': session.error or None,
+    }
+
+
+def write_chunk(session, index, stream, length, offset=None, chunk_sha256=None):
+    """
+    청크를 .part 파일의 해당 위치에 기록.
+    요청 본문을 STREAM_BLOCK_SIZE 단위로 읽으므로 청크 전체를 메모리에 올리지 않는다.
+    이미 받은 청크를 다시 보내면 덮어쓰고 성공으로 처리 (재시도 안전).
+    """
+    if session.status != 'uploading':
+        raise UploadSessionError(f'이미 {session.get_status_display()} 상태인 세션입니다.', status_code=409)
+    if index < 0 or index >= session.chunk_count:
+        raise UploadSessionError(f'청크 번호는 0 ~ {session.chunk_count - 1} 범위여야 합니다.')
+
+    expected_offset = index * session.chunk_size
+    if offset is not None and offset != expected_offset:
+        raise UploadSessionError(
+            f'offset이 맞지 않습니다 (기대값 {expected_offset}).',
+            status_code=409, expected_offset=expected_offset,
+        )
+
+    expected_length = session.expected_chunk_length(index)
+    if length != expected_length:
+        raise UploadSessionError(f'청크 크기가 맞지 않습니다 (기대값 {expected_length} bytes).')
+
+    hasher = hashlib.sha256()
+    written = 0
+    with open(session_file_path(session), 'r+b') as f:
+        f.seek(expected_offset)
+        while written < expected_length:
+            block = stream.read(min(STREAM_BLOCK_SIZE, expected_length - written))
+            if not block:
+                break
+            hasher.update(block)
+            f.write(block)
+            written += len(block)
+
+    if written != expected_length:
+        raise UploadSessionError(f'청크가 중간에 끊겼습니다 ({written}/{expected_length} bytes).')
+    if chunk_sha256 and hasher.hexdigest() != chunk_sha256.lower():
+        raise UploadSessionError('청크 SHA256이 일치하지 않습니다.', status_code=422)
+
+    # 동시에 여러 청크가 도착해도 목록이 유실되지 않도록 잠금 후 갱신
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(pk=session.pk)
+        if index not in session.received_chunks:
+            session.received_chunks.append(index)
+            session.received_size += expected_length
+            session.save(update_fields=['received_chunks', 'received_size', 'updated_at'])
+    return session
+
+
+def begin_finalize(session):
+    """
+    finalize 소유권 획득 (uploading → finalizing 조건부 UPDATE).
+    이미 완료된 세션이면 그대로 반환하고 (호출한 쪽에서 기존 결과 응답),
+    다른 요청이 조립 중이거나 실패한 세션이면 UploadSessionError.
+    """
+    claimed = UploadSession.objects.filter(pk=session.pk, status='uploading').update(
+        status='finalizing', updated_at=timezone.now(),
+    )
+    session.refresh_from_db()
+    if claimed or session.status == 'completed':
+        return session
+    if session.status == 'finalizing':
+        raise UploadSessionError('다른 요청이 이 업로드를 처리 중입니다. 잠시 후 상태를 확인하세요.',
+                                 status_code=409, status=session.status)
+    raise UploadSessionError(f'이미 {session.get_status_display()} 상태인 세션입니다.',
+                             status_code=409, status=session.status)
+
+
+def reopen_session(session):
+    """finalize 중단 (누락된 청크 등) - 청크를 다시 받을 수 있도록 uploading으로 되돌림"""
+    UploadSession.objects.filter(pk=session.pk, status='finalizing').update(
+        status='uploading', updated_at=timezone.now(),
+    )
+    session.refresh_from_db()
+
+
+def assemble_session(session, checksum=None):
+    """
+    모든 청크 수신 여부와 SHA256을 확인한 뒤 조립된 파일 반환.
+    체크섬이 맞지 않으면 세션을 실패 처리하고 .part 파일을 삭제한다.
+    """
+    missing = session.missing_chunks()
+    if missing:
+        raise UploadSessionError('누락된 청크가 있습니다.', status_code=409, missing_chunks=missing)
+
+    path = session_file_path(session)
+    if not os.path.exists(path):
+        raise UploadSessionError('업로드 파일이 없습니다. 세션을 다시 생성하세요.', status_code=410)
+
+    actual = file_sha256(path)
+    expected = (checksum or session.checksum or '').lower()
+    if expected and actual != expected:
+        fail_session(session, f'SHA256 불일치 (expected {expected}, actual {actual})')
+        raise UploadSessionError('파일 SHA256이 일치하지 않습니다. 처음부터 다시 업로드하세요.',
+                                 status_code=422, sha256=actual)
+
+    return AssembledUpload(path, session.filename, session.content_type, sha256=actual)
+
+
+def complete_session(session, audio_id):
+    session.status = 'completed'
+    session.audio_id = audio_id
+    session.completed_at = timezone.now()
+    session.save(update_fields=['status', 'audio', 'completed_at', 'updated_at'])
+    remove_session_file(session)
+
+
+def fail_session(session, error):
+    session.status = 'failed'
+    session.error = error
+    session.save(update_fields=['status', 'error', 'updated_at'])
+    remove_session_file(session)
+
+
+def remove_session_file(session):
+    path = session_file_path(session)
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def purge_stale_sessions(max_age_hours=24):
+    """오래된 미완료 세션의 .part 파일 정리 (세션은 failed로 기록, finalize 중 멈춘 세션 포함)"""
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    stale = UploadSession.objects.filter(status__in=('uploading', 'finalizing'), updated_at__lt=cutoff)
+    count = 0
+    for session in stale.iterator():
+        fail_session(session, f'{max_age_hours}시간 동안 업로드가 완료되지 않아 만료됨')
+        count += 1
+    print(f"[UploadSession] Purged {count} stale sessions")
+    return count
@@ -4,7 +4,7 @@ from . import views
 from .views import AudioUploadView, SimpleCategoryUploadView
 from .views import audio_list, delete_all_audios, category_audio_list, audio_detail, dashboard, userprofile
 from .views import update_transcription, update_audio_metadata
-from .views import transcribe_unprocessed
+from .views import transcribe_unprocessed, get_transcription_status
 from .views import api_all_audio_list, api_audio_detail, api_participant_metadata, api_category_participant_metadata
 from .views import whisperx_transcribe, whisperx_transcribe_simple
 from .views import whisperx_align_audio, get_alignment_data, get_alignment_status
@@ -42,6 +42,12 @@ urlpatterns = [
     path('config/', views.api_config, name='api_config'),
     path('test-upload/', views.test_file_upload, name='api_test_upload'),  # React Native 테스트용
     
+    # 재개 가능한 청크 업로드 (모바일 앱용)
+    path('uploads/', views.upload_session_create, name='upload_session_create'),
+    path('uploads/<uuid:upload_id>/', views.upload_session_status, name='upload_session_status'),
+    path('uploads/<uuid:upload_id>/chunks/<int:index>/', views.upload_session_chunk, name='upload_session_chunk'),
+    path('uploads/<uuid:upload_id>/finalize/', views.upload_session_finalize, name='upload_session_finalize'),
+    
     # 웹 인터페이스 URL들
     path('list/', views.audio_list, name='audio_list'),
     path('dashboard/', dashboard, name='dashboard'),
@@ -70,6 +76,7 @@ urlpatterns = [
     path('update-metadata/<int:audio_id>/', update_audio_metadata, name='update_audio_metadata'),
     path('transcribe/', transcribe_unprocessed, name='transcribe_unprocessed'),
     path('transcribe/<int:audio_id>/', views.transcribe_single_audio, name='transcribe_single_audio'),
+    path('transcription-status/<int:audio_id>/', get_transcription_status, name='get_transcription_status'),
     
     # WhisperX API 엔드포인트
     path('whisperx/transcribe/', whisperx_transcribe, name='whisperx_transcribe'),
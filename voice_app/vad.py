@@ -0,0 +1,208 @@
+# voice_app/vad.py
+"""
+에너지 기반 음성 구간 검출(VAD) + 구간 단위 Whisper 전사
+
+아동/청각장애 녹음은 긴 휴지와 안내 음성 재생 구간이 많아 파일 전체를 전사하면
+무음 구간에도 encoder 연산이 낭비된다.
+
+1. 30ms 프레임 에너지로 잡음 기준(하위 퍼센타일)을 추정하고 그보다 큰 프레임을 음성으로 판정
+   (audio_analysis.frame_powers / noise_floor_power - 업로드 무음 판정, SNR 추정과 같은 기준)
+2. 짧은 끊김은 합치고(min_gap), 너무 짧은 구간은 버리고(min_speech), 앞뒤로 여유(pad)를 둔 뒤
+   여유 때문에 겹치게 된 구간을 다시 합침 (윈도우에 같은 오디오가 두 번 들어가지 않도록)
+3. 30초보다 긴 음성 구간은 뒤쪽 절반에서 에너지가 가장 낮은 프레임(숨 쉬는 틈 등)을 경계로 나눔
+   (고정 간격으로 자르면 경계의 단어가 잘리거나 양쪽에 중복됨)
+4. 음성 구간만 이어 붙여 30초 이하 윈도우로 묶고, 윈도우들을 배치로 디코딩
+5. 윈도우 텍스트를 순서대로 이어 붙이고, 윈도우별 원본 시간(start/end)을 segments로 반환
+   (음성 구간이 없으면 빈 text - 전사 실패가 아님)
+"""
+
+import time
+
+from .audio_analysis import MIN_SPEECH_DBFS, SPEECH_MARGIN_DB, frame_powers, noise_floor_power
+
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30.0
+
+FRAME_MS = 30
+MIN_SPEECH_SECONDS = 0.25
+MIN_GAP_SECONDS = 0.3
+PAD_SECONDS = 0.2
+JOIN_SILENCE_SECONDS = 0.2
+
+
+def detect_speech_regions(audio, sample_rate=SAMPLE_RATE, frame_ms=FRAME_MS,
+                          speech_margin_db=SPEECH_MARGIN_DB, min_speech_dbfs=MIN_SPEECH_DBFS,
+                          min_speech=MIN_SPEECH_SECONDS, min_gap=MIN_GAP_SECONDS, pad=PAD_SECONDS):
+    """
+    Args:
+        audio: float32 샘플 (-1.0 ~ 1.0) 또는 16bit PCM memmap (load_audio)
+
+    Returns:
+        list: [(start_sec, end_sec), ...] 겹치지 않는 음성 구간 (시간순)
+    """
+    import numpy as np
+
+    powers = frame_powers(audio, sample_rate, frame_ms)[0]
+    if len(powers) == 0:
+        return []
+
+    threshold = max(noise_floor_power(powers) * 10 ** (speech_margin_db / 10), 10 ** (min_speech_dbfs / 10))
+    voiced = powers >= threshold
+
+    # 음성 프레임의 시작/끝 경계 찾기
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    frame_sec = int(sample_rate * frame_ms / 1000) / sample_rate
+    regions = []
+    for start, end in zip(starts * frame_sec, ends * frame_sec):
+        if regions and start - regions[-1][1] < min_gap:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    # 여유를 붙인 뒤 겹치는 구간은 합침
+    total = len(audio) / sample_rate
+    padded = []
+    for start, end in regions:
+        if end - start < min_speech:
+            continue
+        start, end = max(0.0, start - pad), min(total, end + pad)
+        if padded and start <= padded[-1][1]:
+            padded[-1][1] = max(padded[-1][1], end)
+        else:
+            padded.append([start, end])
+    return [(start, end) for start, end in padded]
+
+
+def split_long_regions(audio, regions, window_seconds=WINDOW_SECONDS, sample_rate=SAMPLE_RATE, frame_ms=FRAME_MS):
+    """
+    window_seconds보다 긴 음성 구간을 가장 조용한 프레임에서 나눔.
+    경계는 (시작 + window/2) ~ (시작 + window) 범위에서 프레임 에너지가 최소인 프레임의 중앙.
+
+    Returns:
+        list: [(start_sec, end_sec), ...] (모두 window_seconds 이하)
+    """
+    import numpy as np
+
+    frame = int(sample_rate * frame_ms / 1000)
+    pieces = []
+    for start, end in regions:
+        while end - start > window_seconds:
+            low = int((start + window_seconds / 2) * sample_rate)
+            high = int((start + window_seconds) * sample_rate)
+            quietest = int(np.argmin(frame_powers(audio[low:high], sample_rate, frame_ms)[0]))
+            cut = (low + quietest * frame + frame // 2) / sample_rate
+            pieces.append((start, cut))
+            start = cut
+        pieces.append((start, end))
+    return pieces
+
+
+def pack_windows(regions, window_seconds=WINDOW_SECONDS, join_silence=JOIN_SILENCE_SECONDS):
+    """
+    음성 구간을 이어 붙였을 때 window_seconds 이하가 되도록 윈도우로 묶음.
+    구간은 split_long_regions()로 미리 나눠 두며, 그래도 윈도우보다 긴 구간은 window_seconds 단위로 자른다.
+
+    Returns:
+        list: 윈도우별 [(start_sec, end_sec), ...] 리스트
+    """
+    pieces = []
+    for start, end in regions:
+        while end - start > window_seconds:
+            pieces.append((start, start + window_seconds))
+            start += window_seconds
+        pieces.append((start, end))
+
+    windows, current, length = [], [], 0.0
+    for start, end in pieces:
+        piece_len = end - start + (join_silence if current else 0.0)
+        if current and length + piece_len > window_seconds:
+            windows.append(current)
+            current, length = [], 0.0
+            piece_len = end - start
+        current.append((start, end))
+        length += piece_len
+    if current:
+        windows.append(current)
+    return windows
+
+
+def window_audio(audio, window, sample_rate=SAMPLE_RATE, join_silence=JOIN_SILENCE_SECONDS):
+    """윈도우의 음성 구간들을 짧은 무음으로 이어 붙인 float32 배열 (16bit PCM은 이 구간만 변환)"""
+    import numpy as np
+
+    scale = 32768.0 if audio.dtype.kind == 'i' else 1.0
+    gap = np.zeros(int(join_silence * sample_rate), dtype=np.float32)
+    parts = []
+    for i, (start, end) in enumerate(window):
+        if i:
+            parts.append(gap)
+        part = np.asarray(audio[int(start * sample_rate):int(end * sample_rate)], dtype=np.float32)
+        parts.append(part / scale if scale != 1.0 else part)
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
+
+def load_audio(path):
+    """
+    16kHz 모노 샘플 로드.
+    이미 Whisper 입력 형식(16kHz 모노 PCM)인 WAV는 ffmpeg 없이 int16 memmap 그대로 반환
+    (전체를 float32로 복사하지 않음 - 프레임 에너지는 블록 단위로, 윈도우는 window_audio에서 필요한 구간만 변환).
+    그 외 형식은 whisper.load_audio의 float32 배열.
+    """
+    from .audio_analysis import is_whisper_ready, load_pcm16, read_wav_header
+
+    header = read_wav_header(path)
+    if is_whisper_ready(header):
+        samples = load_pcm16(path, header)
+        if samples is not None:
+            return samples
+
+    import whisper
+    return whisper.load_audio(path)
+
+
+def transcribe_speech_regions(model, audio, language='ko', batch_size=8):
+    """
+    음성 구간만 배치로 전사
+
+    Returns:
+        dict: text, segments([{start, end, text}]), speech_seconds, total_seconds, windows, cpu_seconds
+    """
+    cpu_start = time.process_time()
+    total_seconds = len(audio) / SAMPLE_RATE
+    regions = detect_speech_regions(audio)
+    if not regions:
+        # 음성이 없는 녹음 - 빈 전사 결과 (실패 아님)
+        return {
+            'text': '', 'segments': [], 'speech_seconds': 0.0, 'total_seconds': round(total_seconds, 2),
+            'windows': 0, 'cpu_seconds': round(time.process_time() - cpu_start, 2),
+        }
+
+    import whisper
+    from .batch_transcribe import decode_mel_batch
+
+    windows = pack_windows(split_long_regions(audio, regions))
+    n_mels = getattr(getattr(model, 'dims', None), 'n_mels', 80)
+
+    segments = []
+    for offset in range(0, len(windows), max(1, batch_size)):
+        batch = windows[offset:offset + batch_size]
+        mels = [
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(window_audio(audio, window)), n_mels)
+            for window in batch
+        ]
+        texts = decode_mel_batch(model, mels, language)
+        for window, text in zip(batch, texts):
+            if text:
+                segments.append({'start': round(window[0][0], 2), 'end': round(window[-1][1], 2), 'text': text})
+
+    return {
+        'text': ' '.join(segment['text'] for segment in segments).strip(),
+        'segments': segments,
+        'speech_seconds': round(sum(end - start for start, end in regions), 2),
+        'total_seconds': round(total_seconds, 2),
+        'windows': len(windows),
+        'cpu_seconds': round(time.process_time() - cpu_start, 2),
+    }
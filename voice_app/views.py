@@ -21,13 +21,13 @@ class UploadBackgroundNoise(APIView):
 # views.py (업로드만 수행, Whisper 전사 제거)
 
 import os, uuid
-import subprocess
-import whisper
+import shutil
 import json
 import base64
-from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.paginator import Paginator
+from django.db.models import Count
+from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 
@@ -43,16 +43,29 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
-from .tasks import transcribe_audio_task
+from .job_queue import enqueue_job, enqueue_unprocessed, job_progress
+from .transcoding import TranscodeError, transcode_to_wav, get_transcode_metrics
+from .model_registry import loaded_models
+from .audio_analysis import adopt_ready_wav, analyze_wav, is_silent
+from .pagination import InvalidCursor, audio_list_page, page_limit
+from .metadata_normalizer import normalize_record as normalize_metadata_record
+from .stats_cache import get_snapshot as get_stats_snapshot, snapshot_age as stats_snapshot_age
+from .rollups import affected_pairs, refresh_after_bulk_write, refresh_participant
+from .upload_sessions import (
+    UploadSessionError, create_session as create_upload_session, get_session as get_upload_session,
+    session_progress, write_chunk as write_upload_chunk, assemble_session as assemble_upload_session,
+    complete_session as complete_upload_session, fail_session as fail_upload_session,
+    begin_finalize as begin_upload_finalize, reopen_session as reopen_upload_session,
+)
 from django.views.generic import View
 from django.http import JsonResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
 import json
-from .models import AudioRecord
-from pydub import AudioSegment  # 의존성 때문에 임시 주석
-from .whisper_utils import transcribe_audio, transcribe_and_align_whisperx, format_alignment_for_frontend  # whisperx 의존성 때문에 임시 주석
+from .models import AudioRecord, ParticipantProfile, SpeakerSummary, upload_region_expression
+from .whisper_utils import format_alignment_for_frontend  # torch/whisper는 실제 전사 시점에만 로드됨
+from .alignment_store import full_alignment_data, word_accessor
 
 
 
@@ -61,154 +74,83 @@ from .whisper_utils import transcribe_audio, transcribe_and_align_whisperx, form
 # AudioSegment.converter = "/usr/bin/ffmpeg"  # Linux 환경에 맞게 조정
 
 def convert_m4a_to_wav(input_path, output_path):
-    """Convert audio file to wav using ffmpeg with enhanced error handling and corruption recovery"""
+    """
+    오디오 파일을 16kHz 모노 WAV로 변환 (voice_app/transcoding.py의 변환 풀 사용)
+    ffmpeg 한 번 실행으로 스트림 정보 확인과 변환, 손상 파일 복구(-err_detect ignore_err)를 함께 처리
+    """
     print(f"[DEBUG] Starting conversion from {input_path} to {output_path}")
-    
-    # Check if input file exists
-    if not os.path.exists(input_path):
-        error_msg = f"Input file does not exist: {input_path}"
-        print(f"[ERROR] {error_msg}")
-        raise FileNotFoundError(error_msg)
-    
-    print(f"[DEBUG] Input file exists, size: {os.path.getsize(input_path)} bytes")
-    
-    # Create output directory if it doesn't exist
-    output_dir = os.path.dirname(output_path)
-    os.makedirs(output_dir, exist_ok=True)
-    print(f"[DEBUG] Output directory created/verified: {output_dir}")
-    
-    # Check if input and output paths are the same
-    if os.path.abspath(input_path) == os.path.abspath(output_path):
-        print(f"[DEBUG] Input and output paths are the same, using temporary file approach")
-        temp_output = output_path + '.tmp.wav'
-        
-        command = [
-            'ffmpeg', '-y', '-i', input_path,
-            '-acodec', 'pcm_s16le',
-            '-ar', '16000',
-            '-ac', '1',
-            temp_output
-        ]
-        
-        print(f"[DEBUG] Same-file conversion using temp: {temp_output}")
-        use_temp_file = True
-    else:
-        # Different paths - direct conversion
-        command = [
-            'ffmpeg', '-y', '-i', input_path,
-            '-acodec', 'pcm_s16le',
-            '-ar', '16000',
-            '-ac', '1',
-            output_path
-        ]
-        use_temp_file = False
-    
+
     try:
-        print(f"[DEBUG] Running ffmpeg command: {' '.join(command)}")
-        
-        # Execute ffmpeg
-        result = subprocess.run(command, 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=60)
-        
-        print(f"[DEBUG] ffmpeg return code: {result.returncode}")
-        if result.stdout:
-            print(f"[DEBUG] ffmpeg stdout: {result.stdout}")
-        if result.stderr:
-            print(f"[DEBUG] ffmpeg stderr: {result.stderr}")
-        
-        if result.returncode != 0:
-            # Check for specific corruption issues
-            if "moov atom not found" in result.stderr:
-                print("[INFO] moov atom 누락 감지, 복구 시도 중...")
-                
-                # Try recovery with ffmpeg error detection disabled
-                print("[INFO] FFmpeg recover 옵션으로 시도")
-                recovery_command = [
-                    'ffmpeg', '-y', '-err_detect', 'ignore_err', '-i', input_path,
-                    '-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1',
-                    temp_output if use_temp_file else output_path
-                ]
-                
-                recovery_result = subprocess.run(recovery_command,
-                                               capture_output=True,
-                                               text=True,
-                                               timeout=60)
-                
-                print(f"[DEBUG] Recovery ffmpeg return code: {recovery_result.returncode}")
-                if recovery_result.stderr:
-                    print(f"[DEBUG] Recovery ffmpeg stderr: {recovery_result.stderr}")
-                
-                if recovery_result.returncode == 0:
-                    print("[SUCCESS] 손상된 파일 복구 성공")
-                    result = recovery_result  # Use recovery result for further processing
-                else:
-                    error_msg = f"M4A 파일이 심각하게 손상되었습니다 (moov atom 누락). React Native 앱의 MediaRecorder 설정을 확인해주세요. 원본 오류: {result.stderr}"
-                    print(f"[ERROR] {error_msg}")
-                    raise Exception(error_msg)
-            else:
-                error_msg = f"ffmpeg conversion failed: {result.stderr}"
-                print(f"[ERROR] {error_msg}")
-                raise Exception(error_msg)
-        
-        # Handle temporary file if used
-        if use_temp_file:
-            temp_output = output_path + '.tmp.wav'
-            if os.path.exists(temp_output):
-                # Remove original and rename temp file
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-                os.rename(temp_output, output_path)
-                print(f"[DEBUG] Moved temp file to final location: {output_path}")
-            else:
-                error_msg = f"Temp output file was not created: {temp_output}"
-                print(f"[ERROR] {error_msg}")
-                raise FileNotFoundError(error_msg)
-        
-        # Check if output file was created
-        if not os.path.exists(output_path):
-            error_msg = f"Output file was not created: {output_path}"
+        result = transcode_to_wav(input_path, output_path)
+    except TranscodeError as e:
+        if "moov atom not found" in (e.stderr or ''):
+            error_msg = f"M4A 파일이 심각하게 손상되었습니다 (moov atom 누락). React Native 앱의 MediaRecorder 설정을 확인해주세요. 원본 오류: {e.stderr}"
             print(f"[ERROR] {error_msg}")
-            raise FileNotFoundError(error_msg)
-        
-        print(f"[SUCCESS] Successfully converted {input_path} to {output_path}")
-        print(f"[DEBUG] Output file size: {os.path.getsize(output_path)} bytes")
-        
-        return True
-        
-    except subprocess.TimeoutExpired:
-        error_msg = "ffmpeg conversion timed out"
-        print(f"[ERROR] {error_msg}")
-        raise Exception(error_msg)
-    except Exception as e:
-        error_msg = f"Conversion error: {str(e)}"
-        print(f"[ERROR] {error_msg}")
+            raise Exception(error_msg)
+        print(f"[ERROR] {e}")
         raise
-        if not os.path.exists(output_path):
-            error_msg = f"Output file was not created: {output_path}"
-            print(f"[ERROR] {error_msg}")
-            raise FileNotFoundError(error_msg)
-        
-        print(f"[SUCCESS] Successfully converted {input_path} to {output_path}")
-        print(f"[DEBUG] Output file size: {os.path.getsize(output_path)} bytes")
-        
+
+    info = result['input']
+    print(f"[DEBUG] Input stream - codec: {info['codec']}, sample rate: {info['sample_rate']}, "
+          f"channels: {info['channels']}, duration: {info['duration']}")
+    print(f"[SUCCESS] Converted {input_path} to {output_path} "
+          f"(queue wait {result['queue_wait']:.2f}s, transcode {result['elapsed']:.2f}s, "
+          f"{os.path.getsize(output_path)} bytes)")
+    return True
+
+def prepare_wav(source_path, wav_path, uploaded_file=None):
+    """
+    업로드 파일을 Whisper 입력용 16kHz 모노 WAV로 준비
+    1. 이미 16kHz 모노 PCM WAV → 헤더만 확인하고 그대로 사용 (프로세스/복사 없음)
+    2. 업로드 중 스트리밍 변환된 WAV가 있으면 사용
+    3. 그 외에는 ffmpeg 변환
+    """
+    if adopt_ready_wav(source_path, wav_path, keep_source=False):
         return True
-        
-    except subprocess.TimeoutExpired:
-        error_msg = "ffmpeg conversion timed out"
-        print(f"[ERROR] {error_msg}")
-        raise Exception(error_msg)
-    except Exception as e:
-        error_msg = f"Conversion error: {str(e)}"
-        print(f"[ERROR] {error_msg}")
-        raise
+    if uploaded_file is not None and take_streamed_wav(uploaded_file, wav_path):
+        return True
+    return convert_m4a_to_wav(source_path, wav_path)
+
+
+def take_streamed_wav(uploaded_file, wav_path):
+    """
+    업로드 중 ffmpeg로 스트리밍 변환된 WAV가 있으면 wav_path로 이동.
+    (voice_app.upload_handlers.StreamingAudioUploadHandler 참고)
+
+    Returns:
+        bool: 스트리밍 변환 결과를 사용했으면 True
+    """
+    streamed_path = getattr(uploaded_file, 'streamed_wav_path', None)
+    if not streamed_path or not os.path.exists(streamed_path):
+        return False
+
+    os.makedirs(os.path.dirname(wav_path), exist_ok=True)
+    shutil.move(streamed_path, wav_path)
+    uploaded_file.streamed_wav_path = None
+    print(f"[DEBUG] Using WAV transcoded during upload: {wav_path}")
+    return True
 
-def is_audio_silent(wav_path, threshold_dbfs=-40.0):
-    # AudioSegment 의존성 때문에 임시로 False 반환
-    # audio = AudioSegment.from_wav(wav_path)
-    # return audio.dBFS < threshold_dbfs
-    return False  # 임시로 무음이 아닌 것으로 처리
+
+def is_audio_silent(wav_path, threshold_dbfs=None, stats=None):
+    """
+    무음 파일 여부 (audio_analysis.is_silent - 확실히 무음인 경우만 True, 길이 0 포함)
+    stats: 이미 계산된 analyze_wav 결과 (없으면 새로 계산)
+    """
+    if stats is None:
+        stats = analyze_wav(wav_path, voiced_threshold_dbfs=threshold_dbfs)
+    return is_silent(stats)
+
+
+def audio_stats_fields(stats):
+    """analyze_wav 결과 → AudioRecord 필드"""
+    stats = stats or {}
+    return {
+        'duration': stats.get('duration'),
+        'peak_dbfs': stats.get('peak_dbfs'),
+        'rms_dbfs': stats.get('rms_dbfs'),
+        'voiced_ratio': stats.get('voiced_ratio'),
+        'clipping_ratio': stats.get('clipping_ratio'),
+    }
 
 # 누락된 API 엔드포인트들 추가
 @api_view(['GET'])
@@ -226,7 +168,9 @@ def api_status(request):
     return Response({
         'status': 'running',
         'server': 'Django Voice Management',
-        'version': '1.0'
+        'version': '1.0',
+        'transcoding': get_transcode_metrics(),
+        'models': loaded_models(),  # 이 웹 프로세스에 로드된 Whisper/WhisperX 모델
     })
 
 @api_view(['GET'])
@@ -355,10 +299,18 @@ class AudioUploadView(APIView):
                     print("[WARN] Boundary 문자열을 Content-Type에서 찾지 못했습니다.")
 
                 # raw body를 임시 파일로 저장 (사이즈 5MB 이하 제한) - 이미 consume 된 경우 대체 시도
+                # 5MB를 넘는 요청은 본문 전체를 메모리에 올리지 않도록 복구를 건너뜀
                 body_bytes = b''
+                max_recover = 5 * 1024 * 1024
+                try:
+                    content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+                except ValueError:
+                    content_length = 0
                 try:
                     # Django에서 body가 이미 읽혀 사라진 경우 대비
-                    if hasattr(request, '_body') and request._body:
+                    if content_length > max_recover:
+                        print(f"[DEBUG] Skipping raw body recovery for large request ({content_length} bytes)")
+                    elif hasattr(request, '_body') and request._body:
                         body_bytes = request._body
                     else:
                         try:
@@ -437,29 +389,46 @@ class AudioUploadView(APIView):
                 print("[INFO] Proceeding with recovered file flow")
                 
             
+            return self.process_upload(request.data, file, metadata_file, kwargs.get('category'))
+
+        except Exception as e:
+            return upload_error_response(e)
+
+    def process_upload(self, data, file, metadata_file=None, category=None):
+        """
+        업로드된 파일 저장 → WAV 변환 → AudioRecord 생성
+        일반 multipart 업로드와 재개 가능한 업로드(finalize) 모두에서 사용
+
+        Args:
+            data: 폼 필드 (request.data 또는 UploadSession.metadata)
+            file: 오디오 파일 (UploadedFile 또는 File)
+            metadata_file: JSON 메타데이터 파일 (선택)
+            category: URL로 지정된 카테고리 (없으면 data['category'])
+        """
+        try:
             print(f"[DEBUG] File received: {file.name}, size: {file.size}")
             
             # 모든 POST 데이터 추출
-            name = request.data.get('name')
-            gender = request.data.get('gender')
-            age = request.data.get('age')
-            birth_date = request.data.get('birthDate')  # YYYY-MM-DD 형식
-            recording_date = request.data.get('recordingDate')
-            region = request.data.get('region')
-            place = request.data.get('place')
-            noise = request.data.get('noise')
-            pronun_problem = request.data.get('pronunProblem')
-            diagnosis = request.data.get('diagnosis')
-            device = request.data.get('device')
-            mic = request.data.get('mic')
-            subjective_rating = request.data.get('subjective_rating')
-            sentence_index = request.data.get('sentence_index')
-            sentence_text = request.data.get('sentence_text')
-            task_type = request.data.get('task_type')
-            upload_timestamp = request.data.get('upload_timestamp')
-            local_saved = request.data.get('local_saved')
-            metadata_json = request.data.get('metadata_json')
-            identifier = request.data.get('identifier')
+            name = data.get('name')
+            gender = data.get('gender')
+            age = data.get('age')
+            birth_date = data.get('birthDate')  # YYYY-MM-DD 형식
+            recording_date = data.get('recordingDate')
+            region = data.get('region')
+            place = data.get('place')
+            noise = data.get('noise')
+            pronun_problem = data.get('pronunProblem')
+            diagnosis = data.get('diagnosis')
+            device = data.get('device')
+            mic = data.get('mic')
+            subjective_rating = data.get('subjective_rating')
+            sentence_index = data.get('sentence_index')
+            sentence_text = data.get('sentence_text')
+            task_type = data.get('task_type')
+            upload_timestamp = data.get('upload_timestamp')
+            local_saved = data.get('local_saved')
+            metadata_json = data.get('metadata_json')
+            identifier = data.get('identifier')
 
             if identifier is not None:
                 identifier = str(identifier).strip().upper()
@@ -469,47 +438,47 @@ class AudioUploadView(APIView):
             
             # 카테고리별 고유 필드 추출
             # Child 고유
-            age_in_months = request.data.get('ageInMonths')
+            age_in_months = data.get('ageInMonths')
             
             # Senior 고유
-            education = request.data.get('education')
-            education_years = request.data.get('educationYears')
-            final_education = request.data.get('finalEducation') or request.data.get('educationLevel')
-            education_detail = request.data.get('educationDetail')
-            cognitive_decline = request.data.get('cognitiveDecline')
-            subjective_score = request.data.get('subjectiveScore')
-            subjective_note = request.data.get('subjectiveNote')
-            job = request.data.get('job')
+            education = data.get('education')
+            education_years = data.get('educationYears')
+            final_education = data.get('finalEducation') or data.get('educationLevel')
+            education_detail = data.get('educationDetail')
+            cognitive_decline = data.get('cognitiveDecline')
+            subjective_score = data.get('subjectiveScore')
+            subjective_note = data.get('subjectiveNote')
+            job = data.get('job')
             
             # Auditory 고유 - 청각 관련
-            hearing_level = request.data.get('hearingLevel') or request.data.get('hearingDegree')
-            hearing_loss_duration = request.data.get('hearingLossDuration')
-            has_hearing_aid = request.data.get('hasHearingAid')
-            hearing_aid_duration = request.data.get('hearingAidDuration')
-            hearing_onset_type = request.data.get('hearingOnsetType')
-            hearing_impairment = request.data.get('hearingImpairment')
+            hearing_level = data.get('hearingLevel') or data.get('hearingDegree')
+            hearing_loss_duration = data.get('hearingLossDuration')
+            has_hearing_aid = data.get('hasHearingAid')
+            hearing_aid_duration = data.get('hearingAidDuration')
+            hearing_onset_type = data.get('hearingOnsetType')
+            hearing_impairment = data.get('hearingImpairment')
             
             # Auditory 고유 - 인지 관련
-            cognitive_level = request.data.get('cognitiveLevel') or request.data.get('cognitiveImpairment')
+            cognitive_level = data.get('cognitiveLevel') or data.get('cognitiveImpairment')
             
             # Auditory 고유 - 언어 관련
-            native_language = request.data.get('nativeLanguage')
-            language_experience = request.data.get('languageExperience')
+            native_language = data.get('nativeLanguage')
+            language_experience = data.get('languageExperience')
             
             # Auditory 고유 - 배경소음 측정
-            session_id = request.data.get('session_id')
-            background_noise_average = request.data.get('background_noise_average')
-            background_noise_max = request.data.get('background_noise_max')
-            background_noise_min = request.data.get('background_noise_min')
-            noise_measurement_time = request.data.get('noise_measurement_time')
-            platform = request.data.get('platform')
+            session_id = data.get('session_id')
+            background_noise_average = data.get('background_noise_average')
+            background_noise_max = data.get('background_noise_max')
+            background_noise_min = data.get('background_noise_min')
+            noise_measurement_time = data.get('noise_measurement_time')
+            platform = data.get('platform')
             
             # 작업 특화 정보
-            retry_count = request.data.get('retry_count')
-            attempt = request.data.get('attempt')
-            question_file = request.data.get('question_file')
-            current_page = request.data.get('current_page')
-            page_name = request.data.get('page_name')
+            retry_count = data.get('retry_count')
+            attempt = data.get('attempt')
+            question_file = data.get('question_file')
+            current_page = data.get('current_page')
+            page_name = data.get('page_name')
             
             metadata_from_file = None
             metadata_filename = None
@@ -617,9 +586,9 @@ class AudioUploadView(APIView):
                     print(f"[DEBUG] Error extracting from metadata_json: {e}")
             
             # SNR 값들 추출
-            snr_mean = request.data.get('snr_mean')
-            snr_max = request.data.get('snr_max')
-            snr_min = request.data.get('snr_min')
+            snr_mean = data.get('snr_mean')
+            snr_max = data.get('snr_max')
+            snr_min = data.get('snr_min')
             
             # birthDate 파싱 (YYYY-MM-DD 형식에서 년/월/일 분리)
             birth_year = birth_month = birth_day = None
@@ -639,7 +608,7 @@ class AudioUploadView(APIView):
             print(f"[DEBUG] Task info - task_type: {task_type}, sentence_index: {sentence_index}")
             
             # URL에서 카테고리 추출하거나 POST 데이터에서 가져오기
-            category = kwargs.get('category') or request.data.get('category', 'normal')
+            category = category or data.get('category', 'normal')
 
             # 카테고리 유효성 검사 (auditory 추가)
             valid_categories = ['child', 'senior', 'atypical', 'auditory', 'normal']
@@ -675,9 +644,8 @@ class AudioUploadView(APIView):
             category_media_folder = os.path.join(settings.MEDIA_ROOT, category_folder)
             os.makedirs(category_media_folder, exist_ok=True)
 
-            # m4a 파일 저장
-            file_data = ContentFile(file.read())
-            m4a_full_path = default_storage.save(m4a_storage_path, file_data)
+            # m4a 파일 저장 (업로드 임시 파일을 그대로 이동 - 메모리로 읽지 않음)
+            m4a_full_path = default_storage.save(m4a_storage_path, file)
             m4a_path = os.path.join(settings.MEDIA_ROOT, m4a_full_path)
             
             print(f"[DEBUG] Saved file path: {m4a_full_path}")
@@ -702,64 +670,26 @@ class AudioUploadView(APIView):
             # 변환 실행
             print(f"[DEBUG] Input file extension: {ext}")
             
-            # WAV 파일이고 이미 올바른 형식인지 확인
-            if ext.lower() == 'wav':
-                # WAV 파일 정보 확인
-                try:
-                    result = subprocess.run([
-                        'ffprobe', '-v', 'quiet', '-print_format', 'json', 
-                        '-show_format', '-show_streams', m4a_path
-                    ], capture_output=True, text=True, timeout=30)
-                    
-                    if result.returncode == 0:
-                        info = json.loads(result.stdout)
-                        
-                        # 오디오 스트림 정보 추출
-                        audio_stream = None
-                        for stream in info.get('streams', []):
-                            if stream.get('codec_type') == 'audio':
-                                audio_stream = stream
-                                break
-                        
-                        if audio_stream:
-                            sample_rate = int(audio_stream.get('sample_rate', 0))
-                            channels = int(audio_stream.get('channels', 0))
-                            codec = audio_stream.get('codec_name', '')
-                            
-                            print(f"[DEBUG] WAV file info - Sample rate: {sample_rate}, Channels: {channels}, Codec: {codec}")
-                            
-                            # 이미 16kHz 모노 PCM인 경우 변환 건너뛰기
-                            if sample_rate == 16000 and channels == 1 and codec == 'pcm_s16le':
-                                print(f"[DEBUG] WAV file already in correct format, copying instead of converting")
-                                # 단순히 파일을 복사
-                                import shutil
-                                shutil.copy2(m4a_path, wav_path)
-                                convert_success = True
-                            else:
-                                print(f"[DEBUG] WAV file needs conversion")
-                                convert_success = convert_m4a_to_wav(m4a_path, wav_path)
-                        else:
-                            print(f"[DEBUG] Could not extract audio stream info, proceeding with conversion")
-                            convert_success = convert_m4a_to_wav(m4a_path, wav_path)
-                    else:
-                        print(f"[DEBUG] ffprobe failed, proceeding with conversion")
-                        convert_success = convert_m4a_to_wav(m4a_path, wav_path)
-                        
-                except Exception as e:
-                    print(f"[DEBUG] Error checking WAV format: {e}, proceeding with conversion")
-                    convert_success = convert_m4a_to_wav(m4a_path, wav_path)
-            else:
-                # 다른 형식은 항상 변환
-                convert_success = convert_m4a_to_wav(m4a_path, wav_path)
+            # 16kHz 모노 WAV는 헤더 확인 후 그대로 사용, 그 외에는 스트리밍 변환 결과 또는 ffmpeg 변환
+            convert_success = prepare_wav(m4a_path, wav_path, uploaded_file=file)
             
             if not convert_success:
                 raise Exception("Audio conversion failed")
 
-            # 무음 여부 확인
-            if is_audio_silent(wav_path):
-                os.remove(m4a_path)
-                os.remove(wav_path)
-                return Response({'message': '무음 파일은 삭제되었습니다.'}, status=400)
+            # 길이 및 레벨 (memmap 기반, 프로세스 실행 없음)
+            audio_stats = analyze_wav(wav_path) or {}
+            print(f"[DEBUG] Audio stats: {audio_stats}")
+
+            # 클라이언트가 SNR을 보내지 않은 경우 서버에서 추정한 값 사용
+            if snr_mean in (None, '') and audio_stats.get('snr_mean') is not None:
+                snr_mean, snr_max, snr_min = audio_stats['snr_mean'], audio_stats['snr_max'], audio_stats['snr_min']
+
+            # 무음 여부 확인 (위에서 계산한 프레임 레벨 사용)
+            if is_audio_silent(wav_path, stats=audio_stats):
+                for path in {m4a_path, wav_path}:
+                    if os.path.exists(path):
+                        os.remove(path)
+                return Response({'message': '무음 파일은 삭제되었습니다.', 'audio_stats': audio_stats}, status=400)
 
             # 성별 영어 → 한글 변환
             gender_mapping = {
@@ -796,9 +726,10 @@ class AudioUploadView(APIView):
                 has_microphone=mic,  # mic -> has_microphone
                 diagnosis=diagnosis,
                 # SNR 정보
-                snr_mean=float(snr_mean) if snr_mean else None,
-                snr_max=float(snr_max) if snr_max else None,
-                snr_min=float(snr_min) if snr_min else None,
+                snr_mean=float(snr_mean) if snr_mean not in (None, '') else None,
+                snr_max=float(snr_max) if snr_max not in (None, '') else None,
+                snr_min=float(snr_min) if snr_min not in (None, '') else None,
+                **audio_stats_fields(audio_stats),
                 # 인덱스 컬럼 (쿼리 성능 최적화)
                 region=region if region else None,
                 education_level=int(final_education) if final_education and final_education.isdigit() else None,
@@ -824,6 +755,8 @@ class AudioUploadView(APIView):
                 category_data['task_type'] = task_type
             if upload_timestamp:
                 category_data['upload_timestamp'] = upload_timestamp
+            if getattr(file, 'sha256', None):
+                category_data['upload_sha256'] = file.sha256
             if local_saved:
                 category_data['local_saved'] = local_saved
             if recording_date:
@@ -983,6 +916,8 @@ class AudioUploadView(APIView):
                 
             if category_data:
                 audio_record.set_category_data(**category_data)
+                # metadata_json의 이름/성별/나이/장소/기기/진단명을 기본 컬럼에 한 번만 반영
+                normalize_metadata_record(audio_record)
                 audio_record.save()
                 
             print(f"[DEBUG] Saved AudioRecord with ID: {audio_record.id}")
@@ -1000,45 +935,51 @@ class AudioUploadView(APIView):
 
             return Response({
                 'message': '업로드 성공',
+                'id': audio_record.id,
                 'file_path': audio_record.audio_file.url
             })
-            
+
         except Exception as e:
-            print(f"[ERROR] Upload failed: {str(e)}")
-            
-            # 손상된 파일 진단 정보 제공
-            error_details = {'error': f'업로드 실패: {str(e)}'}
-            if 'moov atom not found' in str(e):
-                error_details.update({
-                    'error_code': 'CORRUPTED_M4A_FILE',
-                    'issue': 'M4A 파일 손상 (moov atom 누락)',
-                    'description': 'M4A 파일의 메타데이터(moov atom)가 누락되어 변환할 수 없습니다.',
-                    'cause': 'React Native MediaRecorder가 녹음을 완전히 완료하지 못했습니다.',
-                    'solutions': [
-                        '1. MediaRecorder 설정 변경: OutputFormat을 "wav"로 설정',
-                        '2. 녹음 완료 후 MediaRecorder.stopRecorder() 호출 후 500ms 대기',
-                        '3. MediaRecorder.release() 호출하여 리소스 해제',
-                        '4. 파일 크기 검증: 최소 1KB 이상인지 확인',
-                        '5. 앱 재시작 후 다시 녹음 시도'
-                    ],
-                    'react_native_fix': {
-                        'recorder_options': {
-                            'SampleRate': 16000,
-                            'Channels': 1,
-                            'AudioQuality': 'High',
-                            'OutputFormat': 'wav',
-                            'AudioEncoding': 'wav'
-                        },
-                        'proper_stop_sequence': [
-                            'await AudioRecorderPlayer.stopRecorder()',
-                            'await new Promise(resolve => setTimeout(resolve, 500))',
-                            'await AudioRecorderPlayer.release()'
-                        ]
-                    },
-                    'technical': 'Android MediaRecorder의 녹음 중단이나 불완전한 파일 생성으로 인한 문제. moov atom은 MP4/M4A 컨테이너의 메타데이터로, 녹음이 정상 완료되어야 생성됩니다.'
-                })
-            
-            return Response(error_details, status=400)
+            return upload_error_response(e)
+
+
+def upload_error_response(e):
+    """업로드 실패 응답 (손상된 m4a 진단 정보 포함)"""
+    print(f"[ERROR] Upload failed: {str(e)}")
+    
+    # 손상된 파일 진단 정보 제공
+    error_details = {'error': f'업로드 실패: {str(e)}'}
+    if 'moov atom not found' in str(e):
+        error_details.update({
+            'error_code': 'CORRUPTED_M4A_FILE',
+            'issue': 'M4A 파일 손상 (moov atom 누락)',
+            'description': 'M4A 파일의 메타데이터(moov atom)가 누락되어 변환할 수 없습니다.',
+            'cause': 'React Native MediaRecorder가 녹음을 완전히 완료하지 못했습니다.',
+            'solutions': [
+                '1. MediaRecorder 설정 변경: OutputFormat을 "wav"로 설정',
+                '2. 녹음 완료 후 MediaRecorder.stopRecorder() 호출 후 500ms 대기',
+                '3. MediaRecorder.release() 호출하여 리소스 해제',
+                '4. 파일 크기 검증: 최소 1KB 이상인지 확인',
+                '5. 앱 재시작 후 다시 녹음 시도'
+            ],
+            'react_native_fix': {
+                'recorder_options': {
+                    'SampleRate': 16000,
+                    'Channels': 1,
+                    'AudioQuality': 'High',
+                    'OutputFormat': 'wav',
+                    'AudioEncoding': 'wav'
+                },
+                'proper_stop_sequence': [
+                    'await AudioRecorderPlayer.stopRecorder()',
+                    'await new Promise(resolve => setTimeout(resolve, 500))',
+                    'await AudioRecorderPlayer.release()'
+                ]
+            },
+            'technical': 'Android MediaRecorder의 녹음 중단이나 불완전한 파일 생성으로 인한 문제. moov atom은 MP4/M4A 컨테이너의 메타데이터로, 녹음이 정상 완료되어야 생성됩니다.'
+        })
+    
+    return Response(error_details, status=400)
 
 def index(request):
     # 로그인된 사용자는 Tailwind 버전의 홈페이지를 보여줌
@@ -1047,80 +988,6 @@ def index(request):
     
     return render(request, 'index.html')
 
-def extract_metadata_to_fields(audio):
-    """React Native 메타데이터에서 기본 필드로 정보 추출"""
-    if not audio.category_specific_data or 'metadata_json' not in audio.category_specific_data:
-        return
-    
-    try:
-        import base64
-        import json
-        import binascii
-        import re
-
-        # Base64 디코딩 및 JSON 파싱 (안전한 처리)
-        b64_data = audio.category_specific_data['metadata_json']
-
-        if isinstance(b64_data, (dict, list)):
-            metadata = b64_data
-            print(f"[DEBUG] Direct dict/list metadata for audio {audio.id}")
-        else:
-            # 먼저 직접 JSON 파싱 시도 (Base64가 아닐 수도 있음)
-            try:
-                metadata = json.loads(b64_data)
-                print(f"[DEBUG] Direct JSON parse successful for audio {audio.id}")
-            except (json.JSONDecodeError, TypeError):
-                # JSON이 아니면 Base64 디코딩 시도
-                raw_str = str(b64_data)
-                clean_b64 = re.sub(r'[^A-Za-z0-9+/=_-]', '', raw_str)
-                clean_b64 = clean_b64.replace('-', '+').replace('_', '/')
-
-                # 패딩 수정
-                missing_padding = len(clean_b64) % 4
-                if missing_padding:
-                    clean_b64 += '=' * (4 - missing_padding)
-
-                try:
-                    decoded_bytes = base64.b64decode(clean_b64, validate=False)
-                    decoded_str = decoded_bytes.decode('utf-8', errors='ignore')
-                    metadata = json.loads(decoded_str)
-                    print(f"[DEBUG] Base64 decode successful for audio {audio.id}")
-                except (base64.binascii.Error, binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
-                    print(f"[DEBUG] All decode methods failed for audio {audio.id}: {e}")
-                    return
-        
-        # 메타데이터에서 기본 정보 추출
-        metainfo_candidates = [
-            metadata.get('metainfo_child', {}),
-            metadata.get('metainfo_senior', {}),
-            metadata.get('metainfo_old', {}),
-            metadata.get('metainfo_adult', {}),
-            metadata.get('metainfo', {}),
-        ]
-
-        for metainfo in metainfo_candidates:
-            if not metainfo:
-                continue
-            if not audio.name and metainfo.get('name'):
-                audio.name = metainfo.get('name')
-            if not audio.gender and metainfo.get('gender'):
-                audio.gender = metainfo.get('gender')
-            if not audio.age and metainfo.get('age'):
-                audio.age = metainfo.get('age')
-            if not audio.recording_location and metainfo.get('place'):
-                audio.recording_location = metainfo.get('place')
-            if not audio.noise_level and metainfo.get('noise'):
-                audio.noise_level = metainfo.get('noise')
-            if not audio.device_type and metainfo.get('device'):
-                audio.device_type = metainfo.get('device')
-            if not audio.has_microphone and metainfo.get('mic'):
-                audio.has_microphone = metainfo.get('mic')
-            if not audio.diagnosis and metainfo.get('diagnosis'):
-                audio.diagnosis = metainfo.get('diagnosis')
-            
-    except Exception as e:
-        print(f"[DEBUG] Metadata extraction error for audio {audio.id}: {e}")
-
 @login_required
 def audio_list(request):
     # identifier 필터링 처리
@@ -1135,7 +1002,9 @@ def audio_list(request):
         'name', '-name',
         'gender', '-gender',
         'age', '-age',
-        'task_type', '-task_type',  # JSON 필드 내부 정렬 (Python에서 처리)
+        'task_type', '-task_type',
+        'sentence_index', '-sentence_index',
+        'recording_date', '-recording_date',
         'status', '-status',
         'category', '-category',
         'snr_mean', '-snr_mean',
@@ -1156,20 +1025,8 @@ def audio_list(request):
     else:
         audio_list_qs = AudioRecord.objects.all()
     
-    # task_type 정렬은 Python에서 처리
-    if sort_by in ['task_type', '-task_type']:
-        audio_list_qs = list(audio_list_qs)
-        reverse = sort_by.startswith('-')
-        audio_list_qs.sort(
-            key=lambda x: x.category_specific_data.get('task_type', '') or '',
-            reverse=reverse
-        )
-    else:
-        audio_list_qs = audio_list_qs.order_by(sort_by)
-    
-    # 각 오디오에 대해 React Native 메타데이터에서 기본 정보 추출
-    for audio in audio_list_qs:
-        extract_metadata_to_fields(audio)
+    # task_type 등 JSON 키도 승격된 컬럼으로 SQL에서 정렬 (id로 순서 고정)
+    audio_list_qs = audio_list_qs.order_by(sort_by, '-id' if sort_by.startswith('-') else 'id')
     
     paginator = Paginator(audio_list_qs, 10)  # 한 페이지당 10개 항목
 
@@ -1205,7 +1062,9 @@ def category_audio_list(request, category):
         'name', '-name',
         'gender', '-gender',
         'age', '-age',
-        'task_type', '-task_type',  # JSON 필드 내부 정렬
+        'task_type', '-task_type',
+        'sentence_index', '-sentence_index',
+        'recording_date', '-recording_date',
         'status', '-status',
         'category', '-category',
         'snr_mean', '-snr_mean',
@@ -1226,20 +1085,8 @@ def category_audio_list(request, category):
     else:
         audio_list_qs = AudioRecord.objects.filter(category=category)
     
-    # task_type 정렬은 Python에서 처리
-    if sort_by in ['task_type', '-task_type']:
-        audio_list_qs = list(audio_list_qs)
-        reverse = sort_by.startswith('-')
-        audio_list_qs.sort(
-            key=lambda x: x.category_specific_data.get('task_type', '') or '',
-            reverse=reverse
-        )
-    else:
-        audio_list_qs = audio_list_qs.order_by(sort_by)
-    
-    # 각 오디오에 대해 React Native 메타데이터에서 기본 정보 추출
-    for audio in audio_list_qs:
-        extract_metadata_to_fields(audio)
+    # task_type 등 JSON 키도 승격된 컬럼으로 SQL에서 정렬 (id로 순서 고정)
+    audio_list_qs = audio_list_qs.order_by(sort_by, '-id' if sort_by.startswith('-') else 'id')
     
     paginator = Paginator(audio_list_qs, 10)  # 한 페이지당 10개 항목
 
@@ -1319,71 +1166,58 @@ def update_transcription(request, audio_id):
 
 @csrf_exempt
 def transcribe_unprocessed(request):
+    """미전사 레코드 전체를 일괄 전사(backfill) 작업으로 등록 - 워커가 BACKFILL_BATCH_SIZE개씩 배치로 전사"""
     if request.method == 'POST':
-        model = whisper.load_model("base")  # 필요 시 small, medium 등 조정
-
-        for record in AudioRecord.objects.filter(transcript__isnull=True):
-            wav_path = os.path.join(settings.MEDIA_ROOT, str(record.audio_file))
-            if os.path.exists(wav_path):
-                try:
-                    result = model.transcribe(wav_path, language='ko')
-                    record.transcript = result['text']
-                    # manual_transcript가 비어있으면 자동 전사 결과로 초기화
-                    if not record.manual_transcript:
-                        record.manual_transcript = result['text']
-                    record.save()
-                except Exception as e:
-                    print(f"❌ 전사 실패 ({record.id}): {e}")
+        queued = enqueue_unprocessed('backfill')
+        if wants_json_response(request):
+            return JsonResponse({'queued': queued}, status=202)
+        messages.info(request, f'미전사 파일 {queued}개를 전사 대기열에 등록했습니다.')
         return redirect('audio-list')
     else:
         return redirect('audio-list')
 
+def wants_json_response(request):
+    """AJAX/React Native 요청이면 JSON으로 응답 (브라우저 폼 제출은 리다이렉트 유지)"""
+    return (request.META.get('HTTP_ACCEPT', '').startswith('application/json') or
+            request.META.get('HTTP_X_REQUESTED_WITH') == 'XMLHttpRequest')
+
 @csrf_exempt
 def transcribe_single_audio(request, audio_id):
     audio = get_object_or_404(AudioRecord, id=audio_id)
     
-    print(f"[Transcribe] Starting transcription for audio ID: {audio_id}")
-    print(f"[Transcribe] Audio file path: {audio.audio_file.path if audio.audio_file else 'No file'}")
+    print(f"[Transcribe] Transcription requested for audio ID: {audio_id}")
 
     if request.method == 'POST':
         # 오디오 파일 존재 여부 확인
         if not audio.audio_file:
             print(f"[Transcribe Error] No audio file for ID {audio_id}")
+            if wants_json_response(request):
+                return JsonResponse({'error': '오디오 파일이 없습니다.'}, status=400)
             messages.error(request, '오디오 파일이 없습니다.')
             return redirect('audio_detail', audio_id=audio_id)
         
         if not os.path.exists(audio.audio_file.path):
             print(f"[Transcribe Error] Audio file not found: {audio.audio_file.path}")
+            if wants_json_response(request):
+                return JsonResponse({'error': '오디오 파일을 찾을 수 없습니다.'}, status=404)
             messages.error(request, '오디오 파일을 찾을 수 없습니다.')
             return redirect('audio_detail', audio_id=audio_id)
         
-        # 상태 업데이트 및 작업 시작
+        # 작업 등록만 수행 - 실제 전사는 run_transcription_workers 워커가 처리
+        job, created = enqueue_job(audio, 'transcribe')
         audio.status = 'processing'
         audio.save()
-        print(f"[Transcribe] Status set to 'processing' for audio ID: {audio_id}")
-        
-        try:
-            # 직접 전사 실행 (동기 방식)
-            print(f"[Transcribe] Calling transcribe_audio_task for ID: {audio_id}")
-            transcribe_audio_task(audio.id)
-            print(f"[Transcribe] Transcription task completed for ID: {audio_id}")
-            
-            # 결과 확인
-            audio.refresh_from_db()
-            if audio.transcript:
-                print(f"[Transcribe Success] Transcription result: {audio.transcript[:100]}...")
-                messages.success(request, 'Whisper 전사가 완료되었습니다.')
-            else:
-                print(f"[Transcribe Warning] No transcription result for ID: {audio_id}")
-                messages.warning(request, '전사가 완료되었으나 결과가 없습니다.')
-                
-        except Exception as e:
-            print(f"[Transcribe Error] Exception for ID {audio_id}: {type(e).__name__}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            audio.status = 'failed'
-            audio.save()
-            messages.error(request, f'전사 중 오류가 발생했습니다: {str(e)}')
+        print(f"[Transcribe] Job #{job.id} queued for audio ID: {audio_id} (new: {created})")
+
+        if wants_json_response(request):
+            return JsonResponse({
+                'job_id': job.id,
+                'job_status': job.status,
+                'status': audio.status,
+                'status_url': f'/api/transcription-status/{audio.id}/',
+            }, status=202)
+
+        messages.info(request, 'Whisper 전사 작업이 대기열에 등록되었습니다. 완료되면 페이지가 자동으로 갱신됩니다.')
     
     # audio_detail 페이지로 리다이렉트
     return redirect('audio_detail', audio_id=audio_id)
@@ -1391,7 +1225,10 @@ def transcribe_single_audio(request, audio_id):
 @csrf_exempt
 def reset_processing_status(request):
     if request.method == 'POST':
-        AudioRecord.objects.filter(status='processing').update(status='failed')
+        processing = AudioRecord.objects.filter(status='processing')
+        pairs = affected_pairs(processing)
+        processing.update(status='failed', updated_at=timezone.now())
+        refresh_after_bulk_write(pairs, speaker=False)  # update()는 시그널이 없음
         return redirect('audio_list')
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -1403,31 +1240,12 @@ class SimpleCategoryUploadView(View):
         if category not in valid_categories:
             return JsonResponse({'error': '유효하지 않은 카테고리입니다.'}, status=400)
         
-        audio_list = AudioRecord.objects.filter(category=category).order_by('-created_at')
-        
-        data = []
-        for audio in audio_list:
-            data.append({
-                'id': audio.id,
-                'audio_file': audio.audio_file.url if audio.audio_file else None,
-                'category': audio.category,
-                'gender': audio.gender,
-                'age': audio.age,
-                'transcript': audio.manual_transcript or audio.transcript,  # 수동 전사 우선, 없으면 자동 전사
-                'status': audio.status,
-                'snr_mean': audio.snr_mean,
-                'snr_max': audio.snr_max,
-                'snr_min': audio.snr_min,
-                'created_at': audio.created_at.isoformat(),
-                'detail_url': f'/audio/{audio.id}/',
-                'web_detail_url': f'http://210.125.101.159:8001/audio/{audio.id}/'  # 8002 → 8001로 변경
-            })
-        
-        return JsonResponse({
-            'category': category,
-            'count': len(data),
-            'results': data
-        })
+        try:
+            page = audio_list_page(AudioRecord.objects.filter(category=category), request.GET)
+        except InvalidCursor as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+        return JsonResponse({'category': category, **page})
 
     def post(self, request, category):
         """
@@ -1464,22 +1282,25 @@ class SimpleCategoryUploadView(View):
             category_media_folder = os.path.join(settings.MEDIA_ROOT, category_folder)
             os.makedirs(category_media_folder, exist_ok=True)
 
-            # m4a 파일 저장
-            file_data = ContentFile(file.read())
-            m4a_full_path = default_storage.save(m4a_storage_path, file_data)
+            # m4a 파일 저장 (업로드 임시 파일을 그대로 이동 - 메모리로 읽지 않음)
+            m4a_full_path = default_storage.save(m4a_storage_path, file)
             m4a_path = os.path.join(settings.MEDIA_ROOT, m4a_full_path)
 
             # wav 변환 경로 지정 (카테고리별 폴더에 저장)
             wav_filename = f"{unique_id}.wav"
             wav_path = os.path.join(settings.MEDIA_ROOT, category_folder, wav_filename)
 
-            # 변환 실행
-            convert_m4a_to_wav(m4a_path, wav_path)
+            # 변환 실행 (16kHz 모노 WAV 또는 업로드 중 스트리밍 변환된 결과가 있으면 재사용)
+            prepare_wav(m4a_path, wav_path, uploaded_file=file)
+            audio_stats = analyze_wav(wav_path) or {}
+            if snr_mean in (None, '') and audio_stats.get('snr_mean') is not None:
+                snr_mean, snr_max, snr_min = audio_stats['snr_mean'], audio_stats['snr_max'], audio_stats['snr_min']
 
             # 무음 여부 확인
-            if is_audio_silent(wav_path):
-                os.remove(m4a_path)
-                os.remove(wav_path)
+            if is_audio_silent(wav_path, stats=audio_stats):
+                for path in {m4a_path, wav_path}:
+                    if os.path.exists(path):
+                        os.remove(path)
                 return JsonResponse({'error': 'Silent file was rejected.'}, status=400)
 
             # DB 저장 (카테고리 포함, audio_file 경로는 카테고리별 경로)
@@ -1488,13 +1309,15 @@ class SimpleCategoryUploadView(View):
                 category=category,
                 gender=gender,
                 age=age,
-                snr_mean=float(snr_mean) if snr_mean else None,
-                snr_max=float(snr_max) if snr_max else None,
-                snr_min=float(snr_min) if snr_min else None
+                snr_mean=float(snr_mean) if snr_mean not in (None, '') else None,
+                snr_max=float(snr_max) if snr_max not in (None, '') else None,
+                snr_min=float(snr_min) if snr_min not in (None, '') else None,
+                **audio_stats_fields(audio_stats)
             )
 
-            # m4a 삭제
-            if os.path.exists(m4a_path):
+            # 원본 업로드 파일 삭제 (이미 16kHz 모노 WAV였으면 adopt_ready_wav가 wav_path로 옮겼으므로 남아 있지 않음,
+            #  원본 경로가 wav_path와 같으면 그 파일이 저장된 WAV이므로 유지)
+            if os.path.exists(m4a_path) and os.path.abspath(m4a_path) != os.path.abspath(wav_path):
                 os.remove(m4a_path)
 
             return JsonResponse({
@@ -1509,31 +1332,11 @@ class SimpleCategoryUploadView(View):
 
 @api_view(['GET'])
 def api_all_audio_list(request):
-    """React Native를 위한 전체 오디오 리스트 API"""
-    audio_list = AudioRecord.objects.all().order_by('-created_at')
-    
-    data = []
-    for audio in audio_list:
-        data.append({
-            'id': audio.id,
-            'audio_file': audio.audio_file.url if audio.audio_file else None,
-            'category': audio.category,
-            'gender': audio.gender,
-            'age': audio.age,
-            'transcript': audio.manual_transcript or audio.transcript,  # 수동 전사 우선
-            'status': audio.status,
-            'snr_mean': audio.snr_mean,
-            'snr_max': audio.snr_max,
-            'snr_min': audio.snr_min,
-            'created_at': audio.created_at.isoformat(),
-            'detail_url': f'/audio/{audio.id}/',
-            'web_detail_url': f'http://210.125.101.159:8001/audio/{audio.id}/'  # 8002 → 8001로 변경
-        })
-    
-    return Response({
-        'count': len(data),
-        'results': data
-    })
+    """React Native를 위한 전체 오디오 리스트 API (?cursor=&limit= keyset 페이지네이션)"""
+    try:
+        return Response(audio_list_page(AudioRecord.objects.all(), request.query_params))
+    except InvalidCursor as e:
+        return Response({'error': str(e)}, status=400)
 
 @csrf_exempt
 def django_upload(request):
@@ -1716,9 +1519,8 @@ def audio_detail(request, audio_id):
     elif metainfo_child.get('age_in_months'):
         age_in_months = metainfo_child.get('age_in_months')
     
-    # JSON 데이터를 문자열로 변환
+    # JSON 데이터를 문자열로 변환 (alignment는 시각화를 열 때 /api/alignment-data/에서 따로 불러옴)
     category_data_json = json.dumps(audio.category_specific_data or {})
-    alignment_data_json = json.dumps(audio.alignment_data or {})
     
     # 카테고리별 필드 스키마 정보
     category_schema = {
@@ -1850,7 +1652,6 @@ def audio_detail(request, audio_id):
         'birth_date': birth_date,
         'age_in_months': age_in_months,  # 월령 정보 추가
         'category_data_json': category_data_json,
-        'alignment_data_json': alignment_data_json,
         'category_schema': category_schema.get(audio.category, {}),
         'has_category_data': bool(audio.category_specific_data),
         'has_alignment_data': bool(audio.alignment_data),
@@ -1925,143 +1726,6 @@ def update_audio_metadata(request, audio_id):
     
     return redirect('audio_detail', audio_id=audio_id)
 
-# WhisperX 관련 기능 추가 - 의존성 때문에 임시 주석
-# import whisperx
-import tempfile
-# import torch
-
-# WhisperX 의존성 때문에 임시 주석처리
-"""
-class WhisperXProcessor:
-    # WhisperX를 관리하는 최적화된 클래스
-    def __init__(self, model_size="base", device="auto"):
-        self.model_size = model_size
-        self.device = self._get_best_device(device)
-        self.compute_type = "int8" if self.device == "cpu" else "float16"
-        self.model = None
-        self.alignment_models = {}
-    
-    def _get_best_device(self, device):
-        # 최적의 디바이스 선택
-        if device == "auto":
-            if torch.cuda.is_available():
-                try:
-                    # CUDA 테스트
-                    test_tensor = torch.tensor([1.0]).cuda()
-                    return "cuda"
-                except:
-                    return "cpu"
-            else:
-                return "cpu"
-        return device
-    
-    def load_model(self):
-        # ASR 모델 로드 (싱글톤)
-        if self.model is None:
-            try:
-                self.model = whisperx.load_model(
-                    self.model_size, 
-                    device=self.device,
-                    compute_type=self.compute_type
-                )
-                print(f"✅ WhisperX 모델 로드 완료: {self.model_size} ({self.device})")
-            except Exception as e:
-                print(f"❌ WhisperX 모델 로드 실패: {e}")
-                # CPU fallback
-                if self.device == "cuda":
-                    self.device = "cpu"
-                    self.compute_type = "int8"
-                    self.model = whisperx.load_model(
-                        self.model_size, 
-                        device="cpu",
-                        compute_type="int8"
-                    )
-                else:
-                    raise e
-        return self.model
-    
-    def get_alignment_model(self, language_code):
-        # 언어별 정렬 모델 로드 (캐싱)
-        if language_code not in self.alignment_models:
-            try:
-                alignment_model, metadata = whisperx.load_align_model(
-                    language_code=language_code, 
-                    device=self.device
-                )
-                self.alignment_models[language_code] = (alignment_model, metadata)
-                print(f"✅ 정렬 모델 로드 완료: {language_code}")
-            except Exception as e:
-                print(f"❌ 정렬 모델 로드 실패 ({language_code}): {e}")
-                raise e
-        return self.alignment_models[language_code]
-    
-    def transcribe_with_alignment(self, audio_path, **kwargs):
-        # 음성인식 + 정렬을 한번에 수행
-        try:
-            # ASR 수행
-            model = self.load_model()
-            
-            # 설정값들
-            batch_size = kwargs.get('batch_size', 16)
-            temperature = kwargs.get('temperature', 0.0)
-            language = kwargs.get('language')
-            
-            asr_options = {
-                'batch_size': batch_size,
-                'temperature': temperature,
-            }
-            if language:
-                asr_options['language'] = language
-                
-            result = model.transcribe(audio_path, **asr_options)
-            
-            # 언어 감지 결과
-            detected_language = result.get("language", "en")
-            
-            # 정렬 수행 (단어 단위 타이밍)
-            try:
-                alignment_model, metadata = self.get_alignment_model(detected_language)
-                aligned_result = whisperx.align(
-                    result["segments"], 
-                    alignment_model, 
-                    metadata, 
-                    audio_path, 
-                    device=self.device,
-                    return_char_alignments=False
-                )
-                segments = aligned_result.get("segments", [])
-            except Exception as e:
-                print(f"⚠ 정렬 실패, ASR 결과만 사용: {e}")
-                segments = result.get("segments", [])
-            
-            # 전체 텍스트 생성
-            full_text = " ".join([segment.get("text", "") for segment in segments])
-            
-            return {
-                'success': True,
-                'language': detected_language,
-                'text': full_text,
-                'segments': segments,
-                'segment_count': len(segments),
-                'processing_info': {
-                    'model_size': self.model_size,
-                    'device': self.device,
-                    'compute_type': self.compute_type
-                }
-            }
-            
-        except Exception as e:
-            print(f"❌ WhisperX 처리 실패: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'error_type': type(e).__name__
-            }
-
-# 전역 WhisperX 프로세서 인스턴스
-whisperx_processor = WhisperXProcessor(model_size="base", device="auto")
-"""
-
 @csrf_exempt
 @api_view(['POST'])
 def whisperx_transcribe(request):
@@ -2085,135 +1749,60 @@ def whisperx_transcribe_simple(request):
     }, status=503)
 
 
-def dashboard(request):
-    """데이터 대시보드 페이지 - Identifier 기반 화자 그룹핑 통계 (로그인 불필요)"""
-    from django.db.models import Count, Avg, Max, Min, Q, F
-    from django.db import connection
-    import json
-    from collections import defaultdict
-    from datetime import datetime, timedelta
+def stats_snapshot_context(name, builder):
+    """통계 스냅샷(stats_cache)을 가져와 생성 시각/경과 시간을 함께 담은 context 반환"""
     from django.utils import timezone
+    from datetime import datetime
     
-    # SQLite 데이터베이스 연결을 새로 고침
-    # 기존 연결을 닫고 다시 연결하여 최신 데이터를 로드
-    connection.close()
-    connection.connect()
+    data, generated_at = get_stats_snapshot(name, builder)
+    return {
+        **data,
+        'stats_generated_at': datetime.fromtimestamp(generated_at, tz=timezone.get_current_timezone()),
+        'stats_age_seconds': stats_snapshot_age(generated_at),
+    }
+
+
+def dashboard(request):
+    """데이터 대시보드 페이지 - Identifier 기반 화자 그룹핑 통계 (로그인 불필요, 캐시된 스냅샷)"""
+    return render(request, 'voice_app/dashboard.html', stats_snapshot_context('dashboard', build_dashboard_stats))
+
+
+def build_dashboard_stats():
+    """대시보드 통계 계산 (stats_cache 스냅샷 빌더)"""
+    from django.db.models import Count, Avg, Max, Min, Case, When, Value, CharField
+    from django.db.models.functions import TruncMonth
+    from django.utils import timezone
     
-    # 성별 정규화 함수
-    def normalize_gender(gender):
-        """다양한 형식의 성별 데이터를 통일된 형식으로 변환"""
-        if not gender:
-            return None
-        gender_lower = gender.lower().strip()
-        if gender_lower in ['남', '남자', 'male', 'm']:
-            return '남성'
-        elif gender_lower in ['여', '여자', 'female', 'f']:
-            return '여성'
-        elif gender_lower in ['unknown', '미상', '불명']:
-            return '미상'
-        return gender  # 그 외의 경우 원본 반환
+    def grouped(queryset, field, key=None, order='-count', limit=None):
+        """field 값별 개수 (GROUP BY) → [{key: 값, 'count': n}]"""
+        rows = queryset.exclude(**{f'{field}__isnull': True})
+        if queryset.model._meta.get_field(field).get_internal_type() == 'CharField':
+            rows = rows.exclude(**{field: ''})
+        rows = rows.values(field).annotate(count=Count('id')).order_by(order if order != 'key' else field)
+        if limit:
+            rows = rows[:limit]
+        return [{key or field: row[field], 'count': row['count']} for row in rows]
     
     # === 전체 통계 ===
     total_files = AudioRecord.objects.count()
     
     # === Identifier 기반 화자(Speaker) 통계 ===
-    # 각 identifier는 하나의 고유한 화자를 나타냄
-    unique_speakers = AudioRecord.objects.exclude(identifier__isnull=True).exclude(identifier__exact='').values('identifier').distinct()
-    total_speakers = unique_speakers.count()
-    
-    # 화자별 정보 수집 (identifier로 그룹핑)
-    speaker_info = {}
-    speaker_recordings_count = defaultdict(int)
-    
-    for speaker in unique_speakers:
-        identifier = speaker['identifier']
-        # 해당 화자의 첫 번째 레코드에서 메타데이터 추출 (같은 identifier는 동일한 화자 정보를 가짐)
-        first_record = AudioRecord.objects.filter(identifier=identifier).first()
-        
-        if first_record:
-            category = first_record.category
-            # 성별 정규화
-            normalized_gender = normalize_gender(first_record.gender)
-            
-            speaker_info[identifier] = {
-                'identifier': identifier,
-                'category': category,
-                'gender': normalized_gender,
-                'region': first_record.region,
-                'education_level': first_record.education_level,
-                'hearing_level': first_record.hearing_level,
-                'age_in_months': first_record.age_in_months,
-                'recordings_count': AudioRecord.objects.filter(identifier=identifier).count()
-            }
-            
-            # 카테고리별 추가 정보
-            if category == 'child':
-                speaker_info[identifier]['age_group'] = f"{(first_record.age_in_months // 12)}세" if first_record.age_in_months else None
-                speaker_info[identifier]['device'] = first_record.get_category_data('device')
-                speaker_info[identifier]['task_type'] = first_record.get_category_data('task_type')
-            
-            elif category == 'senior':
-                # 연령은 metadata에 있음
-                age = first_record.get_category_data('age')
-                speaker_info[identifier]['age'] = age
-                # 실제 데이터에 있는 필드 사용
-                speaker_info[identifier]['education'] = first_record.get_category_data('education')
-                speaker_info[identifier]['task_type'] = first_record.get_category_data('task_type')
-                speaker_info[identifier]['cognitive_decline'] = first_record.get_category_data('cognitive_decline')
-                speaker_info[identifier]['job'] = first_record.get_category_data('job')
-            
-            elif category == 'auditory':
-                age = first_record.get_category_data('age')
-                speaker_info[identifier]['age'] = age
-                speaker_info[identifier]['has_hearing_aid'] = first_record.get_category_data('has_hearing_aid')
-                speaker_info[identifier]['native_language'] = first_record.get_category_data('native_language')
-    
-    # 카테고리별 화자 수 통계
-    category_speaker_stats = defaultdict(int)
-    for info in speaker_info.values():
-        category_speaker_stats[info['category']] += 1
-    
-    category_speaker_stats_list = [{'category': k, 'count': v} for k, v in category_speaker_stats.items()]
-    
-    # 성별 화자 수 통계
-    gender_speaker_stats = defaultdict(int)
-    for info in speaker_info.values():
-        if info['gender']:
-            gender_speaker_stats[info['gender']] += 1
-    
-    gender_speaker_stats_list = [{'gender': k, 'count': v} for k, v in gender_speaker_stats.items()]
-    
-    # 지역별 화자 수 통계
-    region_speaker_stats = defaultdict(int)
-    for info in speaker_info.values():
-        if info['region']:
-            region_speaker_stats[info['region']] += 1
-    
-    region_speaker_stats_list = sorted([{'region': k, 'count': v} for k, v in region_speaker_stats.items()], key=lambda x: x['count'], reverse=True)
-    
-    # 교육 수준별 화자 수 통계 (Senior, Auditory)
-    education_speaker_stats = defaultdict(int)
-    for info in speaker_info.values():
-        if info['category'] in ['senior', 'auditory'] and info.get('education_level'):
-            education_speaker_stats[info['education_level']] += 1
-    
-    education_speaker_stats_list = sorted([{'education_level': k, 'count': v} for k, v in education_speaker_stats.items()], key=lambda x: x['education_level'])
-    
-    # 청력 수준별 화자 수 통계 (Auditory)
-    hearing_speaker_stats = defaultdict(int)
-    for info in speaker_info.values():
-        if info['category'] == 'auditory' and info.get('hearing_level'):
-            hearing_speaker_stats[info['hearing_level']] += 1
-    
-    hearing_speaker_stats_list = sorted([{'hearing_level': k, 'count': v} for k, v in hearing_speaker_stats.items()], key=lambda x: x['hearing_level'])
-    
-    # 연령대별 화자 수 통계 (Child)
-    age_group_speaker_stats = defaultdict(int)
-    for info in speaker_info.values():
-        if info['category'] == 'child' and info.get('age_group'):
-            age_group_speaker_stats[info['age_group']] += 1
-    
-    age_group_speaker_stats_list = sorted([{'age_group': k, 'count': v} for k, v in age_group_speaker_stats.items()], key=lambda x: x['age_group'])
+    # 화자별 정보는 SpeakerSummary 집계 테이블에서 조회 (voice_app/rollups.py)
+    speakers = SpeakerSummary.objects.all()
+    total_speakers = speakers.count()
+    child_speakers = speakers.filter(category='child')
+    senior_speakers = speakers.filter(category='senior')
+    auditory_speakers = speakers.filter(category='auditory')
+    
+    category_speaker_stats_list = grouped(speakers, 'category', order='category')
+    gender_speaker_stats_list = grouped(speakers, 'gender', order='gender')
+    region_speaker_stats_list = grouped(speakers, 'region')
+    # 교육 수준별 (Senior, Auditory) / 청력 수준별 (Auditory) / 연령대별 (Child)
+    education_speaker_stats_list = grouped(
+        speakers.filter(category__in=['senior', 'auditory']).exclude(education_level=0), 'education_level', order='key'
+    )
+    hearing_speaker_stats_list = grouped(auditory_speakers, 'hearing_level', order='key')
+    age_group_speaker_stats_list = grouped(child_speakers, 'age_group', order='key')
     
     # === 기존 파일 기반 통계 (참고용) ===
     # 카테고리별 통계
@@ -2233,97 +1822,53 @@ def dashboard(request):
         count_with_snr=Count('snr_mean')
     )
     
-    # 월별 업로드 통계 (최근 12개월)
-    monthly_stats = []
-    for i in range(12):
-        month_start = timezone.now().replace(day=1) - timedelta(days=30*i)
-        month_end = month_start + timedelta(days=32)
-        month_end = month_end.replace(day=1) - timedelta(days=1)
-        
-        count = AudioRecord.objects.filter(
-            created_at__gte=month_start,
-            created_at__lte=month_end
-        ).count()
-        
-        monthly_stats.append({
-            'month': month_start.strftime('%Y-%m'),
-            'count': count
-        })
-    
-    monthly_stats.reverse()  # 시간순 정렬
+    # 월별 업로드 통계 (최근 12개월, 한 번의 GROUP BY)
+    now = timezone.localtime() if timezone.is_aware(timezone.now()) else timezone.now()
+    months = []
+    year, month = now.year, now.month
+    for _ in range(12):
+        months.append((year, month))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    months.reverse()  # 시간순 정렬
+    
+    first_month = now.replace(year=months[0][0], month=months[0][1], day=1, hour=0, minute=0, second=0, microsecond=0)
+    monthly_counts = {
+        row['month'].strftime('%Y-%m'): row['count']
+        for row in AudioRecord.objects.filter(created_at__gte=first_month)
+        .annotate(month=TruncMonth('created_at')).values('month').annotate(count=Count('id')).order_by()
+        if row['month']
+    }
+    monthly_stats = [
+        {'month': f'{y:04d}-{m:02d}', 'count': monthly_counts.get(f'{y:04d}-{m:02d}', 0)}
+        for y, m in months
+    ]
     
     # === 카테고리별 상세 화자 통계 ===
-    
-    # Child 화자 통계
-    child_speakers = [info for info in speaker_info.values() if info['category'] == 'child']
-    child_device_stats = defaultdict(int)
-    child_task_stats = defaultdict(int)
-    
-    for speaker in child_speakers:
-        if speaker.get('device'):
-            child_device_stats[speaker['device']] += 1
-        if speaker.get('task_type'):
-            child_task_stats[speaker['task_type']] += 1
-    
-    # Senior 화자 통계
-    senior_speakers = [info for info in speaker_info.values() if info['category'] == 'senior']
-    senior_cognitive_stats = defaultdict(int)
-    senior_job_stats = defaultdict(int)
-    senior_education_stats = defaultdict(int)
-    senior_task_stats = defaultdict(int)
-    
-    for speaker in senior_speakers:
-        # 인지 저하 통계 (있는 경우에만)
-        if speaker.get('cognitive_decline'):
-            senior_cognitive_stats[speaker['cognitive_decline']] += 1
-        # 직업 통계 (있는 경우에만)
-        if speaker.get('job'):
-            senior_job_stats[speaker['job']] += 1
-        # 교육 년수 통계 (실제 데이터에 있음)
-        if speaker.get('education'):
-            education = speaker['education']
-            senior_education_stats[f"{education}년"] += 1
-        # 과제 유형 통계 (실제 데이터에 있음)
-        if speaker.get('task_type'):
-            senior_task_stats[speaker['task_type']] += 1
-    
-    # Auditory 화자 통계
-    auditory_speakers = [info for info in speaker_info.values() if info['category'] == 'auditory']
-    auditory_hearing_aid_stats = defaultdict(int)
-    auditory_language_stats = defaultdict(int)
-    
-    for speaker in auditory_speakers:
-        if speaker.get('has_hearing_aid'):
-            auditory_hearing_aid_stats[speaker['has_hearing_aid']] += 1
-        if speaker.get('native_language'):
-            auditory_language_stats[speaker['native_language']] += 1
-    
-    # 리스트로 변환
-    child_device_stats_list = sorted([{'device': k, 'count': v} for k, v in child_device_stats.items()], key=lambda x: x['count'], reverse=True)
-    child_task_stats_list = sorted([{'task': k, 'count': v} for k, v in child_task_stats.items()], key=lambda x: x['count'], reverse=True)
-    senior_cognitive_stats_list = [{'status': k, 'count': v} for k, v in senior_cognitive_stats.items()]
-    senior_job_stats_list = sorted([{'job': k, 'count': v} for k, v in senior_job_stats.items()], key=lambda x: x['count'], reverse=True)[:10]
-    senior_education_stats_list = sorted([{'education': k, 'count': v} for k, v in senior_education_stats.items()], key=lambda x: x['education'])
-    senior_task_stats_list = sorted([{'task': k, 'count': v} for k, v in senior_task_stats.items()], key=lambda x: x['count'], reverse=True)
-    auditory_hearing_aid_stats_list = [{'status': k, 'count': v} for k, v in auditory_hearing_aid_stats.items()]
-    auditory_language_stats_list = sorted([{'language': k, 'count': v} for k, v in auditory_language_stats.items()], key=lambda x: x['count'], reverse=True)
+    child_device_stats_list = grouped(child_speakers, 'device')
+    child_task_stats_list = grouped(child_speakers, 'task_type', key='task')
+    senior_cognitive_stats_list = grouped(senior_speakers, 'cognitive_decline', key='status', order='cognitive_decline')
+    senior_job_stats_list = grouped(senior_speakers, 'job', limit=10)
+    senior_education_stats_list = sorted(
+        [{'education': f"{row['education']}년", 'count': row['count']} for row in grouped(senior_speakers, 'education')],
+        key=lambda x: x['education']
+    )
+    senior_task_stats_list = grouped(senior_speakers, 'task_type', key='task')
+    auditory_hearing_aid_stats_list = grouped(auditory_speakers, 'has_hearing_aid', key='status', order='has_hearing_aid')
+    auditory_language_stats_list = grouped(auditory_speakers, 'native_language', key='language')
     
     # === 화자별 녹음 수 분포 ===
-    recordings_per_speaker = defaultdict(int)
-    for info in speaker_info.values():
-        count = info['recordings_count']
-        if count == 1:
-            recordings_per_speaker['1개'] += 1
-        elif count <= 5:
-            recordings_per_speaker['2-5개'] += 1
-        elif count <= 10:
-            recordings_per_speaker['6-10개'] += 1
-        elif count <= 20:
-            recordings_per_speaker['11-20개'] += 1
-        else:
-            recordings_per_speaker['21개 이상'] += 1
-    
-    recordings_per_speaker_list = [{'range': k, 'count': v} for k, v in recordings_per_speaker.items()]
+    buckets = ['1개', '2-5개', '6-10개', '11-20개', '21개 이상']
+    bucket_counts = dict(
+        speakers.annotate(bucket=Case(
+            When(recordings_count__lte=1, then=Value(buckets[0])),
+            When(recordings_count__lte=5, then=Value(buckets[1])),
+            When(recordings_count__lte=10, then=Value(buckets[2])),
+            When(recordings_count__lte=20, then=Value(buckets[3])),
+            default=Value(buckets[4]),
+            output_field=CharField(),
+        )).values_list('bucket').annotate(count=Count('id')).order_by()
+    )
+    recordings_per_speaker_list = [{'range': b, 'count': bucket_counts[b]} for b in buckets if bucket_counts.get(b)]
     
     # 화자당 평균 녹음 수
     avg_recordings_per_speaker = total_files / total_speakers if total_speakers > 0 else 0
@@ -2372,7 +1917,7 @@ def dashboard(request):
         'diagnosis_stats': diagnosis_stats,
     }
     
-    return render(request, 'voice_app/dashboard.html', context)
+    return context
 
 
 
@@ -2381,64 +1926,31 @@ def dashboard(request):
 @require_POST
 def whisperx_align_audio(request, audio_id):
     """
-    WhisperX를 사용하여 오디오 파일의 forced alignment 수행
+    WhisperX forced alignment 작업을 대기열에 등록 (처리는 run_transcription_workers 워커가 수행)
     """
-    try:
-        audio_record = get_object_or_404(AudioRecord, id=audio_id)
-        
-        if audio_record.alignment_status == 'processing':
-            messages.warning(request, '이미 처리 중인 파일입니다.')
-            return redirect('audio_detail', audio_id=audio_id)
-        
-        # 상태를 처리 중으로 변경
-        audio_record.alignment_status = 'processing'
-        audio_record.save()
-        
-        messages.info(request, 'WhisperX alignment 처리를 시작합니다. 잠시만 기다려주세요.')
-        
-        # 오디오 파일 경로
-        audio_path = audio_record.audio_file.path
-        
-        # WhisperX 처리 수행
-        result = transcribe_and_align_whisperx(audio_path)
-        
-        if result['success']:
-            # 성공한 경우
-            audio_record.alignment_data = {
-                'segments': result['segments'],
-                'word_segments': result['word_segments'],
-                'transcription': result['transcription'],
-                'success': True
-            }
-            audio_record.alignment_status = 'completed'
-            
-            # 전사가 없었다면 전사도 업데이트
-            if not audio_record.transcript:
-                audio_record.transcript = result['transcription']
-                # manual_transcript가 비어있으면 자동 전사 결과로 초기화
-                if not audio_record.manual_transcript:
-                    audio_record.manual_transcript = result['transcription']
-                audio_record.status = 'completed'
-            
-            audio_record.save()
-            messages.success(request, 'WhisperX alignment가 완료되었습니다!')
-        else:
-            # 실패한 경우
-            audio_record.alignment_data = {
-                'error': result['error'],
-                'success': False
-            }
-            audio_record.alignment_status = 'failed'
-            audio_record.save()
-            messages.error(request, f'WhisperX alignment 실패: {result["error"]}')
-        
-    except Exception as e:
-        messages.error(request, f'처리 중 오류가 발생했습니다: {str(e)}')
-        # 오류 발생 시 상태 초기화
-        if 'audio_record' in locals():
-            audio_record.alignment_status = 'failed'
-            audio_record.save()
+    audio_record = get_object_or_404(AudioRecord, id=audio_id)
+    
+    if audio_record.alignment_status == 'processing':
+        if wants_json_response(request):
+            return JsonResponse({'error': '이미 처리 중인 파일입니다.', 'status': 'processing'}, status=409)
+        messages.warning(request, '이미 처리 중인 파일입니다.')
+        return redirect('audio_detail', audio_id=audio_id)
     
+    job, created = enqueue_job(audio_record, 'align')
+    
+    # 상태를 처리 중으로 변경
+    audio_record.alignment_status = 'processing'
+    audio_record.save()
+    
+    if wants_json_response(request):
+        return JsonResponse({
+            'job_id': job.id,
+            'job_status': job.status,
+            'status': audio_record.alignment_status,
+            'status_url': f'/api/alignment-status/{audio_record.id}/',
+        }, status=202)
+    
+    messages.info(request, 'WhisperX alignment 작업이 대기열에 등록되었습니다. 완료되면 페이지가 자동으로 갱신됩니다.')
     return redirect('audio_detail', audio_id=audio_id)
 
 
@@ -2456,8 +1968,21 @@ def get_alignment_data(request, audio_id):
                 'error': 'No alignment data available'
             })
         
+        # ?start=&end= (초) 범위만, ?columnar=1 이면 단어를 열 단위로 (압축 저장된 단어에서 필요한 부분만 읽음)
+        try:
+            start = float(request.GET['start']) if request.GET.get('start') else None
+            end = float(request.GET['end']) if request.GET.get('end') else None
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'start/end는 초 단위 숫자여야 합니다.'}, status=400)
+        
         # 프론트엔드용 포맷으로 변환
-        formatted_data = format_alignment_for_frontend(audio_record.alignment_data)
+        formatted_data = format_alignment_for_frontend(
+            audio_record.alignment_data,
+            words=word_accessor(audio_record),
+            start=start,
+            end=end,
+            columnar=request.GET.get('columnar') in ('1', 'true'),
+        )
         
         return JsonResponse({
             'success': True,
@@ -2472,6 +1997,23 @@ def get_alignment_data(request, audio_id):
         })
 
 
+@login_required
+def get_transcription_status(request, audio_id):
+    """
+    Whisper 전사 처리 상태를 확인하는 AJAX 엔드포인트 (transcribe_single_audio 응답의 status_url)
+    """
+    audio_record = get_object_or_404(AudioRecord, id=audio_id)
+    job = job_progress(audio_id, 'transcribe')
+
+    return JsonResponse({
+        'status': audio_record.status,
+        'has_transcript': bool(audio_record.transcript),
+        'stage': job['stage'] if job else '',
+        'progress': job['progress'] if job else 0,
+        'job': job,
+    })
+
+
 @login_required
 def get_alignment_status(request, audio_id):
     """
@@ -2479,11 +2021,16 @@ def get_alignment_status(request, audio_id):
     """
     try:
         audio_record = get_object_or_404(AudioRecord, id=audio_id)
+        job = job_progress(audio_id, 'align')
         
         return JsonResponse({
             'status': audio_record.alignment_status,
             'transcription_status': audio_record.status,
-            'has_alignment_data': bool(audio_record.alignment_data)
+            'has_alignment_data': bool(audio_record.alignment_data),
+            'stage': job['stage'] if job else '',
+            'progress': job['progress'] if job else 0,
+            'job': job,
+            'transcription_job': job_progress(audio_id, 'transcribe'),
         })
         
     except Exception as e:
@@ -2538,6 +2085,15 @@ class MobileUploadView(View):
             
             # 레코드 생성
             audio_record = AudioRecord.objects.create(**common_data)
+
+            # PCM WAV면 길이/레벨/SNR 계산 (그 외 형식은 compute_snr 명령에서 임시 변환 후 계산)
+            audio_stats = analyze_wav(audio_record.audio_file.path)
+            if audio_stats:
+                for field, value in audio_stats_fields(audio_stats).items():
+                    setattr(audio_record, field, value)
+                audio_record.snr_mean = audio_stats['snr_mean']
+                audio_record.snr_max = audio_stats['snr_max']
+                audio_record.snr_min = audio_stats['snr_min']
             
             # 카테고리별 특화 데이터 설정
             if category == 'child':
@@ -2583,6 +2139,141 @@ class MobileUploadView(View):
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
 
+# 재개 가능한 청크 업로드 API (voice_app/upload_sessions.py)
+def upload_session_error_response(e):
+    return JsonResponse({'error': str(e), **e.extra}, status=e.status_code)
+
+
+@csrf_exempt
+@require_POST
+def upload_session_create(request):
+    """
+    청크 업로드 세션 생성
+    요청(JSON): filename, total_size, chunk_size(선택), category, checksum(SHA256, 선택),
+               content_type(선택), metadata(AudioUploadView 폼 필드와 같은 키의 dict)
+    """
+    try:
+        if request.content_type == 'application/json':
+            payload = json.loads(request.body or b'{}')
+        else:
+            payload = request.POST.dict()
+            if payload.get('metadata'):
+                payload['metadata'] = json.loads(payload['metadata'])
+
+        session = create_upload_session(
+            filename=payload.get('filename'),
+            total_size=int(payload.get('total_size') or 0),
+            chunk_size=int(payload['chunk_size']) if payload.get('chunk_size') else None,
+            category=payload.get('category') or 'normal',
+            content_type=payload.get('content_type', ''),
+            checksum=payload.get('checksum', ''),
+            metadata=payload.get('metadata') or {},
+        )
+    except UploadSessionError as e:
+        return upload_session_error_response(e)
+    except (ValueError, TypeError) as e:
+        return JsonResponse({'error': f'잘못된 요청입니다: {e}'}, status=400)
+
+    progress = session_progress(session)
+    progress['chunk_url'] = f"/api/uploads/{session.upload_id}/chunks/{{index}}/"
+    progress['finalize_url'] = f"/api/uploads/{session.upload_id}/finalize/"
+    return JsonResponse(progress, status=201)
+
+
+@csrf_exempt
+@require_http_methods(['GET'])
+def upload_session_status(request, upload_id):
+    """청크 업로드 진행 상황 (누락된 청크 번호 포함)"""
+    try:
+        session = get_upload_session(upload_id)
+    except UploadSessionError as e:
+        return upload_session_error_response(e)
+    return JsonResponse(session_progress(session))
+
+
+@csrf_exempt
+@require_http_methods(['PUT'])
+def upload_session_chunk(request, upload_id, index):
+    """
+    청크 전송 - 요청 본문이 청크 바이트 그대로 (application/octet-stream)
+    헤더: Upload-Offset (index * chunk_size, 선택), X-Chunk-Sha256 (선택)
+    """
+    try:
+        session = get_upload_session(upload_id)
+        offset = request.headers.get('Upload-Offset') or request.GET.get('offset')
+        session = write_upload_chunk(
+            session,
+            index,
+            request,  # 본문을 블록 단위로 읽음 (request.body 사용 안 함)
+            length=int(request.META.get('CONTENT_LENGTH') or 0),
+            offset=int(offset) if offset not in (None, '') else None,
+            chunk_sha256=request.headers.get('X-Chunk-Sha256'),
+        )
+    except UploadSessionError as e:
+        return upload_session_error_response(e)
+    except ValueError as e:
+        return JsonResponse({'error': f'잘못된 요청입니다: {e}'}, status=400)
+
+    return JsonResponse({
+        'upload_id': str(session.upload_id),
+        'index': index,
+        'received_size': session.received_size,
+        'missing_chunks': session.missing_chunks(),
+    })
+
+
+@csrf_exempt
+@require_POST
+def upload_session_finalize(request, upload_id):
+    """
+    청크 조립 → SHA256 검증 → AudioUploadView.process_upload()로 변환/AudioRecord 생성
+    요청(JSON, 선택): checksum
+
+    재시도 안전: finalizing 상태로 바꾼 요청 하나만 처리하고, 동시에 들어온 요청은 409,
+    이미 완료된 세션은 기존 AudioRecord id를 반환한다.
+    """
+    try:
+        checksum = None
+        if request.content_type == 'application/json' and request.body:
+            checksum = json.loads(request.body).get('checksum')
+        else:
+            checksum = request.POST.get('checksum')
+
+        session = begin_upload_finalize(get_upload_session(upload_id))
+    except UploadSessionError as e:
+        return upload_session_error_response(e)
+    except ValueError as e:
+        return JsonResponse({'error': f'잘못된 요청입니다: {e}'}, status=400)
+
+    if session.status == 'completed':
+        return JsonResponse({'message': '이미 완료된 업로드입니다.', 'id': session.audio_id,
+                             'upload_id': str(session.upload_id)})
+
+    try:
+        assembled = assemble_upload_session(session, checksum=checksum)
+    except UploadSessionError as e:
+        reopen_upload_session(session)  # 누락된 청크 등 - SHA256 불일치는 이미 failed
+        return upload_session_error_response(e)
+
+    try:
+        response = AudioUploadView().process_upload(session.metadata, assembled, None, session.category)
+    except Exception as e:
+        # 조립 파일이 이미 저장소로 옮겨졌을 수 있으므로 재시도하지 않고 실패 처리
+        fail_upload_session(session, f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        assembled.close()
+
+    if response.status_code >= 400:
+        fail_upload_session(session, response.data.get('error') or response.data.get('message', ''))
+        return JsonResponse(response.data, status=response.status_code)
+
+    complete_upload_session(session, response.data.get('id'))
+    print(f"[UploadSession] Finalized {session.upload_id} -> AudioRecord {session.audio_id}")
+    return JsonResponse({**response.data, 'upload_id': str(session.upload_id), 'sha256': assembled.sha256},
+                        status=201)
+
+
 # 카테고리별 스키마 제공 API
 class CategorySchemaView(View):
     def get(self, request, category):
@@ -2702,9 +2393,13 @@ def alignment_status_api(request, audio_id):
     """Alignment 상태 확인 API"""
     try:
         audio = get_object_or_404(AudioRecord, id=audio_id)
+        job = job_progress(audio_id, 'align')
         return JsonResponse({
             'status': audio.alignment_status,
-            'has_data': bool(audio.alignment_data)
+            'has_data': bool(audio.alignment_data),
+            'stage': job['stage'] if job else '',
+            'progress': job['progress'] if job else 0,
+            'job': job,
         })
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
@@ -2798,7 +2493,7 @@ def alignment_data_api(request, audio_id):
         
         return JsonResponse({
             'success': True,
-            'data': audio.alignment_data
+            'data': full_alignment_data(audio)  # 기존 형식 (word_segments 포함)
         })
         
     except Exception as e:
@@ -2908,36 +2603,19 @@ def api_assets_files(request, category, folder):
 
 
 def userprofile(request):
-    """사용자 프로필 페이지 - 데이터 전송 위치 및 IP 접근 위치 시각화"""
-    from django.db.models import Count
-    from django.db import connection
-    from collections import defaultdict
-    
-    # SQLite 데이터베이스 연결을 새로 고침
-    # 기존 연결을 닫고 다시 연결하여 최신 데이터를 로드
-    connection.close()
-    connection.connect()
-    
-    # === 데이터 전송 위치 통계 (category_specific_data의 region 기반) ===
-    # 지역별 업로드 횟수 집계
-    upload_locations = defaultdict(int)
-    
-    # region 필드가 있는 레코드들
-    records_with_region = AudioRecord.objects.exclude(region__isnull=True).exclude(region__exact='')
-    
-    for record in records_with_region:
-        region = record.region
-        if region:
-            upload_locations[region] += 1
-    
-    # 또는 category_specific_data에서 region 추출
-    records_with_category_data = AudioRecord.objects.exclude(category_specific_data__isnull=True)
-    
-    for record in records_with_category_data:
-        category_data = record.category_specific_data or {}
-        region = category_data.get('region') or category_data.get('place')
-        if region and region not in ['', 'null', None]:
-            upload_locations[region] += 1
+    """사용자 프로필 페이지 - 데이터 전송 위치 및 IP 접근 위치 시각화 (캐시된 스냅샷)"""
+    return render(request, 'voice_app/userprofile.html', stats_snapshot_context('userprofile', build_userprofile_stats))
+
+
+def build_userprofile_stats():
+    """사용자 프로필 페이지 통계 계산 (stats_cache 스냅샷 빌더)"""
+    # === 데이터 전송 위치 통계 (region 컬럼 → category_specific_data의 region/place 순) ===
+    # JSON 키 추출과 집계를 DB에서 한 번의 GROUP BY로 처리 (audio_upload_region_idx 표현식 인덱스)
+    upload_locations = dict(
+        AudioRecord.objects.annotate(upload_region=upload_region_expression())
+        .exclude(upload_region__isnull=True).exclude(upload_region='null')
+        .values_list('upload_region').annotate(count=Count('id')).order_by()
+    )
     
     # 지역 좌표 매핑 (한국 주요 지역)
     region_coordinates = {
@@ -3003,7 +2681,7 @@ def userprofile(request):
         'total_access': sum([item['count'] for item in ip_location_data]),
     }
     
-    return render(request, 'voice_app/userprofile.html', context)
+    return context
 
 
 @login_required
@@ -3116,22 +2794,18 @@ def identifier_audio_list(request, identifier):
         sort_by = '-created_at'
     
     # 해당 identifier를 가진 모든 오디오 레코드 조회
-    audio_list_qs = AudioRecord.objects.filter(identifier=identifier).order_by(sort_by)
-    
-    # 각 오디오에 대해 React Native 메타데이터에서 기본 정보 추출
-    for audio in audio_list_qs:
-        extract_metadata_to_fields(audio)
+    audio_list_qs = AudioRecord.objects.filter(identifier=identifier).order_by(sort_by, '-id' if sort_by.startswith('-') else 'id')
     
     # 페이지네이션
     paginator = Paginator(audio_list_qs, 20)  # 한 페이지당 20개 항목
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    # 카테고리 통계 계산
-    category_counts = {}
-    for audio in audio_list_qs:
-        category = audio.category
-        category_counts[category] = category_counts.get(category, 0) + 1
+    # 카테고리 통계 계산 (GROUP BY)
+    category_counts = dict(
+        AudioRecord.objects.filter(identifier=identifier)
+        .values_list('category').annotate(count=Count('id')).order_by()
+    )
     
     # 카테고리 이름 변환
     category_names = {
@@ -3145,7 +2819,7 @@ def identifier_audio_list(request, identifier):
     context = {
         'page_obj': page_obj,
         'audio_list': page_obj.object_list,
-        'total_count': audio_list_qs.count(),
+        'total_count': paginator.count,
         'identifier': identifier,
         'category_counts': category_counts,
         'category_names': category_names,
@@ -3155,6 +2829,70 @@ def identifier_audio_list(request, identifier):
     return render(request, 'voice_app/identifier_audio_list.html', context)
 
 
+def participant_profile_response(request, identifier, category=''):
+    """
+    ParticipantProfile 한 건으로 참가자 메타데이터 응답 생성 (없으면 None)
+    - 녹음 목록은 ?recordings_limit= / ?recordings_offset= 로 페이지 단위 조회
+    - ETag / If-None-Match가 같으면 304 응답
+    """
+    profile = ParticipantProfile.objects.filter(identifier=identifier, category=category).first()
+    if profile is None:
+        # 아직 프로필이 없는 참가자 (시그널 밖에서 추가된 레코드 등) - 레코드가 있으면 지금 만듦
+        profile = refresh_participant(identifier, category)
+        if profile is None:
+            return None
+    
+    limit = page_limit(request.query_params.get('recordings_limit'))
+    try:
+        offset = max(0, int(request.query_params.get('recordings_offset', 0)))
+    except (TypeError, ValueError):
+        offset = 0
+    
+    etag = f'"{profile.etag}-{offset}-{limit}"'
+    if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+        response = Response(status=304)
+        response['ETag'] = etag
+        return response
+    
+    # 현재 페이지 녹음만 조회 (모델 인스턴스 생성 없이 .values())
+    page_ids = profile.recording_ids[offset:offset + limit]
+    rows = {
+        row['id']: row
+        for row in AudioRecord.objects.filter(id__in=page_ids).values(
+            'id', 'audio_file', 'transcript', 'manual_transcript', 'status', 'created_at', 'snr_mean'
+        )
+    }
+    recordings = [
+        {
+            'id': row['id'],
+            'audio_file': default_storage.url(row['audio_file']) if row['audio_file'] else None,
+            'transcript': row['manual_transcript'] or row['transcript'],
+            'status': row['status'],
+            'created_at': row['created_at'].isoformat(),
+            'snr_mean': row['snr_mean'],
+        }
+        for row in (rows.get(record_id) for record_id in page_ids) if row
+    ]
+    
+    total = len(profile.recording_ids)
+    response = Response({
+        'success': True,
+        'data': {
+            **profile.metadata,
+            'recordings': recordings,
+            'recordings_page': {
+                'offset': offset,
+                'limit': limit,
+                'total': total,
+                'next_offset': offset + limit if offset + limit < total else None,
+            },
+            'statistics': profile.statistics,
+        }
+    })
+    response['ETag'] = etag
+    return response
+
+
 @api_view(['GET'])
 def api_participant_metadata(request, identifier):
     """
@@ -3162,78 +2900,13 @@ def api_participant_metadata(request, identifier):
     React Native 앱에서 /api/child/participant/{id} 형식으로 호출
     """
     try:
-        # 해당 identifier를 가진 모든 레코드 조회
-        audio_records = AudioRecord.objects.filter(identifier=identifier).order_by('-created_at')
-        
-        if not audio_records.exists():
+        response = participant_profile_response(request, identifier)
+        if response is None:
             return Response({
                 'success': False,
                 'error': f'참가자를 찾을 수 없습니다: {identifier}'
             }, status=404)
-        
-        # 가장 최근 레코드에서 메타데이터 추출
-        latest_record = audio_records.first()
-        
-        # 생년월일 조합 (birth_year, birth_month, birth_day를 사용)
-        birth_date_str = None
-        if latest_record.birth_year and latest_record.birth_month and latest_record.birth_day:
-            try:
-                year = int(latest_record.birth_year) if latest_record.birth_year else 0
-                month = int(latest_record.birth_month) if latest_record.birth_month else 0
-                day = int(latest_record.birth_day) if latest_record.birth_day else 0
-                if year > 0 and month > 0 and day > 0:
-                    birth_date_str = f"{year:04d}-{month:02d}-{day:02d}"
-            except (ValueError, TypeError):
-                birth_date_str = None
-        
-        # 기본 메타데이터
-        metadata = {
-            'identifier': identifier,
-            'name': latest_record.name,
-            'category': latest_record.category,
-            'gender': latest_record.gender,
-            'age': latest_record.age,
-            'age_in_months': latest_record.age_in_months,
-            'birth_year': latest_record.birth_year,
-            'birth_month': latest_record.birth_month,
-            'birth_day': latest_record.birth_day,
-            'birth_date': birth_date_str,
-            'total_recordings': audio_records.count(),
-            'latest_recording_date': latest_record.created_at.isoformat(),
-        }
-        
-        # 카테고리별 상세 메타데이터 (category_specific_data)
-        if latest_record.category_specific_data:
-            metadata['category_data'] = latest_record.category_specific_data
-        
-        # 모든 녹음 파일 목록 (선택적으로 포함)
-        recordings = []
-        for record in audio_records:
-            recordings.append({
-                'id': record.id,
-                'audio_file': record.audio_file.url if record.audio_file else None,
-                'transcript': record.manual_transcript or record.transcript,
-                'status': record.status,
-                'created_at': record.created_at.isoformat(),
-                'snr_mean': record.snr_mean,
-            })
-        
-        metadata['recordings'] = recordings
-        
-        # 통계 정보
-        completed_count = audio_records.filter(status='completed').count()
-        metadata['statistics'] = {
-            'total': audio_records.count(),
-            'completed': completed_count,
-            'pending': audio_records.filter(status='pending').count(),
-            'processing': audio_records.filter(status='processing').count(),
-            'failed': audio_records.filter(status='failed').count(),
-        }
-        
-        return Response({
-            'success': True,
-            'data': metadata
-        })
+        return response
         
     except Exception as e:
         return Response({
@@ -3281,81 +2954,13 @@ def api_category_participant_metadata(request, category, identifier):
                     'error': f'{category} 카테고리의 ID는 {expected_prefix}로 시작해야 합니다. 입력된 ID: {identifier}'
                 }, status=400)
         
-        # 해당 identifier를 가진 모든 레코드 조회
-        audio_records = AudioRecord.objects.filter(
-            identifier=identifier,
-            category=category
-        ).order_by('-created_at')
-        
-        if not audio_records.exists():
+        response = participant_profile_response(request, identifier, category)
+        if response is None:
             return Response({
                 'success': False,
                 'error': f'{category} 카테고리에서 참가자를 찾을 수 없습니다: {identifier}'
             }, status=404)
-        
-        # 가장 최근 레코드에서 메타데이터 추출
-        latest_record = audio_records.first()
-        
-        # 생년월일 조합 (birth_year, birth_month, birth_day를 사용)
-        birth_date_str = None
-        if latest_record.birth_year and latest_record.birth_month and latest_record.birth_day:
-            try:
-                year = int(latest_record.birth_year) if latest_record.birth_year else 0
-                month = int(latest_record.birth_month) if latest_record.birth_month else 0
-                day = int(latest_record.birth_day) if latest_record.birth_day else 0
-                if year > 0 and month > 0 and day > 0:
-                    birth_date_str = f"{year:04d}-{month:02d}-{day:02d}"
-            except (ValueError, TypeError):
-                birth_date_str = None
-        
-        # 기본 메타데이터
-        metadata = {
-            'identifier': identifier,
-            'name': latest_record.name,
-            'category': latest_record.category,
-            'gender': latest_record.gender,
-            'age': latest_record.age,
-            'age_in_months': latest_record.age_in_months,
-            'birth_year': latest_record.birth_year,
-            'birth_month': latest_record.birth_month,
-            'birth_day': latest_record.birth_day,
-            'birth_date': birth_date_str,
-            'total_recordings': audio_records.count(),
-            'latest_recording_date': latest_record.created_at.isoformat(),
-        }
-        
-        # 카테고리별 상세 메타데이터 (category_specific_data)
-        if latest_record.category_specific_data:
-            metadata['category_data'] = latest_record.category_specific_data
-        
-        # 모든 녹음 파일 목록 (선택적으로 포함)
-        recordings = []
-        for record in audio_records:
-            recordings.append({
-                'id': record.id,
-                'audio_file': record.audio_file.url if record.audio_file else None,
-                'transcript': record.manual_transcript or record.transcript,
-                'status': record.status,
-                'created_at': record.created_at.isoformat(),
-                'snr_mean': record.snr_mean,
-            })
-        
-        metadata['recordings'] = recordings
-        
-        # 통계 정보
-        completed_count = audio_records.filter(status='completed').count()
-        metadata['statistics'] = {
-            'total': audio_records.count(),
-            'completed': completed_count,
-            'pending': audio_records.filter(status='pending').count(),
-            'processing': audio_records.filter(status='processing').count(),
-            'failed': audio_records.filter(status='failed').count(),
-        }
-        
-        return Response({
-            'success': True,
-            'data': metadata
-        })
+        return response
         
     except Exception as e:
         return Response({
@@ -1,63 +1,53 @@
 # voice_app/whisper_utils.py
 
-import whisper
+import importlib.util
 import time
 import os
-import gc
-import torch
 import json
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from .model_registry import default_model_name, use_model, use_whisper_model
+from . import transcription_cache
+from .job_queue import LeaseLost
+from .long_transcribe import is_long_recording, transcribe_long_audio
+
+# whisperx는 선택적 의존성 - import 비용(torch 로드)을 피하기 위해 설치 여부만 확인
+WHISPERX_AVAILABLE = importlib.util.find_spec('whisperx') is not None
+
+WHISPERX_LANGUAGE = 'ko'
+
+
+def whisperx_model_size():
+    return getattr(settings, 'WHISPERX_MODEL_SIZE', 'base')
 
-# whisperx는 선택적 의존성
-try:
-    import whisperx
-    WHISPERX_AVAILABLE = True
-    print("[WhisperX] WhisperX module available")
-except ImportError:
-    WHISPERX_AVAILABLE = False
-    print("[WhisperX] WhisperX module not available, using basic Whisper only")
-
-# 💡 전역에서 한 번만 모델 로딩 (성능 최적화)
-try:
-    print("[Whisper] Loading model...")
-    model = whisper.load_model("base")  # GPU 메모리 절약을 위해 base 모델 사용
-    print("[Whisper] Model loaded successfully.")
-except Exception as e:
-    model = None
-    print(f"[Whisper Error] Failed to load model: {e}")
-
-# WhisperX 모델 전역 변수 (lazy loading) - whisperx 사용 시에만 필요
-whisperx_model = None
-whisperx_model_a = None
-whisperx_metadata = None
-diarize_model = None
-
-def get_whisperx_model():
-    """WhisperX 모델을 lazy loading으로 가져옴"""
-    global whisperx_model, whisperx_model_a, whisperx_metadata, diarize_model
-    
-    if not WHISPERX_AVAILABLE:
-        print("[WhisperX Error] WhisperX is not installed")
-        return None, None, None
-    
-    if whisperx_model is None:
-        try:
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            batch_size = 8 if device == "cuda" else 4  # batch size 줄임
-            compute_type = "float16" if device == "cuda" else "int8"
-            
-            print(f"[WhisperX] Loading model on {device}...")
-            # GPU 메모리 절약을 위해 base 또는 small 모델 사용
-            whisperx_model = whisperx.load_model("base", device, compute_type=compute_type)
-            
-            # alignment model (한국어 지원)
-            whisperx_model_a, whisperx_metadata = whisperx.load_align_model(language_code="ko", device=device)
-            
-            print("[WhisperX] Models loaded successfully.")
-        except Exception as e:
-            print(f"[WhisperX Error] Failed to load models: {e}")
-            return None, None, None
-    
-    return whisperx_model, whisperx_model_a, whisperx_metadata
+
+def whisperx_cache_model_name():
+    """alignment 캐시 키의 모델 이름 (모델을 바꾸면 이전 결과를 쓰지 않도록)"""
+    return f'whisperx-{whisperx_model_size()}'
+
+
+def whisperx_device_options():
+    """(device, compute_type, batch_size) - GPU가 있으면 float16, 없으면 int8"""
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda", "float16", 8
+    return "cpu", "int8", 4  # batch size 줄임
+
+
+@contextmanager
+def use_whisperx_models(device, compute_type):
+    """
+    WhisperX ASR / 정렬 모델을 모델 관리자(model_registry)에서 빌려옴
+
+    Yields:
+        tuple: (asr_model, align_model, align_metadata)
+    """
+    with use_model('whisperx-asr', whisperx_model_size(), device, compute_type) as asr_model, \
+            use_model('whisperx-align', WHISPERX_LANGUAGE, device) as (align_model, align_metadata):
+        yield asr_model, align_model, align_metadata
 
 
 def transcribe_audio(audio_path):
@@ -71,31 +61,67 @@ def transcribe_audio(audio_path):
     Returns:
         str or None: 전사 결과 또는 None
     """
-    if not model:
-        print("[Whisper Error] Model not loaded.")
-        return None
-
     if not os.path.exists(audio_path):
         print(f"[Whisper Error] File does not exist: {audio_path}")
         return None
 
+    use_vad = getattr(settings, 'WHISPER_VAD_ENABLED', True)
+    cache_options = {'temperature': 0.0, 'fp16': False, 'vad': use_vad}
+    long_recording = is_long_recording(audio_path)
+    if long_recording:
+        cache_options = {'temperature': 0.0, 'fp16': False, 'chunked': True}
+    cached = transcription_cache.get_cached(audio_path, 'transcript', default_model_name(), 'ko', cache_options)
+    if cached is not None:
+        return cached
+
+    if long_recording:
+        # 긴 녹음: memmap 30초 윈도우 + 다중 프로세스 전사 (메모리가 녹음 길이에 비례하지 않음)
+        try:
+            result = transcribe_long_audio(audio_path, default_model_name(), language="ko")
+        except Exception as e:
+            print(f"[Whisper Error] Failed to transcribe {audio_path}: {e}")
+            return None
+        if result is not None:
+            transcription_cache.store(audio_path, 'transcript', default_model_name(), result['text'], 'ko', cache_options)
+            return result['text']
+
     try:
-        start = time.time()
-        result = model.transcribe(audio_path, fp16=False, temperature=0.0, language="ko")
-        elapsed = time.time() - start
-        print(f"[Whisper] Transcription completed in {elapsed:.2f} seconds.")
+        # 모델 관리자에서 빌려 사용 (전사 중에는 메모리 예산 초과 시에도 내보내지 않음)
+        with use_whisper_model() as model:
+            start = time.time()
+            if use_vad:
+                # 음성 구간만 잘라 배치로 전사 (무음 구간은 encoder에 넣지 않음)
+                from .vad import load_audio, transcribe_speech_regions
+
+                result = transcribe_speech_regions(
+                    model, load_audio(audio_path), language="ko",
+                    batch_size=getattr(settings, 'WHISPER_VAD_BATCH_SIZE', 8),
+                )
+                elapsed = time.time() - start
+                print(
+                    f"[Whisper] Transcription completed in {elapsed:.2f} seconds "
+                    f"(speech {result['speech_seconds']:.1f}s / {result['total_seconds']:.1f}s, "
+                    f"{result['windows']} windows, cpu {result['cpu_seconds']:.2f}s)."
+                )
+            else:
+                result = model.transcribe(audio_path, fp16=False, temperature=0.0, language="ko")
+                elapsed = time.time() - start
+                print(f"[Whisper] Transcription completed in {elapsed:.2f} seconds.")
+
+        transcription_cache.store(audio_path, 'transcript', default_model_name(), result['text'], 'ko', cache_options)
         return result['text']
     except Exception as e:
         print(f"[Whisper Error] Failed to transcribe {audio_path}: {e}")
         return None
 
 
-def transcribe_and_align_whisperx(audio_path):
+def transcribe_and_align_whisperx(audio_path, progress=None):
     """
     WhisperX를 사용하여 전사 및 forced alignment 수행
     
     Args:
         audio_path (str): 오디오 파일 경로
+        progress (callable): progress(stage, percent) 단계별 진행률 콜백 (선택)
         
     Returns:
         dict: {
@@ -115,6 +141,8 @@ def transcribe_and_align_whisperx(audio_path):
             'error': 'WhisperX is not installed. Please install it with: pip install whisperx'
         }
     
+    from .alignment_service import decode_audio, transcribe_and_align as align_decoded_audio
+
     try:
         if not os.path.exists(audio_path):
             return {
@@ -125,75 +153,47 @@ def transcribe_and_align_whisperx(audio_path):
                 'error': f'File not found: {audio_path}'
             }
         
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        batch_size = 8 if device == "cuda" else 4  # batch size 줄임
-        compute_type = "float16" if device == "cuda" else "int8"
+        device, compute_type, batch_size = whisperx_device_options()
         
+        cache_options = {'compute_type': compute_type}
+        cached = transcription_cache.get_cached(
+            audio_path, 'alignment', whisperx_cache_model_name(), WHISPERX_LANGUAGE, cache_options,
+        )
+        if cached is not None:
+            return cached
+
         print(f"[WhisperX] Starting transcription and alignment for: {audio_path}")
         start_time = time.time()
         
-        # 1. 오디오 로드
-        audio = whisperx.load_audio(audio_path)
-        
-        # 2. WhisperX 모델 로드
-        whisperx_model, model_a, metadata = get_whisperx_model()
-        if whisperx_model is None:
-            return {
-                'transcription': '',
-                'segments': [],
-                'word_segments': [],
-                'success': False,
-                'error': 'Failed to load WhisperX models'
-            }
-        
-        # 3. 전사 수행 (한국어로 고정)
-        result = whisperx_model.transcribe(audio, batch_size=batch_size, language="ko")
-        
-        # 전사 텍스트 추출
-        transcription = ""
-        if 'segments' in result:
-            transcription = " ".join([seg['text'] for seg in result['segments']])
+        # 1. 오디오 디코딩 (한 번만 - ASR과 alignment가 같은 버퍼 사용)
+        if progress:
+            progress('load', 5)
+        audio = decode_audio(audio_path)
         
-        # 4. Forced alignment 수행
-        result = whisperx.align(result["segments"], model_a, metadata, audio, device, return_char_alignments=False)
-        
-        # 5. 결과 정리
-        segments = []
-        word_segments = []
-        
-        if 'segments' in result:
-            for segment in result['segments']:
-                seg_data = {
-                    'start': segment.get('start', 0),
-                    'end': segment.get('end', 0),
-                    'text': segment.get('text', ''),
-                    'id': segment.get('id', 0)
-                }
-                segments.append(seg_data)
-                
-                # 단어 레벨 alignment
-                if 'words' in segment:
-                    for word in segment['words']:
-                        word_data = {
-                            'start': word.get('start', 0),
-                            'end': word.get('end', 0),
-                            'word': word.get('word', ''),
-                            'score': word.get('score', 0.0),
-                            'segment_id': segment.get('id', 0)
-                        }
-                        word_segments.append(word_data)
+        # 2. WhisperX 모델 (모델 관리자에서 공유) → 3. 전사 (한국어로 고정) + 4. Forced alignment
+        with use_whisperx_models(device, compute_type) as (whisperx_model, model_a, metadata):
+            aligned = align_decoded_audio(
+                audio, whisperx_model, model_a, metadata, device,
+                language=WHISPERX_LANGUAGE, batch_size=batch_size, progress=progress,
+            )
         
         elapsed = time.time() - start_time
         print(f"[WhisperX] Completed in {elapsed:.2f} seconds")
         
-        return {
-            'transcription': transcription.strip(),
-            'segments': segments,
-            'word_segments': word_segments,
+        result = {
+            'transcription': aligned['transcription'],
+            'segments': aligned['segments'],
+            'word_segments': aligned['word_segments'],
             'success': True,
             'error': None
         }
+        transcription_cache.store(
+            audio_path, 'alignment', whisperx_cache_model_name(), result, WHISPERX_LANGUAGE, cache_options,
+        )
+        return result
         
+    except LeaseLost:
+        raise  # 작업이 다른 워커에게 넘어감 - 실패 결과로 바꾸지 않음
     except Exception as e:
         print(f"[WhisperX Error] Failed to process {audio_path}: {e}")
         return {
@@ -203,23 +203,23 @@ def transcribe_and_align_whisperx(audio_path):
             'success': False,
             'error': str(e)
         }
-    finally:
-        # GPU 메모리 정리
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-        gc.collect()
 
 
-def format_alignment_for_frontend(alignment_data):
+def format_alignment_for_frontend(alignment_data, words=None, start=None, end=None, columnar=False):
     """
     alignment 데이터를 프론트엔드에서 사용하기 쉬운 형태로 변환
     
     Args:
-        alignment_data (dict): WhisperX alignment 결과
+        alignment_data (dict): WhisperX alignment 결과 (AudioRecord.alignment_data)
+        words: 단어 접근자 (alignment_store.word_accessor 결과, 없으면 alignment_data의 word_segments 사용)
+        start, end (float): 이 시간 범위(초)와 겹치는 세그먼트/단어만 반환 (None이면 전체)
+        columnar (bool): 단어를 열 단위({'start': [...], 'end': [...], 'word': [...]})로 반환
         
     Returns:
         dict: 프론트엔드용 포맷된 데이터
     """
+    from .alignment_store import LegacyWords
+
     if not alignment_data or not alignment_data.get('success'):
         return {
             'segments': [],
@@ -228,20 +228,30 @@ def format_alignment_for_frontend(alignment_data):
             'duration': 0
         }
     
+    if words is None:
+        words = LegacyWords(alignment_data.get('word_segments', []))
     segments = alignment_data.get('segments', [])
-    words = alignment_data.get('word_segments', [])
     
     # 전체 길이 계산
     duration = 0
     if segments:
         duration = max([seg.get('end', 0) for seg in segments])
-    elif words:
-        duration = max([word.get('end', 0) for word in words])
+    elif len(words):
+        duration = words.duration
+    
+    if start is not None or end is not None:
+        low = float('-inf') if start is None else start
+        high = float('inf') if end is None else end
+        segments = [seg for seg in segments if seg.get('start', 0) < high and seg.get('end', 0) > low]
     
-    return {
+    data = {
         'segments': segments,
-        'words': words,
         'transcription': alignment_data.get('transcription', ''),
         'duration': duration
     }
+    if columnar:
+        data['word_columns'] = words.columns(start, end, fields=('start', 'end', 'word'))
+    else:
+        data['words'] = words.words(start, end)
+    return data
 
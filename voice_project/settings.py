@@ -67,11 +67,44 @@ WSGI_APPLICATION = "voice_project.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# 기본은 SQLite (WAL 등 PRAGMA는 voice_app/db_setup.py에서 연결마다 설정)
+# DB_ENGINE=postgres 이면 PostgreSQL 프로필 사용 (psycopg 설치 필요)
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite')
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', 60))  # 요청 간 연결 재사용 시간(초), 0이면 매 요청 새 연결
+
+if DB_ENGINE == 'postgres':
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.environ.get('POSTGRES_DB', 'voice_project'),
+            "USER": os.environ.get('POSTGRES_USER', 'voice'),
+            "PASSWORD": os.environ.get('POSTGRES_PASSWORD', ''),
+            "HOST": os.environ.get('POSTGRES_HOST', 'localhost'),
+            "PORT": os.environ.get('POSTGRES_PORT', '5432'),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+        }
     }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                "timeout": 20,  # 쓰기 잠금 대기(초) - busy_timeout과 같은 역할
+            },
+        }
+    }
+
+# SQLite 연결 PRAGMA (voice_app/db_setup.py)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20000,  # ms
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
 }
 
 
@@ -144,7 +177,48 @@ REST_FRAMEWORK = {
     ],
 }
 
+# 캐시 - 'stats'는 대시보드/프로필 통계 스냅샷 (voice_app.stats_cache, 웹 워커 간 공유를 위해 파일 기반)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'stats': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'stats',
+    },
+}
+STATS_CACHE_TTL = 300  # 변경이 없어도 이 시간(초)이 지나면 다시 집계
+STATS_CACHE_MIN_AGE = 30  # 변경이 있어도 이 시간(초) 안에 만든 스냅샷은 그대로 사용
+
+# 목록 API 페이지 크기 (voice_app.pagination)
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
+# 전사/alignment 작업 큐 (voice_app.job_queue)
+JOB_LEASE_SECONDS = 300  # 워커 임대 시간 - 처리 중에는 자동 연장, 워커가 죽으면 이 시간 뒤 다시 대기열로
+JOB_MAX_ATTEMPTS = 3  # 임대 만료로 재시도하는 최대 횟수
+BACKFILL_BATCH_SIZE = 8  # 일괄 전사(backfill) 작업을 워커가 한 번에 가져가 배치로 전사하는 수
+BACKFILL_IO_WORKERS = 4  # 일괄 전사 디코딩/log-mel 병렬 스레드 수
+
+# Whisper 모델 설정 (voice_app.model_registry)
+MODEL_MEMORY_BUDGET_MB = int(os.environ.get('MODEL_MEMORY_BUDGET_MB', 6144))  # 프로세스당 모델 메모리 한도 - 넘으면 안 쓰는 모델부터(LRU) 내보냄
+WHISPER_MODEL_NAME = 'base'  # 기본 전사 모델
+WHISPER_PRELOAD_MODELS = []  # 웹 워커 시작 시(wsgi) 미리 로드할 모델 - 비워두면 첫 전사 때 로드
+WHISPER_WORKER_PRELOAD_MODELS = [WHISPER_MODEL_NAME]  # run_transcription_workers 시작 시 미리 로드할 모델
+WHISPER_VAD_ENABLED = True  # 음성 구간(VAD)만 잘라 배치 전사 - False면 파일 전체를 model.transcribe()로 처리
+WHISPER_VAD_BATCH_SIZE = 8  # VAD 윈도우(최대 30초) 배치 크기
+LONG_TRANSCRIBE_ENABLED = True  # 긴 녹음은 30초 겹침 윈도우로 나눠 병렬 전사 (voice_app/long_transcribe.py)
+LONG_TRANSCRIBE_MIN_SECONDS = 120  # 이 길이(초) 이상인 WAV에 적용
+LONG_TRANSCRIBE_WORKERS = 0  # 전사 프로세스 수 (0이면 min(4, CPU 코어 수), 1이면 풀 없이 순서대로) - 풀은 워커 프로세스당 하나, 모델 메모리는 MODEL_MEMORY_BUDGET_MB에 포함
+
+# 전사/alignment 결과 캐시 (오디오 SHA256 + 모델 설정 기준, voice_app/transcription_cache.py)
+TRANSCRIPTION_CACHE_ENABLED = True
+TRANSCRIPTION_CACHE_MAX_ENTRIES = 50000
+TRANSCRIPTION_CACHE_MAX_BYTES = 200 * 1024 * 1024  # result JSON 합계 기준
+TRANSCRIPTION_CACHE_EVICT_INTERVAL = 300  # 용량 정리 간격(초) - 그 사이에는 제한을 잠시 넘을 수 있음
+
 # WhisperX 설정
+WHISPERX_MODEL_SIZE = 'base'  # 전사+alignment ASR 모델 (voice_app/whisper_utils.py, 캐시 키에 포함) - GPU 메모리 절약을 위해 base
 WHISPERX_CONFIG = {
     'MODEL_SIZE': 'medium',  # tiny, base, small, medium, large, large-v2, large-v3
     'DEVICE': 'auto',  # 'auto', 'cpu', 'cuda'
@@ -206,8 +280,32 @@ SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 USE_TLS = True
 
 # 파일 업로드 크기 제한 설정 (React Native 음성 파일 업로드를 위해)
-FILE_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
+# 업로드 파일은 메모리에 올리지 않고 청크 단위로 디스크에 기록 (voice_app/upload_handlers.py)
+FILE_UPLOAD_HANDLERS = [
+    'voice_app.upload_handlers.StreamingAudioUploadHandler',
+]
+FILE_UPLOAD_MAX_MEMORY_SIZE = 2621440  # 2.5MB (Django 기본값)
+DATA_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB (파일 제외 폼 필드)
+FILE_UPLOAD_TEMP_DIR = None  # None이면 시스템 임시 디렉터리 사용
+UPLOAD_STREAM_TRANSCODE = True  # 파이프 가능한 형식은 업로드 중 ffmpeg 변환 시작
+
+# ffmpeg 변환 풀 (voice_app/transcoding.py) - 프로세스당 동시 변환 수
+TRANSCODE_POOL_SIZE = int(os.environ.get('TRANSCODE_POOL_SIZE', 0)) or os.cpu_count()
+TRANSCODE_QUEUE_SIZE = TRANSCODE_POOL_SIZE * 4  # 실행 중 외에 대기 가능한 작업 수
+TRANSCODE_QUEUE_TIMEOUT = 30  # 대기열이 가득 찼을 때 기다리는 시간(초)
+TRANSCODE_TIMEOUT = 60  # ffmpeg 실행 제한 시간(초)
+
+# 오디오 레벨 분석 (voice_app/audio_analysis.py)
+# 20ms 프레임이 잡음 기준 + 6dB 이상이고 이 값(절대 하한) 이상이면 음성 프레임 (vad.py와 같은 기준)
+AUDIO_VOICED_THRESHOLD_DBFS = -55.0
+# 음성 프레임 비율이 이보다 낮고 peak도 위 하한보다 작으면 무음 파일로 거부 (경계 사례는 유지)
+AUDIO_SILENCE_MIN_VOICED_RATIO = 0.01
+
+# 재개 가능한 청크 업로드 (/api/uploads/)
+UPLOAD_SESSION_DIR = MEDIA_ROOT / 'upload_sessions'
+UPLOAD_SESSION_MAX_SIZE = 200 * 1024 * 1024  # 세션당 최대 파일 크기
+UPLOAD_CHUNK_DEFAULT_SIZE = 1024 * 1024  # 1MB
+UPLOAD_CHUNK_MAX_SIZE = 8 * 1024 * 1024  # 8MB
 
 # React Native 앱을 위한 추가 설정
 CSRF_COOKIE_SECURE = False
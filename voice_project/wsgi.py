@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "voice_project.settings")
 
 application = get_wsgi_application()
+
+# settings.WHISPER_PRELOAD_MODELS에 지정된 모델만 워커 시작 시 미리 로드 (기본: 없음)
+from voice_app.model_registry import preload_models  # noqa: E402
+
+preload_models()